@@ -0,0 +1,120 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for library items query engine
+"""
+
+import os
+
+import pytest
+
+pytest.importorskip('tpDcc.libs.python')
+
+from tpDcc.libs.qt.widgets.library import query
+
+
+class FakeItem(object):
+    def __init__(self, path, **kwargs):
+        self._path = path
+        self._data = dict(kwargs)
+
+    def path(self):
+        return self._path
+
+    def item_data(self):
+        data = {
+            'name': os.path.basename(self._path),
+            'path': self._path,
+            'folder': os.path.dirname(self._path),
+            'category': os.path.basename(os.path.dirname(self._path))
+        }
+        data.update(self._data)
+        return data
+
+
+@pytest.fixture
+def index():
+    library_index = query.LibraryIndex()
+    library_index.add_items([
+        FakeItem('/lib/anims/walk_cycle.anim', type='anim', tags=['locomotion']),
+        FakeItem('/lib/anims/run_cycle.anim', type='anim', tags=['locomotion', 'fast']),
+        FakeItem('/lib/poses/idle.pose', type='pose')
+    ])
+    return library_index
+
+
+def _names(items):
+    return sorted(os.path.basename(item.path()) for item in items)
+
+
+def test_tokenize():
+    assert query.tokenize('C:/Library/Walk_Cycle.anim') == ['c', 'library', 'walk', 'cycle', 'anim']
+
+
+def test_parse_query():
+    assert query.parse_query('') == list()
+    assert query.parse_query('walk') == [{'operator': 'and', 'filters': [('*', 'contains', 'walk')]}]
+    assert query.parse_query('Type=anim name^=walk -tags:fast -idle') == [{'operator': 'and', 'filters': [
+        ('type', 'is', 'anim'), ('name', 'startswith', 'walk'), ('tags', 'not_contains', 'fast'),
+        ('*', 'not_contains', 'idle')]}]
+    assert query.parse_query('name:walk AND type=anim OR tags:fast') == [
+        {'operator': 'and', 'filters': [('name', 'contains', 'walk'), ('type', 'is', 'anim')]},
+        {'operator': 'and', 'filters': [('tags', 'contains', 'fast')]}]
+
+
+def test_parse_query_keeps_separators_without_field():
+    assert query.parse_query(':walk -') == [{'operator': 'and', 'filters': [
+        ('*', 'contains', ':walk'), ('*', 'contains', '-')]}]
+
+
+def test_token_grams(index):
+    assert index._token_grams('walk') == {'w', 'a', 'l', 'k', 'wa', 'al', 'lk', 'wal', 'alk'}
+    assert index._grams['name']['alk'] == {'walk'}
+    assert index._grams['name']['cyc'] == {'cycle'}
+
+
+def test_tokens_containing(index):
+    assert index._tokens_containing('name', 'alk') == {'walk'}
+    assert index._tokens_containing('name', 'ycle') == {'cycle'}
+    assert index._tokens_containing('name', 'cycles') == set()
+    assert index._tokens_containing('unknown', 'walk') == set()
+
+
+def test_search_contains(index):
+    assert _names(index.search('name:alk')) == ['walk_cycle.anim']
+    assert _names(index.search('name:ycl')) == ['run_cycle.anim', 'walk_cycle.anim']
+    assert _names(index.search('name:k_cy')) == ['walk_cycle.anim']
+    assert _names(index.search('name:cycle -name:run')) == ['walk_cycle.anim']
+    assert _names(index.search('type=pose OR tags:fast')) == ['idle.pose', 'run_cycle.anim']
+    assert _names(index.search('name^=run')) == ['run_cycle.anim']
+
+
+def test_prune(index):
+    index.prune(['/lib/anims/walk_cycle.anim'], root='/lib/anims')
+    assert _names(index.items()) == ['idle.pose', 'walk_cycle.anim']
+    assert 'run' not in index._tokens['name']
+    assert 'ru' not in index._grams['name']
+    assert 'cyc' in index._grams['name']
+
+    index.prune(list())
+    assert len(index) == 0
+    assert not any(index._tokens.values())
+    assert not any(index._grams.values())
+
+
+def test_rename_path(index):
+    index.rename_path('/lib/anims', '/lib/motion')
+    assert index.item('/lib/anims/walk_cycle.anim') is None
+    assert index.item('/lib/motion/walk_cycle.anim') is not None
+    assert _names(index.search('folder=/lib/motion')) == ['run_cycle.anim', 'walk_cycle.anim']
+    assert _names(index.search('category=motion')) == ['run_cycle.anim', 'walk_cycle.anim']
+    assert index.search('category=anims') == list()
+    assert _names(index.search('tags:locomotion')) == ['run_cycle.anim', 'walk_cycle.anim']
+
+    walk_item = index.item('/lib/motion/walk_cycle.anim')
+    index.rename_path('/lib/motion/walk_cycle.anim', '/lib/motion/stroll.anim')
+    assert index.search('name:stroll') == [walk_item]
+    assert index.item('/lib/motion/stroll.anim') is walk_item
+    assert index.search('name:walk') == list()
+    assert 'walk' not in index._grams['name'].get('alk', set())
@@ -0,0 +1,84 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains tests for Qt models
+"""
+
+import pytest
+
+pytest.importorskip('Qt')
+pytest.importorskip('tpDcc.libs.python')
+
+from Qt.QtCore import QModelIndex, QItemSelectionRange
+from Qt.QtGui import QStandardItemModel, QStandardItem
+
+from tpDcc.libs.qt.widgets.models import ItemSelection
+
+
+@pytest.fixture
+def model():
+    item_model = QStandardItemModel()
+    for i in range(10):
+        item = QStandardItem('item{}'.format(i))
+        for j in range(10):
+            item.appendRow(QStandardItem('item{}_{}'.format(i, j)))
+        item_model.appendRow(item)
+    return item_model
+
+
+def _select_rows(selection, model, top, bottom, parent=None):
+    parent = parent if parent is not None else QModelIndex()
+    selection.select(model.index(top, 0, parent), model.index(bottom, 0, parent))
+
+
+def test_row_intervals_by_parent(model):
+    first_parent = model.index(1, 0)
+    second_parent = model.index(4, 0)
+    selection = ItemSelection()
+    _select_rows(selection, model, 5, 7)
+    _select_rows(selection, model, 2, 3, parent=first_parent)
+    _select_rows(selection, model, 0, 2)
+    _select_rows(selection, model, 6, 9, parent=second_parent)
+    _select_rows(selection, model, 4, 5, parent=first_parent)
+    _select_rows(selection, model, 3, 3)
+
+    groups = selection.row_intervals_by_parent()
+    assert [parent for parent, _ in groups] == [QModelIndex(), first_parent, second_parent]
+    assert [intervals for _, intervals in groups] == [[(0, 3), (5, 7)], [(2, 5)], [(6, 9)]]
+
+    assert selection.row_intervals() == [(0, 3), (5, 7)]
+    assert selection.row_intervals(first_parent) == [(2, 5)]
+    assert selection.rows() == [0, 1, 2, 3, 5, 6, 7]
+    assert selection.row_count() == 7
+    assert selection.row_count(second_parent) == 4
+
+
+def test_row_intervals_merge_overlapping_ranges(model):
+    selection = ItemSelection()
+    _select_rows(selection, model, 0, 4)
+    selection.append(QItemSelectionRange(model.index(2, 0), model.index(6, 0)))
+    assert selection.row_intervals_by_parent() == [(QModelIndex(), [(0, 6)])]
+    assert selection.row_count() == 7
+
+
+def test_contains_row(model):
+    parent = model.index(2, 0)
+    selection = ItemSelection()
+    _select_rows(selection, model, 3, 5)
+    _select_rows(selection, model, 7, 8, parent=parent)
+
+    assert selection.contains_row(3)
+    assert selection.contains_row(5)
+    assert not selection.contains_row(6)
+    assert not selection.contains_row(7)
+    assert selection.contains_row(7, parent=parent)
+    assert not selection.contains_row(4, parent=parent)
+    assert not selection.contains_row(7, parent=model.index(3, 0))
+
+
+def test_empty_selection():
+    selection = ItemSelection()
+    assert selection.row_intervals_by_parent() == list()
+    assert selection.rows() == list()
+    assert not selection.contains_row(0)
@@ -15,14 +15,16 @@ class DPIScaling(object):
     Mixin class that can be used in any QWidget to add DPI scaling functionality to it
     """
 
-    def setFixedSize(self, size):
-        return super(DPIScaling, self).setFixedSize(qtutils.dpi_scale(size))
+    def setFixedSize(self, *args):
+        if len(args) == 1:
+            return super(DPIScaling, self).setFixedSize(qtutils.size_by_dpi(args[0]))
+        return super(DPIScaling, self).setFixedSize(*qtutils.dpi_scale_values(args))
 
     def setFixedHeight(self, height):
         return super(DPIScaling, self).setFixedHeight(qtutils.dpi_scale(height))
 
     def setFixedWidth(self, width):
-        return super(DPIScaling, self).setFixedWidth(qtutils.dpiScale(width))
+        return super(DPIScaling, self).setFixedWidth(qtutils.dpi_scale(width))
 
     def setMaximumWidth(self, width):
         return super(DPIScaling, self).setMaximumWidth(qtutils.dpi_scale(width))
@@ -12,7 +12,7 @@ from Qt.QtWidgets import QApplication, QSizePolicy, QWidget, QFrame, QSpacerItem
 from Qt.QtGui import QColor, QPainter
 
 from tpDcc.managers import resources
-from tpDcc.libs.qt.core import qtutils
+from tpDcc.libs.qt.core import qtutils, resizers
 from tpDcc.libs.qt.widgets import layouts, label
 
 
@@ -23,6 +23,9 @@ class WindowDragger(QFrame, object):
 
     DEFAULT_LOGO_ICON_SIZE = 22
 
+    # Interval in milliseconds between window moves while dragging. If None, screen refresh rate is used
+    GEOMETRY_UPDATE_INTERVAL = None
+
     doubleClicked = Signal()
 
     def __init__(self, window=None, on_close=None):
@@ -37,6 +40,9 @@ class WindowDragger(QFrame, object):
         self._minimize_enabled = True
         self._maximize_enabled = True
         self._on_close = on_close
+        self._target_pos = None
+        self._move_throttler = resizers.GeometryThrottler(
+            self._update_window_position, interval=self.GEOMETRY_UPDATE_INTERVAL, parent=self)
 
         self.setObjectName('titleFrame')
 
@@ -70,9 +76,8 @@ class WindowDragger(QFrame, object):
             if self._mouse_press_pos and self._dragging_enabled:
                 moved = global_pos - self._mouse_press_pos
                 if moved.manhattanLength() > self._dragging_threshold:
-                    diff = global_pos - self._mouse_move_pos
-                    self._window.move(diff)
-                    self._mouse_move_pos = global_pos - self._window.pos()
+                    self._target_pos = global_pos - self._mouse_move_pos
+                    self._move_throttler.request()
         super(WindowDragger, self).mouseMoveEvent(event)
 
     def mouseDoubleClickEvent(self, event):
@@ -86,6 +91,8 @@ class WindowDragger(QFrame, object):
         self.doubleClicked.emit()
 
     def mouseReleaseEvent(self, event):
+        self._move_throttler.flush()
+        self._target_pos = None
         if self._mouse_press_pos is not None:
             if event.button() == Qt.LeftButton and self._dragging_enabled:
                 moved = event.globalPos() - self._mouse_press_pos
@@ -202,6 +209,15 @@ class WindowDragger(QFrame, object):
 
         self._dragging_enabled = flag
 
+    def set_geometry_update_interval(self, interval):
+        """
+        Sets the minimum time between two window moves while dragging
+        :param interval: int or None, interval in milliseconds. If None, screen refresh rate is used. If 0,
+            window is moved on every mouse move
+        """
+
+        self._move_throttler.set_interval(interval)
+
     def set_minimize_enabled(self, flag):
         """
         Sets whether dragger shows minimize button or not
@@ -321,6 +337,16 @@ class WindowDragger(QFrame, object):
 
         return logo_button
 
+    def _update_window_position(self):
+        """
+        Internal function that moves the window to the latest dragged position
+        """
+
+        if self._target_pos is None or not self._window:
+            return
+
+        self._window.move(self._target_pos)
+
     def _on_toggle_frameless_mode(self, action):
         """
         Internal callback function that is called when switch frameless mode button is pressed by user
@@ -7,12 +7,14 @@ Module that contains extended functionality for QMenus
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Signal
+from collections import defaultdict
+
+from Qt.QtCore import Qt, Signal, QObject, QEvent
 from Qt.QtWidgets import QLineEdit, QMenu, QActionGroup, QAction, QWidgetAction
 
 from tpDcc.libs.python import python
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import qtutils, formatters
+from tpDcc.libs.qt.core import formatters
 
 
 @theme.mixin
@@ -237,6 +239,9 @@ class Menu(QMenu, object):
 
 
 class SearchableTaggedAction(QAction, object):
+
+    tagsChanged = Signal()
+
     def __init__(self, label, icon=None, parent=None):
         super(SearchableTaggedAction, self).__init__(label, parent)
 
@@ -252,6 +257,7 @@ class SearchableTaggedAction(QAction, object):
     @tags.setter
     def tags(self, new_tags):
         self._tags = new_tags
+        self.tagsChanged.emit()
 
     def has_tag(self, tag):
         """
@@ -280,6 +286,146 @@ class SearchableTaggedAction(QAction, object):
 
         return False
 
+    def search_words(self):
+        """
+        Returns all lower case words this action can be found by (words of its tags and its text)
+        :return: set(str)
+        """
+
+        words = set(self.text().lower().split())
+        for tag in self._tags:
+            words.update(tag.lower().split())
+
+        return words
+
+
+class SearchIndex(QObject, object):
+    """
+    Index that maps every substring of the words of searchable tagged actions to the actions that contain them
+    The index is built once and rebuilt only when actions or tags change, so search queries are answered with set
+    operations instead of walking all menu actions on each keystroke
+    """
+
+    def __init__(self, menu):
+        super(SearchIndex, self).__init__(menu)
+
+        self._menu = menu
+        self._dirty = True
+        self._locked = False
+        self._index = defaultdict(set)
+        self._actions = set()
+        self._sub_menus = list()
+        self._watched = set()
+        self._connected = set()
+
+        menu.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.ActionAdded, QEvent.ActionRemoved, QEvent.ActionChanged):
+            self.invalidate()
+
+        return False
+
+    def invalidate(self):
+        """
+        Marks the index as dirty so it is rebuilt next time it is queried
+        """
+
+        if self._locked:
+            return
+
+        self._dirty = True
+
+    def set_locked(self, flag):
+        """
+        Sets whether or not index invalidation is ignored. Used while the visibility of indexed actions is updated,
+        because that also triggers action change events
+        :param flag: bool
+        """
+
+        self._locked = flag
+
+    def actions(self):
+        """
+        Returns all indexed actions
+        :return: set(SearchableTaggedAction)
+        """
+
+        self._update()
+        return self._actions
+
+    def sub_menus(self):
+        """
+        Returns all indexed sub menus sorted from deepest to shallowest
+        :return: list(QMenu)
+        """
+
+        self._update()
+        return self._sub_menus
+
+    def match(self, search_str):
+        """
+        Returns all actions with a tag or text word that contains the given string
+        :param search_str: str
+        :return: set(SearchableTaggedAction)
+        """
+
+        self._update()
+        return self._index.get(search_str.lower(), set())
+
+    def match_any(self, search_strings):
+        """
+        Returns all actions with a tag or text word that contains any of the given strings
+        :param search_strings: list(str)
+        :return: set(SearchableTaggedAction)
+        """
+
+        found = set()
+        for search_str in search_strings:
+            found |= self.match(search_str)
+
+        return found
+
+    def _update(self):
+        """
+        Internal function that rebuilds the index if necessary
+        """
+
+        if not self._dirty:
+            return
+
+        self._index.clear()
+        self._actions = set()
+        self._sub_menus = list()
+        self._index_menu(self._menu)
+        self._dirty = False
+
+    def _index_menu(self, menu):
+        """
+        Internal function that indexes all actions of the given menu and its sub menus
+        :param menu: QMenu
+        """
+
+        for action in menu.actions():
+            sub_menu = action.menu()
+            if sub_menu:
+                self._index_menu(sub_menu)
+                self._sub_menus.append(sub_menu)
+                if sub_menu not in self._watched:
+                    sub_menu.installEventFilter(self)
+                    self._watched.add(sub_menu)
+                continue
+            elif action.isSeparator() or not isinstance(action, SearchableTaggedAction):
+                continue
+            if action not in self._connected:
+                action.tagsChanged.connect(self.invalidate)
+                self._connected.add(action)
+            self._actions.add(action)
+            for word in action.search_words():
+                for i in range(len(word)):
+                    for j in range(i + 1, len(word) + 1):
+                        self._index[word[i:j]].add(action)
+
 
 class SearchableMenu(Menu, object):
     """
@@ -291,6 +437,7 @@ class SearchableMenu(Menu, object):
 
         self._search_action = None
         self._search_edit = None
+        self._search_index = SearchIndex(self)
 
         self.setObjectName(kwargs.get('objectName'))
         self.setTitle(kwargs.get('title'))
@@ -303,6 +450,7 @@ class SearchableMenu(Menu, object):
 
         super(SearchableMenu, self).clear()
 
+        self._search_index.invalidate()
         self._init_search_edit()
 
     def set_search_visible(self, flag):
@@ -324,48 +472,34 @@ class SearchableMenu(Menu, object):
     def update_search(self, search_string=None):
         """
         Search all actions for a string tag
+        Matching actions are retrieved from the search index and only actions whose visibility changes are updated
         :param str search_string: tag names separated by spaces (for example, "elem1 elem2"
         :return: str
         """
 
-        def _recursive_search(menu, search_str):
-            for action in menu.actions():
-                sub_menu = action.menu()
-                if sub_menu:
-                    _recursive_search(sub_menu, search_str)
-                    continue
-                elif action.isSeparator():
-                    continue
-                elif isinstance(action, SearchableTaggedAction) and not action.has_tag(search_str):
-                    action.setVisible(False)
-
-            menu_vis = any(action.isVisible() for action in menu.actions())
-            menu.menuAction().setVisible(menu_vis)
-
-        def _recursive_search_by_tags(menu, tags):
-            for action in menu.actions():
-                sub_menu = action.menu()
-                if sub_menu:
-                    _recursive_search_by_tags(sub_menu, tags)
-                    continue
-                elif action.isSeparator():
-                    continue
-                elif isinstance(action, SearchableTaggedAction):
-                    action.setVisible(action.has_any_tag(tags))
-
-            menu_vis = any(action.isVisible() for action in menu.actions())
-            menu.menuAction().setVisible(menu_vis)
-
         search_str = search_string or ''
         split = search_str.split()
+        actions = self._search_index.actions()
         if not split:
-            qtutils.recursively_set_menu_actions_visibility(menu=self, state=True)
-            return
+            visible_actions = actions
         elif len(split) > 1:
-            _recursive_search_by_tags(menu=self, tags=split)
-            return
-
-        _recursive_search(menu=self, search_str=split[0])
+            visible_actions = self._search_index.match_any(split)
+        else:
+            visible_actions = self._search_index.match(split[0])
+
+        self._search_index.set_locked(True)
+        try:
+            for action in actions:
+                visible = action in visible_actions
+                if action.isVisible() != visible:
+                    action.setVisible(visible)
+            for sub_menu in self._search_index.sub_menus():
+                menu_action = sub_menu.menuAction()
+                menu_vis = not split or any(action.isVisible() for action in sub_menu.actions())
+                if menu_action.isVisible() != menu_vis:
+                    menu_action.setVisible(menu_vis)
+        finally:
+            self._search_index.set_locked(False)
 
     def _init_search_edit(self):
         """
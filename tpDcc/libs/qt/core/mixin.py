@@ -9,7 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 from functools import partial
 
-from Qt.QtCore import Qt, QPoint, QEvent, QPropertyAnimation, QEasingCurve
+from Qt.QtCore import Qt, QPoint, QEvent, QTimer, QPropertyAnimation, QEasingCurve
 from Qt.QtWidgets import QGraphicsDropShadowEffect, QGraphicsOpacityEffect
 
 from tpDcc.libs.qt.core import qtutils
@@ -205,24 +205,41 @@ def stacked_opacity_animation_mixin(cls):
 
 
 class FieldMixin(object):
+    """
+    Mixin that allows to register fields and bind them to widget properties
+    Fields read by computed fields getters are recorded, so when a field changes only the computed fields that depend
+    on it are recomputed. Recomputation is deferred to the next event loop iteration, so multiple field changes done in
+    a row collapse into a single update of each dependent computed field.
+    """
 
     computed_dict = None
     properties_dict = None
 
+    _field_dependents = None
+    _field_reads_stack = None
+    _field_pending_changes = None
+    _field_fresh_values = None
+    _field_flush_scheduled = False
+
     def register_field(self, name, getter=None, setter=None, required=False):
         if self.computed_dict is None:
             self.computed_dict = dict()
         if self.properties_dict is None:
             self.properties_dict = dict()
+        if self._field_dependents is None:
+            self._field_dependents = dict()
+            self._field_reads_stack = list()
+            self._field_pending_changes = set()
         if callable(getter):
-            value = getter()
             self.computed_dict[name] = {
-                'value': value,
+                'value': None,
                 'getter': getter,
                 'setter': setter,
                 'required': required,
-                'bind': []
+                'bind': [],
+                'dependencies': set()
             }
+            self.computed_dict[name]['value'] = self._compute_field(name)
         else:
             self.properties_dict[name] = {
                 'value': getter,
@@ -253,10 +270,14 @@ class FieldMixin(object):
         return self.properties_dict.keys() + self.computed_dict.keys()
 
     def field(self, name):
+        if self._field_reads_stack:
+            self._field_reads_stack[-1].add(name)
         if name in self.properties_dict:
             return self.properties_dict[name]['value']
         elif name in self.computed_dict:
-            new_value = self.computed_dict[name]['getter']()
+            if self._field_fresh_values is not None and name in self._field_fresh_values:
+                return self._field_fresh_values[name]
+            new_value = self._compute_field(name)
             self.computed_dict[name]['value'] = new_value
             return new_value
         else:
@@ -269,6 +290,105 @@ class FieldMixin(object):
         elif name in self.computed_dict:
             self.computed_dict[name]['value'] = value
 
+    def field_dependencies(self, name):
+        """
+        Returns the names of the fields read by the getter of the given computed field the last time it was computed
+        :param name: str
+        :return: set(str)
+        """
+
+        if not self.computed_dict or name not in self.computed_dict:
+            return set()
+
+        return set(self.computed_dict[name]['dependencies'])
+
+    def field_dependents(self, name):
+        """
+        Returns the names of all computed fields that depend, directly or indirectly, on the given field, sorted in
+        the order they need to be recomputed
+        :param name: str
+        :return: list(str)
+        """
+
+        return self._sorted_dependents([name])
+
+    def flush_field_changes(self):
+        """
+        Recomputes, and updates the widgets bound to, all computed fields that depend on fields changed since last
+        flush. Called automatically in the next event loop iteration after a field changes
+        """
+
+        self._field_flush_scheduled = False
+        changed_fields = self._field_pending_changes
+        if not changed_fields:
+            return
+        self._field_pending_changes = set()
+
+        self._field_fresh_values = dict()
+        try:
+            for computed_name in self._sorted_dependents(changed_fields):
+                self._field_fresh_values[computed_name] = self.field(computed_name)
+                for data_dict in self.computed_dict[computed_name]['bind']:
+                    self._data_update_ui(data_dict)
+        finally:
+            self._field_fresh_values = None
+
+    def _compute_field(self, name):
+        """
+        Internal function that runs the getter of the given computed field recording the fields it reads
+        :param name: str
+        :return: object
+        """
+
+        computed_field = self.computed_dict[name]
+        self._field_reads_stack.append(set())
+        try:
+            value = computed_field['getter']()
+        finally:
+            field_reads = self._field_reads_stack.pop()
+
+        field_reads.discard(name)
+        for dependency in computed_field['dependencies'] - field_reads:
+            self._field_dependents.get(dependency, set()).discard(name)
+        for dependency in field_reads:
+            self._field_dependents.setdefault(dependency, set()).add(name)
+        computed_field['dependencies'] = field_reads
+
+        return value
+
+    def _sorted_dependents(self, field_names):
+        """
+        Internal function that returns all computed fields affected by the given fields in topological order
+        :param field_names: list(str)
+        :return: list(str)
+        """
+
+        if not self._field_dependents:
+            return list()
+
+        dependents = self._field_dependents
+        visited = set(field_names)
+        sorted_fields = list()
+
+        # Iterative post-order depth first traversal, reversed, gives a valid topological order
+        for field_name in field_names:
+            stack = [(field_name, iter(dependents.get(field_name, ())))]
+            while stack:
+                current, children = stack[-1]
+                for child in children:
+                    if child not in visited:
+                        visited.add(child)
+                        stack.append((child, iter(dependents.get(child, ()))))
+                        break
+                else:
+                    stack.pop()
+                    if current in self.computed_dict and current not in field_names:
+                        sorted_fields.append(current)
+
+        sorted_fields.reverse()
+
+        return sorted_fields
+
     def _data_update_ui(self, data_dict):
         data_name = data_dict.get('data_name')
         widget = data_dict['widget']
@@ -276,12 +396,13 @@ class FieldMixin(object):
         widget_property = data_dict['widget_property']
         callback = data_dict['callback']
         value = None
+        field_value = self.field(data_name)
         if index is None:
-            value = self.field(data_name)
-        elif isinstance(self.field(data_name), dict):
-            value = self.field(data_name).get(index)
-        elif isinstance(self.field(data_name), list):
-            value = self.field(data_name)[index] if index < len(self.field(data_name)) else None
+            value = field_value
+        elif isinstance(field_value, dict):
+            value = field_value.get(index)
+        elif isinstance(field_value, list):
+            value = field_value[index] if index < len(field_value) else None
         if widget.metaObject().indexOfProperty(widget_property) > -1 \
                 or widget_property in map(str, widget.dynamicPropertyNames()):
             widget.setProperty(widget_property, value)
@@ -291,15 +412,16 @@ class FieldMixin(object):
             callback()
 
     def _slot_property_changed(self, property_name):
-        for key, setting_dict in self.properties_dict.items():
-            if key == property_name:
-                for data_dict in setting_dict['bind']:
-                    self._data_update_ui(data_dict)
-
-        for key, setting_dict in self.computed_dict.items():
+        setting_dict = self.properties_dict.get(property_name)
+        if setting_dict:
             for data_dict in setting_dict['bind']:
                 self._data_update_ui(data_dict)
 
+        self._field_pending_changes.add(property_name)
+        if not self._field_flush_scheduled:
+            self._field_flush_scheduled = True
+            QTimer.singleShot(0, self.flush_field_changes)
+
     def _slot_changed_from_user(self, data_dict, ui_value):
         self._ui_update_data(data_dict, ui_value)
 
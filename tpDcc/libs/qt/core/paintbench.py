@@ -0,0 +1,449 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains headless harness to measure and regression test widgets paint cost
+>>> python -m tpDcc.libs.qt.core.paintbench --iterations 100 --sizes 64x64,256x256 --dprs 1,2
+>>> python -m tpDcc.libs.qt.core.paintbench --golden-dir ./golden --update-golden
+>>> python -m tpDcc.libs.qt.core.paintbench --focus-widgets 5000
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from collections import OrderedDict
+
+from Qt.QtCore import Qt, QSize
+from Qt.QtGui import QImage
+from Qt.QtWidgets import QApplication
+
+from tpDcc.libs.qt.core import profiling
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+DEFAULT_ITERATIONS = 50
+DEFAULT_SIZES = ((64, 64), (256, 256))
+DEFAULT_DPRS = (1.0, 2.0)
+DEFAULT_FOCUS_WIDGETS = 5000
+DEFAULT_FOCUS_DEPTH = 8
+
+_timer = getattr(time, 'perf_counter', time.time)
+
+
+def get_application(platform='offscreen'):
+    """
+    Returns current QApplication. If it does not exist, a new one is created using the given QPA platform
+    :param platform: str, QPA platform used if no QT_QPA_PLATFORM environment variable is defined
+    :return: QApplication
+    """
+
+    app = QApplication.instance()
+    if app:
+        return app
+
+    os.environ.setdefault('QT_QPA_PLATFORM', platform)
+
+    return QApplication(sys.argv[:1])
+
+
+def render_widget(widget, size, dpr=1.0):
+    """
+    Renders given widget into a new image
+    :param widget: QWidget
+    :param size: QSize
+    :param dpr: float, device pixel ratio of the image
+    :return: QImage
+    """
+
+    image = QImage(int(round(size.width() * dpr)), int(round(size.height() * dpr)), QImage.Format_ARGB32_Premultiplied)
+    if hasattr(image, 'setDevicePixelRatio'):
+        image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    widget.render(image)
+
+    return image
+
+
+def default_widget_factories():
+    """
+    Returns the factories of the widgets measured by default
+    :return: OrderedDict(str, callable)
+    """
+
+    def _accordion():
+        from Qt.QtWidgets import QLabel
+        from tpDcc.libs.qt.widgets import accordion
+        widget = accordion.AccordionWidget()
+        widget.add_item('Accordion Item', QLabel('Content'))
+        return widget
+
+    def _expandables():
+        from Qt.QtWidgets import QLabel
+        from tpDcc.libs.qt.widgets import expandables
+        widget = expandables.ExpanderWidget()
+        widget.addItem('Expander Item', QLabel('Content'))
+        return widget
+
+    def _option_group():
+        from tpDcc.libs.qt.widgets.options import optionlist
+        return optionlist.OptionGroup('Options')
+
+    def _color_wheel():
+        from tpDcc.libs.qt.widgets import color
+        return color.ColorWheel()
+
+    def _color_2d_slider():
+        from tpDcc.libs.qt.widgets import color
+        return color.Color2DSlider()
+
+    def _hue_slider():
+        from tpDcc.libs.qt.widgets import color
+        return color.HueSlider()
+
+    def _loading():
+        from tpDcc.libs.qt.widgets import loading
+        return loading.CircleLoading()
+
+    def _switch():
+        from tpDcc.libs.qt.widgets import switch
+        return switch.SwitchWidget()
+
+    def _badge():
+        from Qt.QtWidgets import QPushButton
+        from tpDcc.libs.qt.widgets import badge
+        return badge.Badge.create_count(count=12, widget=QPushButton('Inbox'))
+
+    def _graphicsview():
+        from tpDcc.libs.qt.widgets import graphicsview
+        return graphicsview.GridView()
+
+    return OrderedDict([
+        ('accordion', _accordion),
+        ('expandables', _expandables),
+        ('option_group', _option_group),
+        ('color_wheel', _color_wheel),
+        ('color_2d_slider', _color_2d_slider),
+        ('hue_slider', _hue_slider),
+        ('loading', _loading),
+        ('switch', _switch),
+        ('badge', _badge),
+        ('graphicsview', _graphicsview)
+    ])
+
+
+class PaintBenchmark(object):
+    """
+    Class that renders widgets offscreen several times at different sizes and device pixel ratios and reports the
+    time spent painting them. Rendered images can be stored as golden images and compared in later runs.
+    Widgets painting animations (such as loading widgets) may not match their golden images between runs
+    """
+
+    def __init__(self, factories=None, iterations=DEFAULT_ITERATIONS, sizes=None, dprs=None):
+        super(PaintBenchmark, self).__init__()
+
+        self._factories = OrderedDict(factories if factories is not None else default_widget_factories())
+        self._iterations = max(1, int(iterations))
+        self._sizes = [size if isinstance(size, QSize) else QSize(*size) for size in (sizes or DEFAULT_SIZES)]
+        self._dprs = [float(dpr) for dpr in (dprs or DEFAULT_DPRS)]
+
+    def add_widget(self, name, factory):
+        """
+        Registers a new widget to measure
+        :param name: str
+        :param factory: callable, function that returns a new instance of the widget
+        """
+
+        self._factories[name] = factory
+
+    def names(self):
+        """
+        Returns the names of all registered widgets
+        :return: list(str)
+        """
+
+        return list(self._factories.keys())
+
+    def run(self, names=None, golden_dir=None, update_golden=False):
+        """
+        Measures the paint time of the given widgets
+        :param names: list(str) or None, names of the widgets to measure. If not given, all widgets are measured
+        :param golden_dir: str or None, folder where golden images are stored
+        :param update_golden: bool, whether to overwrite golden images with the current renders instead of
+            comparing them
+        :return: list(dict)
+        """
+
+        app = get_application()
+        if golden_dir and not os.path.isdir(golden_dir):
+            os.makedirs(golden_dir)
+
+        results = list()
+        for name in (names or self.names()):
+            factory = self._factories.get(name)
+            if not factory:
+                LOGGER.warning('No widget registered with name "{}"'.format(name))
+                continue
+            try:
+                widget = factory()
+            except Exception as exc:
+                LOGGER.warning('Impossible to create widget "{}": {}'.format(name, exc))
+                results.append({'name': name, 'error': str(exc)})
+                continue
+
+            widget.setAttribute(Qt.WA_DontShowOnScreen, True)
+            widget.show()
+            try:
+                for size in self._sizes:
+                    widget.resize(size)
+                    app.processEvents()
+                    for dpr in self._dprs:
+                        results.append(self._measure(name, widget, size, dpr, golden_dir, update_golden))
+            finally:
+                widget.close()
+                widget.deleteLater()
+                app.processEvents()
+
+        return results
+
+    def _measure(self, name, widget, size, dpr, golden_dir=None, update_golden=False):
+        """
+        Internal function that measures the paint time of the given widget with the given size and pixel ratio
+        :param name: str
+        :param widget: QWidget
+        :param size: QSize
+        :param dpr: float
+        :param golden_dir: str or None
+        :param update_golden: bool
+        :return: dict
+        """
+
+        # First render is not measured, it polishes the widget and fills caches
+        image = render_widget(widget, size, dpr)
+
+        timings = list()
+        with profiling.span('paint.{}'.format(name), category='paint', width=size.width(), height=size.height()):
+            for _ in range(self._iterations):
+                start = _timer()
+                render_widget(widget, size, dpr)
+                timings.append(_timer() - start)
+
+        result = OrderedDict([
+            ('name', name),
+            ('width', size.width()),
+            ('height', size.height()),
+            ('dpr', dpr),
+            ('iterations', self._iterations),
+            ('mean_ms', sum(timings) / len(timings) * 1000.0),
+            ('min_ms', min(timings) * 1000.0),
+            ('max_ms', max(timings) * 1000.0)
+        ])
+        if golden_dir:
+            result['golden'] = self._check_golden(
+                image, os.path.join(golden_dir, '{}_{}x{}@{:g}x.png'.format(name, size.width(), size.height(), dpr)),
+                update_golden)
+
+        return result
+
+    def _check_golden(self, image, golden_path, update_golden=False):
+        """
+        Internal function that compares given image with its golden image
+        :param image: QImage
+        :param golden_path: str
+        :param update_golden: bool
+        :return: str, 'created', 'updated', 'match', 'mismatch' or 'missing'
+        """
+
+        exists = os.path.isfile(golden_path)
+        if update_golden:
+            image.save(golden_path, 'PNG')
+            return 'updated' if exists else 'created'
+        if not exists:
+            return 'missing'
+
+        golden = QImage(golden_path).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        current = image.convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        if golden.size() != current.size():
+            return 'mismatch'
+        if hasattr(current, 'setDevicePixelRatio'):
+            golden.setDevicePixelRatio(current.devicePixelRatio())
+
+        return 'match' if golden == current else 'mismatch'
+
+
+class FocusBenchmark(object):
+    """
+    Class that measures the cost of resolving which window owns the widget that gets the focus, as window focus
+    tracking does on each application focus change. Walking the children of the window (findChildren) is compared
+    against walking the parents of the focused widget (qtutils.is_descendant_of)
+    """
+
+    def __init__(self, widget_count=DEFAULT_FOCUS_WIDGETS, depth=DEFAULT_FOCUS_DEPTH, iterations=DEFAULT_ITERATIONS):
+        super(FocusBenchmark, self).__init__()
+
+        self._widget_count = max(1, int(widget_count))
+        self._depth = max(1, int(depth))
+        self._iterations = max(1, int(iterations))
+
+    def strategies(self):
+        """
+        Returns the focus ownership strategies that are measured
+        :return: OrderedDict(str, callable)
+        """
+
+        from Qt.QtWidgets import QWidget
+        from tpDcc.libs.qt.core import qtutils
+
+        return OrderedDict([
+            ('find_children', lambda widget, window: widget is window or widget in window.findChildren(QWidget)),
+            ('parent_walk', qtutils.is_descendant_of)
+        ])
+
+    def create_window(self):
+        """
+        Creates a window with the benchmark number of widgets, distributed along nested containers
+        :return: tuple(QWidget, list(QWidget)), window and its widgets
+        """
+
+        from Qt.QtWidgets import QWidget
+
+        window = QWidget()
+        containers = [window]
+        for _ in range(self._depth - 1):
+            containers.append(QWidget(containers[-1]))
+        widgets = [QWidget(containers[i % len(containers)]) for i in range(self._widget_count)]
+
+        return window, widgets
+
+    def run(self):
+        """
+        Measures the time spent resolving focus ownership with each strategy. Half of the focus changes happen in
+        the measured window and the other half in another window
+        :return: list(dict)
+        """
+
+        app = get_application()
+        window, widgets = self.create_window()
+        other_window, other_widgets = FocusBenchmark(
+            widget_count=1, depth=self._depth, iterations=self._iterations).create_window()
+        step = max(1, len(widgets) // self._iterations)
+        targets = list()
+        for i in range(self._iterations):
+            targets.append(widgets[(i * step) % len(widgets)] if i % 2 == 0 else other_widgets[0])
+
+        results = list()
+        try:
+            for name, owns_widget in self.strategies().items():
+                timings = list()
+                with profiling.span('focus.{}'.format(name), category='focus', widgets=self._widget_count):
+                    for target in targets:
+                        start = _timer()
+                        owns_widget(target, window)
+                        timings.append(_timer() - start)
+                results.append(OrderedDict([
+                    ('name', name),
+                    ('widgets', self._widget_count),
+                    ('iterations', self._iterations),
+                    ('mean_ms', sum(timings) / len(timings) * 1000.0),
+                    ('min_ms', min(timings) * 1000.0),
+                    ('max_ms', max(timings) * 1000.0)
+                ]))
+        finally:
+            for widget in (window, other_window):
+                widget.deleteLater()
+            app.processEvents()
+
+        return results
+
+
+def format_results(results):
+    """
+    Returns a table with the given benchmark results
+    :param results: list(dict)
+    :return: str
+    """
+
+    lines = ['{:<20} {:>11} {:>5} {:>10} {:>10} {:>10} {:>9}'.format(
+        'Widget', 'Size', 'DPR', 'Mean ms', 'Min ms', 'Max ms', 'Golden')]
+    for result in results:
+        if 'error' in result:
+            lines.append('{:<20} ERROR: {}'.format(result['name'], result['error']))
+            continue
+        lines.append('{:<20} {:>11} {:>5g} {:>10.3f} {:>10.3f} {:>10.3f} {:>9}'.format(
+            result['name'], '{}x{}'.format(result['width'], result['height']), result['dpr'], result['mean_ms'],
+            result['min_ms'], result['max_ms'], result.get('golden', '-')))
+
+    return '\n'.join(lines)
+
+
+def format_focus_results(results):
+    """
+    Returns a table with the given focus benchmark results
+    :param results: list(dict)
+    :return: str
+    """
+
+    lines = ['{:<20} {:>9} {:>10} {:>10} {:>10}'.format('Strategy', 'Widgets', 'Mean ms', 'Min ms', 'Max ms')]
+    for result in results:
+        lines.append('{:<20} {:>9} {:>10.4f} {:>10.4f} {:>10.4f}'.format(
+            result['name'], result['widgets'], result['mean_ms'], result['min_ms'], result['max_ms']))
+
+    return '\n'.join(lines)
+
+
+def main(args=None):
+    """
+    Runs the paint benchmark from the command line
+    :param args: list(str) or None
+    :return: int, exit code. 1 if any golden image does not match or any widget fails
+    """
+
+    parser = argparse.ArgumentParser(description='Measures the paint time of tpDcc widgets')
+    parser.add_argument('--widgets', default='', help='Comma separated names of the widgets to measure')
+    parser.add_argument('--iterations', type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument(
+        '--sizes', default=','.join('{}x{}'.format(*size) for size in DEFAULT_SIZES),
+        help='Comma separated sizes, for example: 64x64,256x256')
+    parser.add_argument('--dprs', default=','.join('{:g}'.format(dpr) for dpr in DEFAULT_DPRS))
+    parser.add_argument('--golden-dir', default=None, help='Folder where golden images are stored')
+    parser.add_argument('--update-golden', action='store_true', help='Overwrite golden images')
+    parser.add_argument('--json', default=None, help='Path of the JSON file where results are stored')
+    parser.add_argument(
+        '--focus-widgets', type=int, default=0,
+        help='Measures window focus ownership resolution in a window with the given number of widgets instead of '
+             'measuring paint times')
+    options = parser.parse_args(args)
+
+    if options.focus_widgets > 0:
+        get_application()
+        results = FocusBenchmark(widget_count=options.focus_widgets, iterations=options.iterations).run()
+        print(format_focus_results(results))
+        if options.json:
+            with open(options.json, 'w') as fh:
+                json.dump(results, fh, indent=2)
+        return 0
+
+    sizes = [tuple(int(value) for value in size.lower().split('x')) for size in options.sizes.split(',') if size]
+    dprs = [float(dpr) for dpr in options.dprs.split(',') if dpr]
+    names = [name for name in options.widgets.split(',') if name] or None
+
+    get_application()
+    benchmark = PaintBenchmark(iterations=options.iterations, sizes=sizes, dprs=dprs)
+    results = benchmark.run(names=names, golden_dir=options.golden_dir, update_golden=options.update_golden)
+    print(format_results(results))
+
+    if options.json:
+        with open(options.json, 'w') as fh:
+            json.dump(results, fh, indent=2)
+
+    failed = any('error' in result or result.get('golden') in ('mismatch', 'missing') for result in results)
+
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
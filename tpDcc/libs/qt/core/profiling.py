@@ -0,0 +1,417 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains opt-in instrumentation utilities to measure where time goes inside Qt tools
+Instrumentation is disabled by default. It can be enabled by code (profiling.enable()) or by setting the
+TPDCC_PROFILE environment variable before the module is imported.
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import json
+import time
+import logging
+import threading
+import contextlib
+from functools import wraps
+from collections import deque, OrderedDict
+
+from Qt.QtCore import QObject, QEvent
+from Qt.QtWidgets import QApplication
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+# Use the most precise clock available
+_clock = getattr(time, 'perf_counter', time.time)
+
+_ENABLED = os.environ.get('TPDCC_PROFILE', '').strip().lower() in ('1', 'true', 'yes', 'on')
+_RECORDER = None
+
+
+class ProfileRecorder(object):
+    """
+    Low overhead in-memory recorder of timed spans
+    Spans are stored as plain tuples in a bounded deque, so the oldest ones are discarded once the recorder is full
+    """
+
+    def __init__(self, max_events=200000):
+        super(ProfileRecorder, self).__init__()
+
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._origin = _clock()
+
+    def __len__(self):
+        return len(self._events)
+
+    def record(self, name, category, start, duration, args=None):
+        """
+        Stores a new timed span
+        :param name: str, name of the span
+        :param category: str, category of the span (slot, paint, load, etc)
+        :param start: float, start time of the span in seconds (as returned by the profiling clock)
+        :param duration: float, duration of the span in seconds
+        :param args: dict or None, optional extra data to store within the span
+        """
+
+        event = (name, category, start, duration, threading.current_thread().ident, args)
+        with self._lock:
+            self._events.append(event)
+
+    def clear(self):
+        """
+        Removes all recorded spans
+        """
+
+        with self._lock:
+            self._events.clear()
+            self._origin = _clock()
+
+    def events(self, category=None):
+        """
+        Returns a list with all recorded spans
+        :param category: str or None, if given, only spans of the given category will be returned
+        :return: list(tuple(str, str, float, float, int, dict))
+        """
+
+        with self._lock:
+            events = list(self._events)
+
+        if category is None:
+            return events
+
+        return [event for event in events if event[1] == category]
+
+    def stats(self, category=None):
+        """
+        Returns aggregated timings of the recorded spans grouped by name and sorted by total time
+        :param category: str or None, if given, only spans of the given category will be taken into account
+        :return: OrderedDict, {name: {'count': int, 'total': float, 'mean': float, 'max': float}}
+        """
+
+        stats = dict()
+        for name, _, _, duration, _, _ in self.events(category=category):
+            entry = stats.get(name)
+            if entry is None:
+                stats[name] = {'count': 1, 'total': duration, 'max': duration}
+                continue
+            entry['count'] += 1
+            entry['total'] += duration
+            entry['max'] = max(entry['max'], duration)
+
+        for entry in stats.values():
+            entry['mean'] = entry['total'] / entry['count']
+
+        return OrderedDict(sorted(stats.items(), key=lambda item: item[1]['total'], reverse=True))
+
+    def to_chrome_trace(self):
+        """
+        Returns recorded spans as a Chrome trace dictionary (chrome://tracing, Perfetto or speedscope compatible)
+        :return: dict
+        """
+
+        pid = os.getpid()
+        trace_events = list()
+        for name, category, start, duration, thread_id, args in self.events():
+            trace_event = {
+                'name': name,
+                'cat': category,
+                'ph': 'X',
+                'ts': (start - self._origin) * 1000000.0,
+                'dur': duration * 1000000.0,
+                'pid': pid,
+                'tid': thread_id or 0
+            }
+            if args:
+                trace_event['args'] = args
+            trace_events.append(trace_event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path):
+        """
+        Writes recorded spans into a Chrome trace JSON file
+        :param file_path: str, path where trace file should be stored
+        :return: str, path of the written file
+        """
+
+        file_dir = os.path.dirname(file_path)
+        if file_dir and not os.path.isdir(file_dir):
+            os.makedirs(file_dir)
+
+        with open(file_path, 'w') as fh:
+            json.dump(self.to_chrome_trace(), fh)
+
+        LOGGER.info('Profiling trace with {} events exported to: "{}"'.format(len(self), file_path))
+
+        return file_path
+
+
+class EventProfiler(QObject, object):
+    """
+    Measures paint and event dispatch time per widget class
+    Profiler can be installed in any existing application (such as the ones of DCC hosts) or only in a window:
+    an application event filter redelivers each measured event through QApplication.notify and times that delivery.
+    Redelivered events go through the rest of application event filters, the event filters installed in the
+    receivers and their event handlers, so the behaviour of the application is not modified. Profiler event filter
+    is installed the last one, so it runs first; application event filters installed after it will see measured
+    events twice. If the application is a ProfiledApplication, events are timed from its notify function instead.
+    """
+
+    DEFAULT_EVENT_TYPES = {
+        QEvent.Paint: 'paint',
+        QEvent.UpdateRequest: 'paint',
+        QEvent.Resize: 'event',
+        QEvent.Move: 'event',
+        QEvent.LayoutRequest: 'event',
+        QEvent.Show: 'event',
+        QEvent.Polish: 'event',
+        QEvent.StyleChange: 'event'
+    }
+
+    def __init__(self, event_types=None, parent=None):
+        super(EventProfiler, self).__init__(parent)
+
+        self._event_types = dict(event_types or self.DEFAULT_EVENT_TYPES)
+        self._target = None
+        self._app = None
+        self._scope = None
+        self._delivering = list()
+
+    def install(self, target=None, use_notify=True):
+        """
+        Installs the profiler
+        :param target: QApplication, QWidget or None, application or window whose widgets events are measured. If not
+            given, the profiler is installed in the application instance
+        :param use_notify: bool, whether events are timed from notify function when the application is a
+            ProfiledApplication
+        :return: bool, True if the profiler was installed; False otherwise
+        """
+
+        app = QApplication.instance()
+        target = target or app
+        if not app or not target:
+            LOGGER.warning('Impossible to install event profiler because no QApplication instance is available!')
+            return False
+
+        self.uninstall()
+        self._target = target
+        if use_notify and target is app and isinstance(app, ProfiledApplication):
+            app.set_event_profiler(self)
+            return True
+
+        self._app = app
+        self._scope = None if target is app else target
+        app.installEventFilter(self)
+
+        return True
+
+    def uninstall(self):
+        """
+        Removes the profiler from the application or window it was installed in
+        """
+
+        if self._target is None:
+            return
+        if self._app is not None:
+            self._app.removeEventFilter(self)
+        elif isinstance(self._target, ProfiledApplication) and self._target.event_profiler() is self:
+            self._target.set_event_profiler(None)
+        self._target = None
+        self._app = None
+        self._scope = None
+
+    def eventFilter(self, obj, event):
+        """
+        Overrides base QObject eventFilter function
+        Measured events are delivered again through QApplication.notify and that delivery is timed
+        :param obj: QObject
+        :param event: QEvent
+        :return: bool
+        """
+
+        if not _ENABLED or self._app is None or event.type() not in self._event_types or not obj.isWidgetType():
+            return False
+
+        # Event is being delivered by this profiler, let Qt continue with its regular delivery
+        event_type = event.type()
+        if self._delivering and self._delivering[-1][0] is obj and self._delivering[-1][1] == event_type:
+            return False
+
+        if self._scope is not None and obj is not self._scope and not self._scope.isAncestorOf(obj):
+            return False
+
+        self._delivering.append((obj, event_type))
+        try:
+            self.measure(obj, event, self._app.notify)
+        finally:
+            self._delivering.pop()
+
+        return True
+
+    def measure(self, receiver, event, dispatch):
+        """
+        Dispatches given event using the given function and records the time spent handling it
+        :param receiver: QObject
+        :param event: QEvent
+        :param dispatch: callable, function that delivers the event to the receiver
+        :return: bool, value returned by the dispatch function
+        """
+
+        category = self._event_types.get(event.type())
+        if not _ENABLED or category is None or not receiver.isWidgetType():
+            return dispatch(receiver, event)
+
+        event_type = int(event.type())
+        start = _clock()
+        try:
+            return dispatch(receiver, event)
+        finally:
+            recorder().record(
+                receiver.__class__.__name__, category, start, _clock() - start, args={'event': event_type})
+
+
+class ProfiledApplication(QApplication, object):
+    """
+    QApplication that times event dispatching through an EventProfiler
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(ProfiledApplication, self).__init__(*args, **kwargs)
+
+        self._event_profiler = None
+
+    def notify(self, receiver, event):
+        """
+        Overrides base QApplication notify function
+        :param receiver: QObject
+        :param event: QEvent
+        :return: bool
+        """
+
+        event_profiler = self._event_profiler
+        if event_profiler is None or not _ENABLED:
+            return super(ProfiledApplication, self).notify(receiver, event)
+
+        return event_profiler.measure(receiver, event, super(ProfiledApplication, self).notify)
+
+    def event_profiler(self):
+        """
+        Returns the profiler used to time events
+        :return: EventProfiler or None
+        """
+
+        return self._event_profiler
+
+    def set_event_profiler(self, event_profiler):
+        """
+        Sets the profiler used to time events
+        :param event_profiler: EventProfiler or None
+        """
+
+        self._event_profiler = event_profiler
+
+
+def is_enabled():
+    """
+    Returns whether or not instrumentation is enabled
+    :return: bool
+    """
+
+    return _ENABLED
+
+
+def enable(new_recorder=None):
+    """
+    Enables instrumentation
+    :param new_recorder: ProfileRecorder or None, optional recorder to store spans into
+    :return: ProfileRecorder
+    """
+
+    global _ENABLED
+    global _RECORDER
+
+    if new_recorder is not None:
+        _RECORDER = new_recorder
+    _ENABLED = True
+
+    return recorder()
+
+
+def disable():
+    """
+    Disables instrumentation. Already recorded spans are kept
+    """
+
+    global _ENABLED
+    _ENABLED = False
+
+
+def recorder():
+    """
+    Returns current global recorder, creating it if necessary
+    :return: ProfileRecorder
+    """
+
+    global _RECORDER
+    if _RECORDER is None:
+        _RECORDER = ProfileRecorder()
+
+    return _RECORDER
+
+
+@contextlib.contextmanager
+def span(name, category='span', **kwargs):
+    """
+    Context manager that times the wrapped block of code as a named span
+    :param name: str, name of the span
+    :param category: str, category of the span
+    :param kwargs: dict, extra data stored within the span
+    """
+
+    if not _ENABLED:
+        yield
+        return
+
+    start = _clock()
+    try:
+        yield
+    finally:
+        recorder().record(name, category, start, _clock() - start, args=kwargs or None)
+
+
+def profile(name=None, category='function'):
+    """
+    Decorator that times each call of the decorated function as a named span
+    When instrumentation is disabled the only overhead is a global flag check
+    :param name: str or None, name of the span. If not given, function qualified name is used
+    :param category: str, category of the span (slot, paint, load, etc)
+    """
+
+    def decorator(fn):
+        span_name = name or getattr(fn, '__qualname__', fn.__name__)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _ENABLED:
+                return fn(*args, **kwargs)
+            start = _clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                recorder().record(span_name, category, start, _clock() - start)
+
+        return wrapper
+
+    return decorator
+
+
+def profile_slot(name=None):
+    """
+    Decorator that times each call of the decorated Qt slot
+    :param name: str or None, name of the span. If not given, function qualified name is used
+    """
+
+    return profile(name=name, category='slot')
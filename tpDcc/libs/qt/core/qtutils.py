@@ -12,6 +12,7 @@ import sys
 import logging
 import inspect
 import contextlib
+from collections import OrderedDict
 
 from tpDcc.libs.python import python
 
@@ -21,7 +22,7 @@ QT_ERROR_MESSAGE = 'Qt.py is not available and Qt related functionality will not
 
 QT_AVAILABLE = True
 try:
-    from Qt.QtCore import Qt, Signal, QObject, QPoint, QSize
+    from Qt.QtCore import Qt, Signal, QObject, QPoint, QSize, QTimer
     from Qt.QtWidgets import QApplication, QLayout, QVBoxLayout, QHBoxLayout, QWidget, QFrame, QLabel, QPushButton
     from Qt.QtWidgets import QSizePolicy, QMessageBox, QInputDialog, QFileDialog, QMenu, QMenuBar
     from Qt.QtGui import QFontDatabase, QPixmap, QIcon, QColor
@@ -63,6 +64,13 @@ FLOAT_RANGE_MIN = 0.1 + (-mathlib.MAX_INT - 1.0)
 FLOAT_RANGE_MAX = mathlib.MAX_INT + 0.1
 INT_RANGE_MIN = -mathlib.MAX_INT
 INT_RANGE_MAX = mathlib.MAX_INT
+ROUNDED_MASKS_CACHE_SIZE = 16
+ROUNDED_MASK_DELAY = 150
+
+_ROUNDED_MASKS_CACHE = OrderedDict()
+_ROUNDED_MASKS_TIMERS = dict()
+_DPI_MULTIPLIER = None
+_DPI_WATCHED_PROPERTY = '_tpDccDpiWatched'
 
 # ==============================================================================
 
@@ -424,6 +432,77 @@ def get_horizontal_separator():
 
 
 def get_rounded_mask(width, height, radius_tl=10, radius_tr=10, radius_bl=10, radius_br=10):
+    """
+    Returns a region with the given size and rounded corners
+    Regions are cached by size and radii, so repeated calls (for example while resizing a window) do not rebuild them
+    :param width: int
+    :param height: int
+    :param radius_tl: int, top left corner radius
+    :param radius_tr: int, top right corner radius
+    :param radius_bl: int, bottom left corner radius
+    :param radius_br: int, bottom right corner radius
+    :return: QRegion
+    """
+
+    key = (width, height, radius_tl, radius_tr, radius_bl, radius_br)
+    region = _ROUNDED_MASKS_CACHE.pop(key, None)
+    if region is None:
+        region = _create_rounded_mask(width, height, radius_tl, radius_tr, radius_bl, radius_br)
+        if len(_ROUNDED_MASKS_CACHE) >= ROUNDED_MASKS_CACHE_SIZE:
+            _ROUNDED_MASKS_CACHE.popitem(last=False)
+    _ROUNDED_MASKS_CACHE[key] = region
+
+    return QtGui.QRegion(region)
+
+
+def set_rounded_mask(widget, radius_tl=10, radius_tr=10, radius_bl=10, radius_br=10, defer=False):
+    """
+    Applies a rounded mask with the current size of the given widget
+    :param widget: QWidget
+    :param radius_tl: int, top left corner radius
+    :param radius_tr: int, top right corner radius
+    :param radius_bl: int, bottom left corner radius
+    :param radius_br: int, bottom right corner radius
+    :param defer: bool, If True, the mask is removed and applied again once the widget is not resized for
+        ROUNDED_MASK_DELAY milliseconds. Useful to call it from resizeEvent of frameless windows, so interactive
+        resizing does not update the mask in each step
+    """
+
+    def _apply_mask():
+        widget.setMask(get_rounded_mask(widget.width(), widget.height(), radius_tl, radius_tr, radius_bl, radius_br))
+
+    if not defer:
+        _apply_mask()
+        return
+
+    widget_id = id(widget)
+    timer = _ROUNDED_MASKS_TIMERS.get(widget_id)
+    if timer is None:
+        timer = _ROUNDED_MASKS_TIMERS[widget_id] = QTimer(widget)
+        timer.setSingleShot(True)
+        timer.setInterval(ROUNDED_MASK_DELAY)
+        timer.destroyed.connect(lambda *args: _ROUNDED_MASKS_TIMERS.pop(widget_id, None))
+    else:
+        timer.timeout.disconnect()
+    timer.timeout.connect(_apply_mask)
+
+    if not widget.mask().isEmpty():
+        widget.clearMask()
+    timer.start()
+
+
+def _create_rounded_mask(width, height, radius_tl=10, radius_tr=10, radius_bl=10, radius_br=10):
+    """
+    Internal function that creates a region with the given size and rounded corners
+    :param width: int
+    :param height: int
+    :param radius_tl: int
+    :param radius_tr: int
+    :param radius_bl: int
+    :param radius_br: int
+    :return: QRegion
+    """
+
     region = QtGui.QRegion(0, 0, width, height, QtGui.QRegion.Rectangle)
 
     # top left
@@ -443,7 +522,7 @@ def get_rounded_mask(width, height, radius_tl=10, radius_tr=10, radius_bl=10, ra
     region = region.subtracted(corner.subtracted(round))
 
     # bottom left
-    round = QtGui.QRegion(0, height - 2 * radius_bl, 2 * radius_bl, 2 * radius_br, QtGui.QRegion.Ellipse)
+    round = QtGui.QRegion(0, height - 2 * radius_bl, 2 * radius_bl, 2 * radius_bl, QtGui.QRegion.Ellipse)
     corner = QtGui.QRegion(0, height - radius_bl, radius_bl, radius_bl, QtGui.QRegion.Rectangle)
     region = region.subtracted(corner.subtracted(round))
 
@@ -1002,10 +1081,30 @@ def recursively_set_menu_actions_visibility(menu, state):
 def dpi_multiplier():
     """
     Returns current application DPI multiplier
+    Multiplier is cached until the DPI of any screen changes or screens are added/removed
     :return: float
     """
 
-    return max(1, float(QApplication.desktop().logicalDpiY()) / float(consts.DEFAULT_DPI))
+    global _DPI_MULTIPLIER
+
+    if _DPI_MULTIPLIER is not None:
+        return _DPI_MULTIPLIER
+
+    multiplier = max(1, float(QApplication.desktop().logicalDpiY()) / float(consts.DEFAULT_DPI))
+    if _watch_dpi_changes():
+        _DPI_MULTIPLIER = multiplier
+
+    return multiplier
+
+
+def clear_dpi_cache(*args):
+    """
+    Clears cached DPI multiplier, so it is queried again next time it is requested
+    """
+
+    global _DPI_MULTIPLIER
+
+    _DPI_MULTIPLIER = None
 
 
 def dpi_scale(value):
@@ -1020,6 +1119,18 @@ def dpi_scale(value):
     return value * mult
 
 
+def dpi_scale_values(values):
+    """
+    Resizes all given values based on current DPI. DPI multiplier is only retrieved once
+    :param list(int) values: values default 2k size in pixels
+    :return: sizes in pixels now DPI monitor is (4k 2k etc)
+    :rtype: tuple(int)
+    """
+
+    mult = dpi_multiplier()
+    return tuple(value * mult for value in values)
+
+
 def dpi_scale_divide(value):
     """
     Invers resize by value based on current DPI, for values that may get resized twice
@@ -1045,10 +1156,9 @@ def margins_dpi_scale(left, top, right, bottom):
     """
 
     if isinstance(left, tuple):
-        margins = left
-        return dpi_scale(margins[0]), dpi_scale(margins[1]), dpi_scale(margins[2]), dpi_scale(margins[3])
+        return dpi_scale_values(left[:4])
 
-    return dpi_scale(left), dpi_scale(top), dpi_scale(right), dpi_scale(bottom)
+    return dpi_scale_values((left, top, right, bottom))
 
 
 def point_by_dpi(point):
@@ -1059,7 +1169,20 @@ def point_by_dpi(point):
     :rtype: QPoint
     """
 
-    return QPoint(dpi_scale(point.x()), dpi_scale(point.y()))
+    mult = dpi_multiplier()
+    return QPoint(point.x() * mult, point.y() * mult)
+
+
+def points_by_dpi(points):
+    """
+    Scales all given QPoints by the current DPI scaling
+    :param list(QPoint) points: points to scale by current DPI scaling
+    :return: Newly scaled QPoints
+    :rtype: list(QPoint)
+    """
+
+    mult = dpi_multiplier()
+    return [QPoint(point.x() * mult, point.y() * mult) for point in points]
 
 
 def size_by_dpi(size):
@@ -1070,7 +1193,66 @@ def size_by_dpi(size):
     :rtype: QSize
     """
 
-    return QSize(dpi_scale(size.width()), dpi_scale(size.height()))
+    mult = dpi_multiplier()
+    return QSize(size.width() * mult, size.height() * mult)
+
+
+def sizes_by_dpi(sizes):
+    """
+    Scales all given QSizes by the current DPI scaling
+    :param list(QSize) sizes: sizes to scale by current DPI scaling
+    :return: Newly scaled QSizes
+    :rtype: list(QSize)
+    """
+
+    mult = dpi_multiplier()
+    return [QSize(size.width() * mult, size.height() * mult) for size in sizes]
+
+
+def _watch_dpi_changes():
+    """
+    Internal function that connects screen notifications to clear cached DPI multiplier
+    :return: True if DPI changes can be tracked; False otherwise
+    :rtype: bool
+    """
+
+    app = QApplication.instance()
+    if not app or not hasattr(app, 'screens'):
+        return False
+
+    # Watched objects are flagged with a dynamic property, so the flag lives and dies with the Qt object
+    if not app.property(_DPI_WATCHED_PROPERTY):
+        app.setProperty(_DPI_WATCHED_PROPERTY, True)
+        app.screenAdded.connect(_on_screen_added)
+        app.screenRemoved.connect(clear_dpi_cache)
+        app.primaryScreenChanged.connect(clear_dpi_cache)
+    for screen in app.screens():
+        _watch_screen_dpi(screen)
+
+    return True
+
+
+def _watch_screen_dpi(screen):
+    """
+    Internal function that clears cached DPI multiplier when the DPI of the given screen changes
+    :param QScreen screen: screen to watch
+    """
+
+    if screen.property(_DPI_WATCHED_PROPERTY):
+        return
+
+    screen.setProperty(_DPI_WATCHED_PROPERTY, True)
+    screen.logicalDotsPerInchChanged.connect(clear_dpi_cache)
+
+
+def _on_screen_added(screen):
+    """
+    Internal callback function that is called when a new screen is connected
+    :param QScreen screen: added screen
+    """
+
+    _watch_screen_dpi(screen)
+    clear_dpi_cache()
 
 
 def get_window_menu_bar(window=None):
@@ -1240,23 +1422,45 @@ def iterate_parents(widget):
         yield parent
 
 
-def iterate_children(widget, skip=None, qobj_class=None):
+def is_descendant_of(obj, ancestor):
+    """
+    Returns whether or not given object is the given ancestor or one of its descendants
+    Only the parent chain of the object is walked, so this is O(depth) instead of O(number of children). Contrary to
+    QWidget.isAncestorOf, window boundaries (dialogs, popups, etc) are crossed.
+    :param obj: QObject
+    :param ancestor: QObject
+    :return: bool
+    """
+
+    while obj is not None:
+        if obj == ancestor:
+            return True
+        obj = obj.parent()
+
+    return False
+
+
+def iterate_children(widget, skip=None, qobj_class=None, prune_class=False):
     """
     Yields all descendant widgets depth first of the given widget
+    Hierarchy is walked iteratively, so deep hierarchies do not reach Python recursion limit
     :param widget: QWWidget, widget to iterate through
     :param skip: str, if the widget has this property, children will be skip
-    :param qobj_class:
+    :param qobj_class: type, if given, children of direct children that are not instances of this class will be skip
+    :param prune_class: bool, if True, qobj_class is checked in all descendants instead of only in direct children,
+        so subtrees whose root is not an instance of qobj_class are not walked
     :return:
     """
 
-    for child in widget.children():
+    stack = [(child, True) for child in reversed(widget.children())]
+    while stack:
+        child, is_direct_child = stack.pop()
         yield child
         if skip is not None and child.property(skip) is not None:
             continue
-        if qobj_class is not None and not isinstance(child, qobj_class):
+        if qobj_class is not None and (is_direct_child or prune_class) and not isinstance(child, qobj_class):
             continue
-        for grand_cihld in iterate_children(widget=child, skip=skip):
-            yield grand_cihld
+        stack.extend((grand_child, False) for grand_child in reversed(child.children()))
 
 
 def is_stackable(widget):
@@ -7,8 +7,8 @@ Module that contains implementation for dialog/window resizers
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Signal, QSize
-from Qt.QtWidgets import QApplication, QWidget
+from Qt.QtCore import Qt, Signal, QObject, QEvent, QSize, QTimer
+from Qt.QtWidgets import QApplication, QWidget, QLabel
 from Qt.QtGui import QCursor, QColor, QPainter
 
 from tpDcc.libs.qt.core import qtutils
@@ -28,14 +28,222 @@ class Resizers:
     All = Vertical | Horizontal | Corners
 
 
+DEFAULT_REFRESH_RATE = 60.0
+
+
+def frame_interval(widget=None):
+    """
+    Returns the time between two frames of the screen the given widget is displayed in
+    :param widget: QWidget or None, if not given primary screen is used
+    :return: int, interval in milliseconds
+    """
+
+    screen = None
+    window_handle = widget.window().windowHandle() if widget is not None else None
+    if window_handle is not None:
+        screen = window_handle.screen()
+    if screen is None and hasattr(QApplication, 'primaryScreen'):
+        screen = QApplication.primaryScreen()
+    refresh_rate = screen.refreshRate() if screen is not None else 0
+    if not refresh_rate or refresh_rate <= 0:
+        refresh_rate = DEFAULT_REFRESH_RATE
+
+    return max(1, int(1000.0 / refresh_rate))
+
+
+class GeometryThrottler(QObject, object):
+    """
+    Class that coalesces geometry update requests so the given callback is called at most once per interval.
+    First request is applied immediately and the ones received during the interval are merged into a single call
+    """
+
+    def __init__(self, callback, interval=None, parent=None):
+        super(GeometryThrottler, self).__init__(parent)
+
+        self._callback = callback
+        self._interval = interval
+        self._pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def interval(self):
+        """
+        Returns the throttle interval in milliseconds
+        :return: int
+        """
+
+        if self._interval is not None:
+            return self._interval
+
+        return frame_interval(self.parent() if isinstance(self.parent(), QWidget) else None)
+
+    def set_interval(self, interval):
+        """
+        Sets the throttle interval
+        :param interval: int or None, interval in milliseconds. If None, screen refresh rate is used. If 0,
+            updates are not throttled
+        """
+
+        self._interval = interval
+
+    def is_pending(self):
+        """
+        Returns whether there is an update waiting to be applied
+        :return: bool
+        """
+
+        return self._pending
+
+    def request(self):
+        """
+        Requests a new update
+        """
+
+        self._pending = True
+        if self._timer.isActive():
+            return
+
+        interval = self.interval()
+        self._apply()
+        if interval > 0:
+            self._timer.start(interval)
+
+    def flush(self):
+        """
+        Applies the pending update, if any, immediately
+        """
+
+        self._timer.stop()
+        if self._pending:
+            self._apply()
+
+    def cancel(self):
+        """
+        Discards the pending update
+        """
+
+        self._timer.stop()
+        self._pending = False
+
+    def _apply(self):
+        """
+        Internal function that calls the update callback
+        """
+
+        self._pending = False
+        self._callback()
+
+    def _on_timeout(self):
+        """
+        Internal callback function that is called when throttle interval ends
+        """
+
+        if self._pending:
+            self._apply()
+            self._timer.start(self.interval())
+
+
+class ContentSnapshot(QObject, object):
+    """
+    Class that covers the contents of a window with a snapshot of them while the window is being resized.
+    If possible, the content widget is hidden so its layout is not recalculated during the resize
+    """
+
+    def __init__(self, window, parent=None):
+        super(ContentSnapshot, self).__init__(parent)
+
+        self._window = window
+        self._overlay = None
+        self._hidden_widget = None
+
+    def is_active(self):
+        """
+        Returns whether the window contents are suspended
+        :return: bool
+        """
+
+        return self._overlay is not None
+
+    def suspend(self, keep_widgets=None):
+        """
+        Covers window contents with a snapshot
+        :param keep_widgets: list(QWidget) or None, widgets that must remain visible (such as the ones that are
+            handling the gesture)
+        """
+
+        if self.is_active() or not self._window or not self._window.isVisible():
+            return
+
+        pixmap = self._window.grab() if hasattr(self._window, 'grab') else QWidget.grab(self._window)
+        self._overlay = QLabel(self._window)
+        self._overlay.setAttribute(Qt.WA_TransparentForMouseEvents)
+        self._overlay.setAutoFillBackground(True)
+        self._overlay.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self._overlay.setPixmap(pixmap)
+        self._overlay.setGeometry(self._window.rect())
+        self._overlay.show()
+        self._overlay.raise_()
+
+        content = self._window.centralWidget() if hasattr(self._window, 'centralWidget') else None
+        keep_widgets = keep_widgets or list()
+        if content is not None and content.isVisible() and not any(
+                content is widget or content.isAncestorOf(widget) for widget in keep_widgets):
+            self._hidden_widget = content
+            content.hide()
+
+        self._window.installEventFilter(self)
+
+    def restore(self):
+        """
+        Removes window contents snapshot
+        """
+
+        if not self.is_active():
+            return
+
+        self._window.removeEventFilter(self)
+        if self._hidden_widget is not None:
+            self._hidden_widget.show()
+            self._hidden_widget = None
+        self._overlay.hide()
+        self._overlay.deleteLater()
+        self._overlay = None
+
+    def eventFilter(self, obj, event):
+        """
+        Overrides base QObject eventFilter function
+        Keeps the snapshot covering the whole window
+        :param obj: QObject
+        :param event: QEvent
+        :return: bool
+        """
+
+        if obj is self._window and event.type() == QEvent.Resize and self._overlay is not None:
+            self._overlay.setGeometry(self._window.rect())
+
+        return False
+
+
 class WindowResizer(QWidget, object):
     windowResized = Signal()
     windowResizedStarted = Signal()
     windowResizedFinished = Signal()
 
+    # Interval in milliseconds between geometry updates. If None, screen refresh rate is used
+    GEOMETRY_UPDATE_INTERVAL = None
+
+    # Whether window contents are replaced by a snapshot while resizing
+    SUSPEND_CONTENT = False
+
     def __init__(self, parent):
         super(WindowResizer, self).__init__(parent)
 
+        self._geometry_throttler = GeometryThrottler(
+            self._update_window_geometry, interval=self.GEOMETRY_UPDATE_INTERVAL, parent=self)
+        self._suspend_content = self.SUSPEND_CONTENT
+        self._content_snapshot = None
+
         self._init()
 
         self._direction = 0
@@ -46,6 +254,7 @@ class WindowResizer(QWidget, object):
         self.setAttribute(Qt.WA_TranslucentBackground)
 
         self.windowResizedStarted.connect(self._on_window_resize_started)
+        self.windowResizedFinished.connect(self._on_window_resize_finished)
 
     def paintEvent(self, event):
         """
@@ -113,6 +322,23 @@ class WindowResizer(QWidget, object):
         """
         self._direction = direction
 
+    def set_geometry_update_interval(self, interval):
+        """
+        Sets the minimum time between two window geometry updates while resizing
+        :param interval: int or None, interval in milliseconds. If None, screen refresh rate is used. If 0,
+            geometry is updated on every mouse move
+        """
+
+        self._geometry_throttler.set_interval(interval)
+
+    def set_suspend_content(self, flag):
+        """
+        Sets whether window contents are replaced by a snapshot while resizing, avoiding relayouts
+        :param flag: bool
+        """
+
+        self._suspend_content = flag
+
     def _init(self):
         """
         Internal function that initializes reisizer
@@ -121,11 +347,14 @@ class WindowResizer(QWidget, object):
 
         self.windowResized.connect(self._on_window_resized)
 
-    def _on_window_resized(self):
+    def _update_window_geometry(self):
         """
         Internal function that resizes the frame based on the mouse position and the current direction
         """
 
+        if self._widget_mouse_pos is None:
+            return
+
         pos = QCursor.pos()
         new_geo = self.window().frameGeometry()
 
@@ -154,9 +383,31 @@ class WindowResizer(QWidget, object):
 
         self.window().setGeometry(x, y, w, h)
 
+    def _on_window_resized(self):
+        """
+        Internal callback function that is called when the mouse moves while resizing
+        Geometry updates are coalesced so the window is resized at most once per frame
+        """
+
+        self._geometry_throttler.request()
+
     def _on_window_resize_started(self):
         self._widget_mouse_pos = self.mapFromGlobal(QCursor.pos())
         self._widget_geometry = self.window().frameGeometry()
+        if self._suspend_content:
+            self._content_snapshot = ContentSnapshot(self.window(), parent=self)
+            self._content_snapshot.suspend(keep_widgets=[self])
+
+    def _on_window_resize_finished(self):
+        """
+        Internal callback function that is called when resize operation ends
+        """
+
+        self._geometry_throttler.flush()
+        if self._content_snapshot is not None:
+            self._content_snapshot.restore()
+            self._content_snapshot.deleteLater()
+            self._content_snapshot = None
 
 
 class CornerResizer(WindowResizer, object):
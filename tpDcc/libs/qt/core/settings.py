@@ -9,8 +9,10 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import sys
+import contextlib
+from collections import OrderedDict
 
-from Qt.QtCore import QSettings, QPoint, QSize
+from Qt.QtCore import QSettings, QPoint, QSize, QTimer, QCoreApplication
 from Qt.QtWidgets import QMainWindow, QDockWidget, QComboBox, QCheckBox, QToolButton, QSpinBox, QLineEdit
 from Qt.QtWidgets import QDoubleSpinBox
 
@@ -18,11 +20,29 @@ from tpDcc.libs.python import settings
 
 
 class QtSettings(QSettings, object):
+    """
+    INI based settings that support batched and write-behind storage
+    While a batch is open, or when write-behind mode is enabled, values stored through set/setw and the recent files
+    helpers are kept in an in-memory overlay. Repeated writes of the same key are coalesced and the overlay is written
+    to disk once, when the batch is closed, when the write-behind timer times out or when sync() is called.
+    Reads done through get/getw and the recent files helpers are served from the overlay first.
+    """
+
+    WRITE_BEHIND_INTERVAL = 500
+
     def __init__(self, filename, window=None, max_files=10,):
         super(QtSettings, self).__init__(filename, QSettings.IniFormat, window)
 
         self._max_files = max_files
         self._window = window
+        self._pending = OrderedDict()
+        self._pending_recent_files = None
+        self._batch_depth = 0
+        self._write_behind = False
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.WRITE_BEHIND_INTERVAL)
+        self._flush_timer.timeout.connect(self.flush)
         if self._window:
             self._groups = [window.objectName(), 'RecentFiles']
         self._initialize()
@@ -43,7 +63,7 @@ class QtSettings(QSettings, object):
         if setting_group:
             setting_name = '{}/{}'.format(setting_group, setting_name)
 
-        val = self.value(setting_name)
+        val = self._read(setting_name)
         if not val:
             return default_value
 
@@ -57,14 +77,9 @@ class QtSettings(QSettings, object):
         :return:
         """
 
-        if self._window:
-            val = self.value(self._window.objectName().upper() + '/' + setting_name)
-            if not val:
-                return default_value
-        else:
-            val = self.value(setting_name)
-            if not val:
-                return default_value
+        val = self._read(self._window_key(setting_name))
+        if not val:
+            return default_value
 
         return val
 
@@ -76,7 +91,7 @@ class QtSettings(QSettings, object):
         :param setting_value: variant, setting value we want to store
         """
 
-        self.setValue(setting_name, setting_value)
+        self._write(setting_name, setting_value)
 
     def setw(self, setting_name, setting_value):
         """
@@ -85,10 +100,127 @@ class QtSettings(QSettings, object):
         :param setting_value: variant, setting value we want to store
         """
 
-        if self._window:
-            self.setValue(self._window.objectName().upper() + '/' + setting_name, setting_value)
+        self._write(self._window_key(setting_name), setting_value)
+
+    def is_write_behind(self):
+        """
+        Returns whether or not write-behind mode is enabled
+        :return: bool
+        """
+
+        return self._write_behind
+
+    def set_write_behind(self, flag, interval=None):
+        """
+        Enables or disables write-behind mode. When enabled, writes are kept in memory and flushed to disk after the
+        given interval without new writes
+        :param flag: bool
+        :param interval: int or None, time in milliseconds to wait before flushing pending writes into disk
+        """
+
+        if interval is not None:
+            self._flush_timer.setInterval(interval)
+        if flag == self._write_behind:
+            return
+
+        self._write_behind = flag
+        app = QCoreApplication.instance()
+        if flag:
+            if app:
+                app.aboutToQuit.connect(self.flush)
         else:
-            self.setValue(setting_name, setting_value)
+            if app:
+                try:
+                    app.aboutToQuit.disconnect(self.flush)
+                except (RuntimeError, TypeError):
+                    pass
+            self.flush()
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that coalesces all writes done within it and stores them into disk once on exit
+        Batches can be nested, pending writes are flushed when the outermost batch is closed
+
+        >>> with settings.batch():
+        >>>     settings.setw('geometry', window.saveGeometry())
+        >>>     settings.setw('windowState', window.saveState())
+        """
+
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                if self._write_behind:
+                    self._flush_timer.start()
+                else:
+                    self.flush()
+
+    def has_pending_writes(self):
+        """
+        Returns whether or not there are writes not stored into disk yet
+        :return: bool
+        """
+
+        return bool(self._pending) or self._pending_recent_files is not None
+
+    def flush(self):
+        """
+        Writes all pending values into the underlying settings object
+        """
+
+        self._flush_timer.stop()
+        if not self.has_pending_writes():
+            return
+
+        # Pending keys are fully qualified, so they are written with no group opened. Opened groups are restored
+        # afterwards, so flushing from a timer or a sync() call never changes the group callers are working on
+        opened_groups = list()
+        while self.group():
+            opened_groups.append(self.group())
+            self.endGroup()
+        try:
+            pending = self._pending
+            self._pending = OrderedDict()
+            for setting_name, setting_value in pending.items():
+                self.setValue(setting_name, setting_value)
+
+            if self._pending_recent_files is not None:
+                recent_files = self._pending_recent_files
+                self._pending_recent_files = None
+                self._write_recent_files(recent_files)
+        finally:
+            parent_group = ''
+            for group in reversed(opened_groups):
+                self.beginGroup(group[len(parent_group) + 1:] if parent_group else group)
+                parent_group = group
+
+    def sync(self):
+        """
+        Overrides base sync function to make sure that pending writes are stored before syncing with disk
+        """
+
+        self.flush()
+        super(QtSettings, self).sync()
+
+    def remove(self, key):
+        """
+        Overrides base remove function to make sure that pending writes of removed keys are discarded
+        :param key: str
+        """
+
+        full_key = self._full_key(key) if key else self.group()
+        if self._pending:
+            prefix = '{}/'.format(full_key) if full_key else ''
+            for pending_key in list(self._pending.keys()):
+                if pending_key == full_key or pending_key.startswith(prefix):
+                    self._pending.pop(pending_key)
+        if self._pending_recent_files is not None and (not full_key or full_key == 'RecentFiles'):
+            self._pending_recent_files = None
+
+        super(QtSettings, self).remove(key)
 
     def get_groups(self):
         """
@@ -148,6 +280,7 @@ class QtSettings(QSettings, object):
         :return: list<str>, list of user prefs keys
         """
 
+        self.flush()
         results = list()
         self.beginGroup('Preferences')
         results = self.childKeys()
@@ -160,6 +293,7 @@ class QtSettings(QSettings, object):
         :return: list
         """
 
+        self.flush()
         layout_names = list()
         layout_keys = ['%s/geometry' % x for x in self.window_keys()]
 
@@ -192,6 +326,7 @@ class QtSettings(QSettings, object):
         """
 
         sys.utils.logger.info('Restoring layout: "{}"'.format(layout))
+        self.flush()
         window_keys = self.window_keys()
 
         for widget_name in window_keys:
@@ -218,6 +353,7 @@ class QtSettings(QSettings, object):
         """
 
         sys.utils.logger.info('Deleting layout: "{}"'.format(layout))
+        self.flush()
         window_keys = self.window_keys()
 
         for widget_name in window_keys:
@@ -243,6 +379,7 @@ class QtSettings(QSettings, object):
             except Exception:
                 pass
 
+        self.flush()
         result = None
 
         if not groups:
@@ -273,6 +410,9 @@ class QtSettings(QSettings, object):
         Get a tuple of the most recent files
         """
 
+        if self._pending_recent_files is not None:
+            return self._pending_recent_files
+
         recent_files = list()
         cnt = self.beginReadArray('RecentFiles')
         for i in range(cnt):
@@ -294,15 +434,97 @@ class QtSettings(QSettings, object):
             recent_files = tuple(x for x in recent_files if x != filename)
 
         recent_files = recent_files + (filename,)
+        if self._is_deferring():
+            self._pending_recent_files = recent_files
+            self._schedule_flush()
+        else:
+            self._write_recent_files(recent_files)
+
+    def clear_recent_files(self):
+        self.remove('RecentFiles')
+
+    def _window_key(self, setting_name):
+        """
+        Internal function that returns the full key of the given window setting
+        :param setting_name: str
+        :return: str
+        """
+
+        if not self._window:
+            return setting_name
+
+        return self._window.objectName().upper() + '/' + setting_name
+
+    def _full_key(self, setting_name):
+        """
+        Internal function that returns the given key qualified with the current group
+        :param setting_name: str
+        :return: str
+        """
+
+        group = self.group()
+
+        return '{}/{}'.format(group, setting_name) if group else setting_name
+
+    def _is_deferring(self):
+        """
+        Internal function that returns whether or not writes should be kept in the in-memory overlay
+        :return: bool
+        """
+
+        return self._write_behind or self._batch_depth > 0
+
+    def _schedule_flush(self):
+        """
+        Internal function that (re)starts the write-behind timer if no batch is opened
+        """
+
+        if self._write_behind and not self._batch_depth:
+            self._flush_timer.start()
+
+    def _read(self, setting_name):
+        """
+        Internal function that returns the value of the given key taking into account pending writes
+        :param setting_name: str
+        :return: variant
+        """
+
+        full_key = self._full_key(setting_name)
+        if full_key in self._pending:
+            return self._pending[full_key]
+
+        return self.value(setting_name)
+
+    def _write(self, setting_name, setting_value):
+        """
+        Internal function that stores given value or keeps it in the overlay if writes are being deferred
+        :param setting_name: str
+        :param setting_value: variant
+        """
+
+        if not self._is_deferring():
+            self.setValue(setting_name, setting_value)
+            return
+
+        # Re-insert the key so pending writes are flushed in the order they were last done. Keys are stored fully
+        # qualified because the group opened when writing can be different when pending writes are flushed
+        full_key = self._full_key(setting_name)
+        self._pending.pop(full_key, None)
+        self._pending[full_key] = setting_value
+        self._schedule_flush()
+
+    def _write_recent_files(self, recent_files):
+        """
+        Internal function that stores given recent files into disk
+        :param recent_files: tuple(str)
+        """
+
         self.beginWriteArray('RecentFiles')
         for i in range(len(recent_files)):
             self.setArrayIndex(i)
             self.setValue('file', recent_files[i])
         self.endArray()
 
-    def clear_recent_files(self):
-        self.remove('RecentFiles')
-
     def _initialize(self):
         if self._window:
             window_name = self._window.objectName().upper()
@@ -12,6 +12,8 @@ from threading import Lock, Condition
 
 from Qt.QtCore import Signal, QThread
 
+from tpDcc.libs.qt.core import profiling
+
 
 class Worker(QThread, object):
     workCompleted = Signal(str, object)
@@ -85,7 +87,8 @@ class Worker(QThread, object):
 
             data = None
             try:
-                data = item_to_process['fn'](item_to_process['params'])
+                with profiling.span(getattr(item_to_process['fn'], '__name__', 'work'), category='worker'):
+                    data = item_to_process['fn'](item_to_process['params'])
             except Exception as e:
                 if self._execute_tasks:
                     self.workFailure.emit(item_to_process['id'], 'An error ocurred: {}'.format(str(e)))
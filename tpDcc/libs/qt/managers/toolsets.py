@@ -6,11 +6,13 @@ Module that contains implementation for DCC toolsets
 """
 
 import os
+import copy
 import logging
 from collections import OrderedDict
 
 from tpDcc.managers import plugins, tools
 from tpDcc.libs.python import python, decorators, folder, yamlio, color
+from tpDcc.libs.qt.core import profiling
 from tpDcc.libs.qt.widgets import toolset
 
 if python.is_python2():
@@ -29,6 +31,8 @@ class ToolsetsManager(object):
         self._toolsets = dict()
         self._toolset_groups = dict()
         self._registered_paths = dict()
+        self._toolset_colors = dict()
+        self._toolset_menus = dict()
 
         self._manager = plugins.PluginsManager(interface=toolset.ToolsetWidget)
 
@@ -50,11 +54,29 @@ class ToolsetsManager(object):
 
         if path_to_register not in self._registered_paths[package_name]:
             self._registered_paths[package_name].append(path_to_register)
+            self.invalidate_cache(package_name)
+
+    def invalidate_cache(self, package_name=None):
+        """
+        Clears cached toolset colors and menus. Must be called if toolset groups are modified externally
+        :param package_name: str or None, if given only the cache of the given package is cleared
+        """
+
+        if not package_name:
+            self._toolset_colors.clear()
+            self._toolset_menus.clear()
+            return
+
+        for key in [key for key in self._toolset_colors if key[0] == package_name]:
+            self._toolset_colors.pop(key)
+        for key in [key for key in self._toolset_menus if key[1] == package_name]:
+            self._toolset_menus.pop(key)
 
     # ============================================================================================================
     # TOOLSETS
     # ============================================================================================================
 
+    @profiling.profile('ToolsetsManager.load_registered_toolsets', category='load')
     def load_registered_toolsets(self, package_name, tools_to_load, tools_manager=None):
         self._load_registered_paths_toolsets(package_name=package_name)
         self._load_package_toolsets(
@@ -62,6 +84,9 @@ class ToolsetsManager(object):
 
         tools_mgr = tools_manager or tools.ToolsManager
 
+        self.invalidate_cache(package_name)
+        self._update_toolset_colors(package_name)
+
         if package_name not in self._toolsets:
             self._toolsets[package_name] = list()
         toolset_data = self._manager.get_plugins(package_name)
@@ -195,16 +220,13 @@ class ToolsetsManager(object):
         if not package_name:
             package_name = toolset_id.replace('.', '-').split('-')[0]
 
+        toolset_color = self._toolset_colors.get((package_name, toolset_id))
+        if toolset_color is not None:
+            return toolset_color
+
         if self._toolset_groups and package_name in self._toolset_groups:
-            for pkg_name, toolset_groups in self._toolset_groups.items():
-                if package_name != pkg_name:
-                    continue
-                for toolset_group in toolset_groups:
-                    if toolset_id in toolset_group['toolsets']:
-                        index = toolset_group['toolsets'].index(toolset_id)
-                        group_color = tuple(toolset_group['color'])
-                        hue_shift = toolset_group['hue_shift'] * (index + 1)
-                        return tuple(color.hue_shift(group_color, hue_shift))
+            self._update_toolset_colors(package_name)
+            return self._toolset_colors.get((package_name, toolset_id))
         else:
             LOGGER.warning(
                 'ToolSet "{}" not found in any toolset group. Impossible to retrieve color!'.format(toolset_id))
@@ -213,6 +235,7 @@ class ToolsetsManager(object):
     def toolset_menu(self, toolset_type=None, package_name=None):
         """
         Returns the menu data of the given toolset
+        Menu data is generated the first time it is requested and cached until toolsets registry changes
         :param toolset_type: str
         :param package_name: str
         :return: list(list)
@@ -221,6 +244,11 @@ class ToolsetsManager(object):
         if not package_name:
             package_name = toolset_type.replace('.', '-').split('-')[0]
 
+        cache_key = (toolset_type, package_name)
+        toolset_menus = self._toolset_menus.get(cache_key)
+        if toolset_menus is not None:
+            return copy.deepcopy(toolset_menus)
+
         toolset_menus = list()
 
         if self._toolset_groups and package_name in self._toolset_groups:
@@ -232,6 +260,8 @@ class ToolsetsManager(object):
                         if toolset_group['type'] != toolset_type:
                             continue
                     toolset_menus.append(toolset_group.get('menu', list()))
+            self._toolset_menus[cache_key] = toolset_menus
+            toolset_menus = copy.deepcopy(toolset_menus)
         else:
             LOGGER.warning(
                 'Toolset "{}" not found in any toolset group. Impossible to retrieve menu data!'.format(toolset_type))
@@ -305,6 +335,23 @@ class ToolsetsManager(object):
     # INTERNAL
     # ============================================================================================================
 
+    def _update_toolset_colors(self, package_name):
+        """
+        Internal function that computes the hue shifted colors of all the toolsets of the given package
+        :param package_name: str
+        """
+
+        for pkg_name, toolset_groups in self._toolset_groups.items():
+            if package_name != pkg_name:
+                continue
+            for toolset_group in toolset_groups:
+                group_color = tuple(toolset_group['color'])
+                for index, toolset_id in enumerate(toolset_group['toolsets']):
+                    if (pkg_name, toolset_id) in self._toolset_colors:
+                        continue
+                    hue_shift = toolset_group['hue_shift'] * (index + 1)
+                    self._toolset_colors[(pkg_name, toolset_id)] = tuple(color.hue_shift(group_color, hue_shift))
+
     def _load_registered_paths_toolsets(self, package_name):
         """
         Loads all toolsets found in registered paths
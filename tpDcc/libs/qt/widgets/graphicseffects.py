@@ -9,8 +9,9 @@ from __future__ import print_function, division, absolute_import
 
 from tpDcc.libs.python import decorators
 
-from Qt.QtCore import QPropertyAnimation, QEasingCurve
-from Qt.QtWidgets import QGraphicsEffect, QGraphicsBlurEffect
+from Qt.QtCore import Qt, QRectF, QPropertyAnimation, QEasingCurve
+from Qt.QtWidgets import QGraphicsEffect, QGraphicsBlurEffect, QGraphicsScene, QGraphicsPixmapItem
+from Qt.QtGui import QPainter, QPixmap, QImage, QTransform
 
 
 class OpacityEffect(QGraphicsEffect, object):
@@ -83,11 +84,19 @@ class OpacityEffect(QGraphicsEffect, object):
 
 
 class GraphicsLayeredBlurEffect(QGraphicsBlurEffect, object):
+    """
+    Blur effect that draws an outer and an inner blur layer below the source
+    Blurred layers are cached and only recomputed when the source or the radii change
+    """
+
     def __init__(self, inner_radius=0, outer_radius=0, parent=None):
         super(GraphicsLayeredBlurEffect, self).__init__(parent=parent)
 
         self._inner_radius = inner_radius
         self._outer_radius = outer_radius
+        self._blur_cache = None
+
+        self._update_blur_radius()
 
     @property
     @decorators.returns(float)
@@ -98,6 +107,7 @@ class GraphicsLayeredBlurEffect(QGraphicsBlurEffect, object):
     @decorators.accepts(float)
     def inner_radius(self, value):
         self._inner_radius = value
+        self._update_blur_radius()
 
     @property
     @decorators.returns(float)
@@ -108,12 +118,91 @@ class GraphicsLayeredBlurEffect(QGraphicsBlurEffect, object):
     @decorators.accepts(float)
     def outer_radius(self, value):
         self._outer_radius = value
+        self._update_blur_radius()
 
     def draw(self, painter):
-        if self._outer_radius > 0:
-            self.setBlurRadius(self._outer_radius)
-            super(GraphicsLayeredBlurEffect, self).draw(painter)
-        if self._inner_radius > 0:
-            self.setBlurRadius(self._inner_radius)
-            super(GraphicsLayeredBlurEffect, self).draw(painter)
-        super(GraphicsLayeredBlurEffect, self).drawSource(painter)
+        if self._outer_radius <= 0 and self._inner_radius <= 0:
+            self.drawSource(painter)
+            return
+
+        source_pixmap, offset = self._source_pixmap()
+        if source_pixmap.isNull():
+            return
+
+        cache_key = (source_pixmap.cacheKey(), self._outer_radius, self._inner_radius)
+        if self._blur_cache is None or self._blur_cache[0] != cache_key:
+            self._blur_cache = (cache_key, self._render_layers(source_pixmap))
+
+        restore_transform = painter.worldTransform()
+        painter.setWorldTransform(QTransform())
+        painter.drawPixmap(offset, self._blur_cache[1])
+        painter.setWorldTransform(restore_transform)
+
+    def sourceChanged(self, flags):
+        self._blur_cache = None
+        super(GraphicsLayeredBlurEffect, self).sourceChanged(flags)
+
+    def _update_blur_radius(self):
+        """
+        Internal function that updates effect blur radius, so the effect bounding rect is padded to fit the widest
+        layer, and discards cached layers
+        """
+
+        self._blur_cache = None
+        self.setBlurRadius(max(self._inner_radius, self._outer_radius, 0))
+        self.update()
+
+    def _source_pixmap(self):
+        """
+        Internal function that returns source pixmap in device coordinates, padded to the effect bounding rect
+        :return: tuple(QPixmap, QPoint)
+        """
+
+        result = self.sourcePixmap(Qt.DeviceCoordinates, mode=QGraphicsEffect.PadToEffectiveBoundingRect)
+        if isinstance(result, tuple):
+            return result
+
+        # Bindings without output parameters support do not return the offset
+        return result, self.sourceBoundingRect(Qt.DeviceCoordinates).topLeft().toPoint()
+
+    def _render_layers(self, source_pixmap):
+        """
+        Internal function that composes outer blur, inner blur and source layers into a single pixmap
+        :param source_pixmap: QPixmap
+        :return: QPixmap
+        """
+
+        layers = QPixmap(source_pixmap.size())
+        layers.fill(Qt.transparent)
+        painter = QPainter(layers)
+        for radius in (self._outer_radius, self._inner_radius):
+            if radius > 0:
+                painter.drawImage(0, 0, self._blur_pixmap(source_pixmap, radius))
+        painter.drawPixmap(0, 0, source_pixmap)
+        painter.end()
+
+        return layers
+
+    def _blur_pixmap(self, pixmap, radius):
+        """
+        Internal function that returns a blurred version of the given pixmap
+        :param pixmap: QPixmap
+        :param radius: float
+        :return: QImage
+        """
+
+        blur_effect = QGraphicsBlurEffect()
+        blur_effect.setBlurRadius(radius)
+        blur_effect.setBlurHints(self.blurHints())
+        pixmap_item = QGraphicsPixmapItem(pixmap)
+        pixmap_item.setGraphicsEffect(blur_effect)
+        scene = QGraphicsScene()
+        scene.addItem(pixmap_item)
+
+        blurred_image = QImage(pixmap.size(), QImage.Format_ARGB32_Premultiplied)
+        blurred_image.fill(Qt.transparent)
+        painter = QPainter(blurred_image)
+        scene.render(painter, QRectF(), QRectF(0, 0, pixmap.width(), pixmap.height()))
+        painter.end()
+
+        return blurred_image
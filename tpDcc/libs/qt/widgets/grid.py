@@ -7,7 +7,8 @@ Module that contains different grid widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtWidgets import QTableWidget
+from Qt.QtCore import QTimer
+from Qt.QtWidgets import QTableWidget, QHeaderView
 
 from tpDcc.libs.qt.core import base
 
@@ -15,21 +16,60 @@ from tpDcc.libs.qt.core import base
 class GridWidget(QTableWidget, object):
     """
     Widget that behaves as a grid widget
+    Cell widgets are indexed by cell and the first empty cell is tracked with a cursor, so adding widgets does not
+    need to scan the whole table. Columns share the available width through header stretch mode.
     """
 
     def __init__(self, parent=None):
         super(GridWidget, self).__init__(parent=parent)
 
-    def resizeEvent(self, event):
+        self._cell_widgets = dict()
+        self._free_cell = (0, 0)
+        self._index_dirty = False
+        self._updating_index = False
+        self._resize_rows_scheduled = False
+
+        header = self.horizontalHeader()
+        if hasattr(header, 'setSectionResizeMode'):
+            header.setSectionResizeMode(QHeaderView.Stretch)
+        else:
+            header.setResizeMode(QHeaderView.Stretch)
+
+        model = self.model()
+        for model_signal in (
+                model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.columnsInserted,
+                model.columnsRemoved, model.columnsMoved, model.modelReset, model.layoutChanged):
+            model_signal.connect(self._on_table_structure_changed)
+
+    def setCellWidget(self, row, column, widget):
         """
-        Override resizeEvent so the table columns maintain its size when resizing QTableWidget
-        :param event: QResizeEvent
-        :return:
+        Overrides base QTableWidget setCellWidget function to keep cell widgets index updated
+        :param row: int
+        :param column: int
+        :param widget: QWidget
+        """
+
+        super(GridWidget, self).setCellWidget(row, column, widget)
+        if self._index_dirty:
+            return
+        if widget is None:
+            self._remove_from_index(row, column)
+            return
+
+        self._cell_widgets[(row, column)] = widget
+        if (row, column) == self._free_cell:
+            self._free_cell = self._next_free_cell(row, column)
+
+    def removeCellWidget(self, row, column):
         """
-        total_width = self.viewport().width()
-        num_columns = self.columnCount()
-        for column in range(num_columns):
-            self.horizontalHeader().resizeSection(column, total_width / num_columns)
+        Overrides base QTableWidget removeCellWidget function to keep cell widgets index updated
+        :param row: int
+        :param column: int
+        """
+
+        super(GridWidget, self).removeCellWidget(row, column)
+        if not self._index_dirty:
+            self._remove_from_index(row, column)
 
     def pos_to_row_col(self, pos):
         """
@@ -57,13 +97,42 @@ class GridWidget(QTableWidget, object):
     def add_widget_first_empty_cell(self, widget):
         """
         Adds a new QWidget into the first available cell in the grid
+        Row heights are updated once the control returns to the event loop
         :param widget: QWidget
         :return:
         """
 
         row, col = self.first_empty_cell()
         self.addWidget(row, col, widget)
-        self.resizeRowsToContents()
+        self._schedule_resize_rows()
+
+    def add_widgets(self, widgets):
+        """
+        Adds given widgets into the first available cells of the grid
+        Required rows are inserted at once and row heights are updated only once
+        :param widgets: list(QWidget)
+        """
+
+        widgets = list(widgets)
+        column_count = self.columnCount()
+        if not widgets or not column_count:
+            return
+
+        self._update_index()
+        free_cells = self.rowCount() * column_count - len(self._cell_widgets)
+        missing_cells = len(widgets) - free_cells
+        if missing_cells > 0:
+            self._updating_index = True
+            try:
+                self.setRowCount(self.rowCount() + (missing_cells + column_count - 1) // column_count)
+            finally:
+                self._updating_index = False
+
+        for widget in widgets:
+            row, col = self.first_empty_cell()
+            self.addWidget(row, col, widget)
+
+        self._schedule_resize_rows()
 
     def first_empty_cell(self):
         """
@@ -71,18 +140,17 @@ class GridWidget(QTableWidget, object):
         :return: int, int, first row, col pair of empty the first empty cell
         """
 
-        empty_cell = (-1, -1)
-        for row in range(self.rowCount()):
-            for column in range(self.columnCount()):
-                if not self.cellWidget(row, column):
-                    empty_cell = (row, column)
-                    break
-            if empty_cell != (-1, -1):
-                break
-        if empty_cell == (-1, -1):
-            self.insertRow(self.rowCount())
-            empty_cell = (self.rowCount() - 1, 0)
-        return empty_cell
+        self._update_index()
+        row, column = self._free_cell
+        if row >= self.rowCount() or column >= self.columnCount():
+            self._updating_index = True
+            try:
+                self.insertRow(self.rowCount())
+            finally:
+                self._updating_index = False
+            self._free_cell = (self.rowCount() - 1, 0)
+
+        return self._free_cell
 
     def count(self):
         """
@@ -93,10 +161,78 @@ class GridWidget(QTableWidget, object):
         return self.columnCount() * self.rowCount()
 
     def get_widgets(self):
+        self._update_index()
+        for cell in sorted(self._cell_widgets.keys()):
+            cell_widget = self._cell_widgets[cell]
+            yield cell_widget.containedWidget
+
+    def _update_index(self):
+        """
+        Internal function that rebuilds cell widgets index if the table structure changed
+        """
+
+        if not self._index_dirty:
+            return
+
+        self._cell_widgets.clear()
         for row in range(self.rowCount()):
             for column in range(self.columnCount()):
                 cell_widget = self.cellWidget(row, column)
-                if not cell_widget:
-                    continue
-                item_widget = cell_widget.containedWidget
-                yield item_widget
+                if cell_widget:
+                    self._cell_widgets[(row, column)] = cell_widget
+        self._index_dirty = False
+        self._free_cell = (0, 0) if (0, 0) not in self._cell_widgets else self._next_free_cell(0, 0)
+
+    def _remove_from_index(self, row, column):
+        """
+        Internal function that removes the given cell from cell widgets index
+        :param row: int
+        :param column: int
+        """
+
+        if self._cell_widgets.pop((row, column), None) is not None and (row, column) < self._free_cell:
+            self._free_cell = (row, column)
+
+    def _next_free_cell(self, row, column):
+        """
+        Internal function that returns the first cell without widget after the given one
+        If all cells are used, a cell located after the last row is returned
+        :param row: int
+        :param column: int
+        :return: tuple(int, int)
+        """
+
+        column_count = max(1, self.columnCount())
+        cell_index = row * column_count + column
+        while True:
+            cell_index += 1
+            cell = (cell_index // column_count, cell_index % column_count)
+            if cell not in self._cell_widgets:
+                return cell
+
+    def _schedule_resize_rows(self):
+        """
+        Internal function that resizes rows to their contents once the control returns to the event loop
+        """
+
+        if self._resize_rows_scheduled:
+            return
+
+        self._resize_rows_scheduled = True
+        QTimer.singleShot(0, self._on_resize_rows)
+
+    def _on_table_structure_changed(self, *args):
+        """
+        Internal callback function that is called when rows or columns are inserted, removed or moved
+        """
+
+        if not self._updating_index:
+            self._index_dirty = True
+
+    def _on_resize_rows(self):
+        """
+        Internal callback function that resizes all rows to their contents
+        """
+
+        self._resize_rows_scheduled = False
+        self.resizeRowsToContents()
@@ -7,14 +7,19 @@ Module that contains custom Qt widgets related with version management
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt
-from Qt.QtWidgets import QSizePolicy, QWidgetItem, QTreeWidgetItem
+import os
+import logging
+
+from Qt.QtCore import Qt, Signal, QObject, QModelIndex, QAbstractTableModel, QRunnable, QThreadPool
+from Qt.QtWidgets import QSizePolicy, QWidgetItem, QTreeWidgetItem, QTreeView, QAbstractItemView
 
 from tpDcc.managers import resources
 from tpDcc.libs.python import version
 from tpDcc.libs.qt.core import base, qtutils
 from tpDcc.libs.qt.widgets import layouts, buttons, treewidgets
 
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
 
 class HistoryTreeWidget(treewidgets.FileTreeWidget, object):
 
@@ -78,9 +83,417 @@ class HistoryTreeWidget(treewidgets.FileTreeWidget, object):
         self._current_item = self.currentItem()
 
 
+class HistoryVersionItem(object):
+    """
+    Read only version entry returned by HistoryTreeView selection functions
+    Exposes the same read API used from QTreeWidgetItem instances of HistoryTreeWidget
+    """
+
+    def __init__(self, texts, file_path):
+        super(HistoryVersionItem, self).__init__()
+
+        self._texts = texts
+        self.file_path = file_path
+
+    def text(self, column):
+        return self._texts[column]
+
+
+class HistoryLoadWorker(QRunnable, object):
+    """
+    Class that reads the version data of a file in a thread
+    """
+
+    class HistoryLoadWorkerSignals(QObject, object):
+        finished = Signal(object, object, object, object)
+
+    def __init__(self, file_path, signature):
+        super(HistoryLoadWorker, self).__init__()
+
+        self._file_path = file_path
+        self._signature = signature
+        self.signals = HistoryLoadWorker.HistoryLoadWorkerSignals()
+
+        self.setAutoDelete(False)
+
+    def run(self):
+        """
+        Overrides base QRunnable run function
+        This is the starting point for the thread
+        """
+
+        version_data = list()
+        try:
+            version_file = version.VersionFile(file_path=self._file_path)
+            version_data = version_file.get_organized_version_data() or list()
+        except Exception as exc:
+            LOGGER.error('Error while reading versions of "{}": {}'.format(self._file_path, exc))
+
+        self.signals.finished.emit(self, self._file_path, self._signature, version_data)
+
+
+class HistoryModel(QAbstractTableModel, object):
+    """
+    Model that exposes the versions of a file
+    Version data is read in a thread and cached per file until the version folders change. Rows are fetched in
+    batches while the view scrolls, so files with thousands of versions open instantly
+    """
+
+    loadStarted = Signal()
+    loadFinished = Signal()
+
+    HEADER_LABELS = ['Version', 'Comment', 'Size MB', 'User', 'Time']
+    FETCH_BATCH_SIZE = 200
+
+    _VERSION_DATA_CACHE = dict()
+
+    def __init__(self, parent=None):
+        super(HistoryModel, self).__init__(parent)
+
+        self._file_path = None
+        self._rows = list()
+        self._fetched = 0
+        self._padding = 1
+        self._sort_column = 0
+        self._sort_order = Qt.DescendingOrder
+        self._load_worker = None
+
+    # =================================================================================================================
+    # OVERRIDES
+    # =================================================================================================================
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._fetched
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADER_LABELS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal and 0 <= section < len(self.HEADER_LABELS):
+            return self.HEADER_LABELS[section]
+
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._fetched:
+            return None
+
+        if role == Qt.DisplayRole:
+            return self.row_texts(index.row())[index.column()]
+        elif role == Qt.UserRole:
+            return self.file_path(index.row())
+
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetched < len(self._rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+
+        count = min(self.FETCH_BATCH_SIZE, len(self._rows) - self._fetched)
+        if count <= 0:
+            return
+
+        self.beginInsertRows(QModelIndex(), self._fetched, self._fetched + count - 1)
+        self._fetched += count
+        self.endInsertRows()
+
+    def sort(self, column, order=Qt.AscendingOrder):
+        self._sort_column = column
+        self._sort_order = order
+        if not self._rows:
+            return
+
+        self.layoutAboutToBeChanged.emit()
+        self._sort_rows()
+        self.layoutChanged.emit()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def get_file_path(self):
+        """
+        Returns the path of the file whose versions are exposed by the model
+        :return: str or None
+        """
+
+        return self._file_path
+
+    def set_file_path(self, file_path, refresh=True):
+        """
+        Sets the path of the file whose versions are exposed by the model
+        :param file_path: str
+        :param refresh: bool
+        """
+
+        self._file_path = file_path
+        if refresh:
+            self.refresh()
+
+    def refresh(self, force=False):
+        """
+        Reloads the versions of the current file
+        Cached version data is used if the version folders did not change since it was read
+        :param force: bool, whether to ignore the cached version data
+        """
+
+        self._load_worker = None
+        if not self._file_path:
+            self._set_version_data(list())
+            return
+
+        signature = self._version_signature(self._file_path)
+        cached = self._VERSION_DATA_CACHE.get(self._file_path)
+        if not force and cached and cached[0] == signature:
+            self._set_version_data(cached[1])
+            return
+
+        self._set_version_data(list())
+        self._load_worker = HistoryLoadWorker(self._file_path, signature)
+        self._load_worker.signals.finished.connect(self._on_versions_loaded)
+        self.loadStarted.emit()
+        QThreadPool.globalInstance().start(self._load_worker)
+
+    def is_loading(self):
+        """
+        Returns whether version data is being read
+        :return: bool
+        """
+
+        return self._load_worker is not None
+
+    def version_data(self, row):
+        """
+        Returns the version data of the given row
+        :param row: int
+        :return: tuple(int, str, str, float, str, str), version, comment, user, file size, file date and version file
+        """
+
+        return self._rows[row][0]
+
+    def file_path(self, row):
+        """
+        Returns the path of the version file of the given row
+        :param row: int
+        :return: str
+        """
+
+        return self._rows[row][0][5]
+
+    def row_texts(self, row):
+        """
+        Returns the display texts of the given row. Texts are formatted the first time they are requested
+        :param row: int
+        :return: list(str)
+        """
+
+        row_data = self._rows[row]
+        if row_data[1] is None:
+            version_number, comment, user, file_size, file_date, _ = row_data[0]
+            row_data[1] = [
+                str(version_number).zfill(self._padding), comment, str(file_size), user, file_date]
+
+        return row_data[1]
+
+    @classmethod
+    def clear_cache(cls):
+        """
+        Removes all cached version data
+        """
+
+        cls._VERSION_DATA_CACHE.clear()
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _set_version_data(self, version_data):
+        """
+        Internal function that resets the model with the given version data
+        :param version_data: list(tuple)
+        """
+
+        self.beginResetModel()
+        self._rows = [[data, None] for data in version_data]
+        self._padding = len(str(len(version_data)))
+        self._fetched = 0
+        self._sort_rows()
+        self.endResetModel()
+        self.fetchMore()
+
+    def _sort_rows(self):
+        """
+        Internal function that sorts the rows using the current sort column and order
+        """
+
+        column = self._sort_column
+        if column < 0 or column >= len(self.HEADER_LABELS):
+            return
+
+        def _sort_key(row_data):
+            value = row_data[0][(0, 1, 3, 2, 4)[column]]
+            return (value is None, value)
+
+        self._rows.sort(key=_sort_key, reverse=self._sort_order == Qt.DescendingOrder)
+
+    def _version_signature(self, file_path):
+        """
+        Internal function that returns the modification times of the file folder and its sub folders.
+        New versions are stored in these folders, so the signature changes when versions are added or removed
+        :param file_path: str
+        :return: tuple
+        """
+
+        folder_path = file_path if os.path.isdir(file_path) else os.path.dirname(file_path)
+        paths = [file_path, folder_path]
+        try:
+            paths.extend(
+                os.path.join(folder_path, name) for name in sorted(os.listdir(folder_path))
+                if os.path.isdir(os.path.join(folder_path, name)))
+        except OSError:
+            pass
+
+        signature = list()
+        for path in paths:
+            try:
+                signature.append((path, os.path.getmtime(path)))
+            except OSError:
+                signature.append((path, None))
+
+        return tuple(signature)
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_versions_loaded(self, worker, file_path, signature, version_data):
+        """
+        Internal callback function that is called when version data is read by a load worker
+        :param worker: HistoryLoadWorker
+        :param file_path: str
+        :param signature: tuple
+        :param version_data: list(tuple)
+        """
+
+        self._VERSION_DATA_CACHE[file_path] = (signature, version_data)
+        if worker is not self._load_worker:
+            return
+
+        self._load_worker = None
+        self._set_version_data(version_data)
+        self.loadFinished.emit()
+
+
+class HistoryTreeView(QTreeView, object):
+    """
+    Version list view backed by HistoryModel
+    Exposes the same API used by HistoryFileWidget from HistoryTreeWidget
+    """
+
+    itemSelectionChanged = Signal()
+
+    def __init__(self, parent=None):
+        super(HistoryTreeView, self).__init__(parent)
+
+        self._model = HistoryModel(parent=self)
+        self.setModel(self._model)
+        self.setUniformRowHeights(True)
+        self.setRootIsDecorated(False)
+        self.setAlternatingRowColors(True)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.setSortingEnabled(True)
+        self.sortByColumn(0, Qt.DescendingOrder)
+
+        self.setColumnWidth(0, 70)
+        self.setColumnWidth(1, 200)
+        self.setColumnWidth(2, 70)
+        self.setColumnWidth(3, 70)
+        self.setColumnWidth(4, 70)
+
+        self.selectionModel().selectionChanged.connect(self._on_selection_changed)
+        self._model.modelReset.connect(self._on_selection_changed)
+
+    # =================================================================================================================
+    # PROPERTIES
+    # =================================================================================================================
+
+    @property
+    def directory(self):
+        return self._model.get_file_path()
+
+    # =================================================================================================================
+    # BASE
+    # =================================================================================================================
+
+    def set_directory(self, directory, refresh=True):
+        """
+        Sets the path of the file whose versions are listed
+        :param directory: str
+        :param refresh: bool
+        """
+
+        self._model.set_file_path(directory, refresh=refresh)
+
+    def refresh(self):
+        """
+        Reloads the version list
+        """
+
+        self._model.refresh()
+
+    def selectedItems(self):
+        """
+        Returns selected versions
+        :return: list(HistoryVersionItem)
+        """
+
+        rows = sorted(set(index.row() for index in self.selectionModel().selectedRows()))
+
+        return [self._version_item(row) for row in rows]
+
+    def currentItem(self):
+        """
+        Returns current version
+        :return: HistoryVersionItem or None
+        """
+
+        index = self.currentIndex()
+        if not index.isValid():
+            return None
+
+        return self._version_item(index.row())
+
+    # =================================================================================================================
+    # INTERNAL
+    # =================================================================================================================
+
+    def _version_item(self, row):
+        """
+        Internal function that returns version item for the given model row
+        :param row: int
+        :return: HistoryVersionItem
+        """
+
+        return HistoryVersionItem(self._model.row_texts(row), self._model.file_path(row))
+
+    # =================================================================================================================
+    # CALLBACKS
+    # =================================================================================================================
+
+    def _on_selection_changed(self, *args):
+        """
+        Internal callback function that is called when the selected versions change
+        """
+
+        self.itemSelectionChanged.emit()
+
+
 class HistoryFileWidget(base.DirectoryWidget, object):
 
-    VERSION_LIST = HistoryTreeWidget
+    VERSION_LIST = HistoryTreeView
 
     def __init__(self, parent=None):
         super(HistoryFileWidget, self).__init__(parent=parent)
@@ -103,6 +103,8 @@ class FlowLayout(QLayout, object):
     Layout that automatically adjust widgets position depending on the available space
     """
 
+    LAYOUT_CACHE_SIZE = 8
+
     def __init__(self, margin=0, spacing_x=2, spacing_y=2, parent=None):
         super(FlowLayout, self).__init__(parent)
 
@@ -112,6 +114,8 @@ class FlowLayout(QLayout, object):
         self._item_list = list()
         self._overflow = None
         self._size_hint_layout = self.minimumSize()
+        self._layout_cache = dict()
+        self._layout_generation = 0
 
         self.set_spacing_x(spacing_x)
         self.set_spacing_y(spacing_y)
@@ -138,6 +142,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._item_list.append(item)
+        self._invalidate_layout_cache()
 
     def count(self):
         """
@@ -167,10 +172,20 @@ class FlowLayout(QLayout, object):
         """
 
         if 0 <= index < len(self._item_list):
+            self._invalidate_layout_cache()
             return self._item_list.pop(index)
 
         return None
 
+    def invalidate(self):
+        """
+        Overrides base QLayout invalidate function
+        Called by Qt each time the size hint of any of the items changes, so cached layouts are discarded
+        """
+
+        self._invalidate_layout_cache()
+        super(FlowLayout, self).invalidate()
+
     def expandingDirections(self):
         """
         Sets whether this layout grows only in horizontal or vertical dimension
@@ -256,6 +271,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._spacing_x = qtutils.dpi_scale(spacing)
+        self._invalidate_layout_cache()
 
     def set_spacing_y(self, spacing):
         """
@@ -264,6 +280,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._spacing_y = qtutils.dpi_scale(spacing)
+        self._invalidate_layout_cache()
 
     def clear(self):
         """
@@ -292,6 +309,7 @@ class FlowLayout(QLayout, object):
         """
 
         self._orientation = orientation
+        self._invalidate_layout_cache()
 
     def add_spacing(self, spacing):
         """
@@ -314,6 +332,7 @@ class FlowLayout(QLayout, object):
 
         item = QWidgetItem(widget)
         self._item_list.insert(index, item)
+        self._invalidate_layout_cache()
 
     def remove_at(self, index):
         """
@@ -339,54 +358,90 @@ class FlowLayout(QLayout, object):
         """
 
         self._overflow = flag
+        self._invalidate_layout_cache()
+
+    def _invalidate_layout_cache(self):
+        """
+        Internal function that discards all cached layout passes
+        """
+
+        self._layout_cache.clear()
+        self._layout_generation += 1
 
     def _generate_layout(self, rect, test_only=True):
         """
         Generates layout with proper flow
+        Item placement is cached per available size, so heightForWidth and setGeometry calls done by Qt for the same
+        size during layout negotiation only compute the layout once
         :param rect: QRect
         :param test_only: bool
         :return: int
         """
 
-        x = rect.x()
-        y = rect.y()
+        orientation = self.orientation()
+        available = rect.width() if orientation == Qt.Horizontal else rect.height()
+        cache_key = (
+            available, len(self._item_list), self._spacing_x, self._spacing_y, self._layout_generation)
+        cached_layout = self._layout_cache.get(cache_key)
+        if cached_layout is None:
+            if len(self._layout_cache) >= self.LAYOUT_CACHE_SIZE:
+                self._layout_cache.clear()
+            cached_layout = self._layout_cache[cache_key] = self._compute_layout(available)
+
+        extent, geometries = cached_layout
+        if not test_only:
+            offset = rect.topLeft()
+            for item, item_rect in geometries:
+                item.setGeometry(item_rect.translated(offset))
+
+        return extent
+
+    def _compute_layout(self, available):
+        """
+        Internal function that computes the placement of all visible items in a layout placed in the origin
+        :param available: int, available width (horizontal orientation) or height (vertical orientation)
+        :return: tuple(int, list(tuple(QLayoutItem, QRect)), layout extent and geometry of each item
+        """
+
+        x = 0
+        y = 0
         line_height = 0
         orientation = self.orientation()
+        space_x = self._spacing_x
+        space_y = self._spacing_y
+        limit = available - 1
+        geometries = list()
 
         for item in self._item_list:
             widget = item.widget()
             if widget.isHidden():
                 continue
 
-            space_x = self._spacing_x
-            space_y = self._spacing_y
-
+            item_size = item.sizeHint()
             if orientation == Qt.Horizontal:
-                next_x = x + item.sizeHint().width() + space_x
-                if next_x - space_x > rect.right() and line_height > 0:
+                next_x = x + item_size.width() + space_x
+                if next_x - space_x > limit and line_height > 0:
                     if not self._overflow:
-                        x = rect.x()
+                        x = 0
                         y = y + line_height + (space_y * 2)
-                        next_x = x + item.sizeHint().width() + space_x
+                        next_x = x + item_size.width() + space_x
                         line_height = 0
-                if not test_only:
-                    item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                geometries.append((item, QRect(QPoint(x, y), item_size)))
                 x = next_x
-                line_height = max(line_height, item.sizeHint().height())
+                line_height = max(line_height, item_size.height())
             else:
-                next_y = y + item.sizeHint().height() + space_y
-                if next_y - space_y > rect.bottom() and line_height > 0:
+                next_y = y + item_size.height() + space_y
+                if next_y - space_y > limit and line_height > 0:
                     if not self._overflow:
-                        y = rect.y()
+                        y = 0
                         x = x + line_height + (space_x * 2)
-                        next_y = y + item.sizeHint().height() + space_y
+                        next_y = y + item_size.height() + space_y
                         line_height = 0
-                if not test_only:
-                    item.setGeometry(QRect(QPoint(x, y), item.sizeHint()))
+                geometries.append((item, QRect(QPoint(x, y), item_size)))
                 x = next_y
-                line_height = max(line_height, item.sizeHint().height())
+                line_height = max(line_height, item_size.height())
 
         if orientation == Qt.Horizontal:
-            return y + line_height - rect.y()
+            return y + line_height, geometries
         else:
-            return x + line_height - rect.x()
+            return x + line_height, geometries
@@ -9,12 +9,15 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import math
+import time
 import shutil
 import logging
 import tempfile
 import traceback
+import contextlib
 from datetime import datetime
 from functools import partial
+from collections import OrderedDict
 
 from Qt.QtCore import Qt, Signal, QObject, QRect, QSize, QThreadPool, QUrl
 from Qt.QtWidgets import QApplication, QTreeWidgetItem, QAction, QFileDialog, QMessageBox, QDialogButtonBox, QTreeWidget
@@ -24,7 +27,7 @@ from Qt.QtGui import QFontMetrics, QPixmap, QIcon, QColor, QPen, QBrush, QMovie
 from tpDcc import dcc
 from tpDcc.managers import resources
 from tpDcc.core import consts as dcc_consts
-from tpDcc.libs.qt.core import image, qtutils, decorators as qt_decorators
+from tpDcc.libs.qt.core import image, qtutils, profiling, decorators as qt_decorators
 from tpDcc.libs.qt.widgets import messagebox
 from tpDcc.libs.qt.widgets.library import consts, savewidget, loadwidget, exceptions, utils
 from tpDcc.libs.python import decorators, timedate, fileio, path as path_utils, folder as folder_utils
@@ -1117,39 +1120,59 @@ class ItemWidget(QTreeWidgetItem, object):
         if os.path.exists(path):
             self.show_already_existing_dialog()
 
-        temp_path = tempfile.mkdtemp()
-        if not os.path.isdir(temp_path):
-            os.mkdir(temp_path)
-        valid_save = self.write(temp_path, *args, **kwargs)
-        if not valid_save:
-            LOGGER.warning('Item {} not saved!'.format(path))
-            if self.library_window():
-                self.library_window().show_warning_message('Item {} not saved!'.format(path))
+        self._save_metrics = OrderedDict()
+
+        # Staging directory is created next to the final location, so it lives in the same file system and
+        # finalizing the save is a rename instead of a recursive copy
+        parent_path = os.path.dirname(path)
+        if parent_path and not os.path.isdir(parent_path):
+            os.makedirs(parent_path)
+        temp_path = tempfile.mkdtemp(prefix='.{}.'.format(self.name()), suffix='.tmp', dir=parent_path or None)
+        try:
+            with self._save_phase('write'):
+                valid_save = self.write(temp_path, *args, **kwargs)
+            if not valid_save:
+                LOGGER.warning('Item {} not saved!'.format(path))
+                if self.library_window():
+                    self.library_window().show_warning_message('Item {} not saved!'.format(path))
+                return False
+
+            new_path = os.path.join(os.path.dirname(path), self.name())
+            with self._save_phase('finalize'):
+                if not os.path.isdir(new_path):
+                    os.rename(temp_path, new_path)
+                else:
+                    self._replace_folder(temp_path, new_path)
+        finally:
+            # Staging directory lives inside the library, so it must never be left behind for library scans
             if os.path.isdir(temp_path):
                 folder_utils.delete_folder(temp_path)
-            return False
-
-        new_path = os.path.join(os.path.dirname(path), self.name())
-        if not os.path.isdir(new_path):
-            shutil.move(temp_path, new_path)
-        else:
-            folder_utils.move_folder(temp_path, new_path, only_contents=True)
-            folder_utils.delete_folder(temp_path)
 
         self.set_path(new_path)
-        self.save_item_data()
+        with self._save_phase('item_data'):
+            self.save_item_data()
 
         comment = kwargs.get('comment', None)
-        self.save_version(new_path, comment)
+        with self._save_phase('version'):
+            self.save_version(new_path, comment)
 
         if self.library_window():
             self.library_window().select_items([self])
 
         self.saved.emit(self)
-        LOGGER.debug('Item Saved: {}'.format(self.path()))
+        LOGGER.debug('Item Saved: {} | {}'.format(self.path(), ', '.join(
+            '{}: {:.3f}s'.format(phase, duration) for phase, duration in self._save_metrics.items())))
 
         return True
 
+    def save_metrics(self):
+        """
+        Returns the time spent, in seconds, in each one of the phases of the last save operation
+        :return: OrderedDict
+        """
+
+        return OrderedDict(getattr(self, '_save_metrics', None) or OrderedDict())
+
     def save_version(self, path, comment):
         """
         Function that creates a new version of the item data
@@ -1164,6 +1187,65 @@ class ItemWidget(QTreeWidgetItem, object):
                 comment = '-'
         version.save(comment)
 
+    @contextlib.contextmanager
+    def _save_phase(self, phase_name):
+        """
+        Internal context manager that measures the time spent in the given save phase
+        :param phase_name: str
+        """
+
+        start = time.time()
+        try:
+            with profiling.span('{}.save.{}'.format(self.__class__.__name__, phase_name), category='library'):
+                yield
+        finally:
+            self._save_metrics[phase_name] = time.time() - start
+
+    def _replace_folder(self, source_path, target_path):
+        """
+        Internal function that atomically replaces the target folder with the source one
+        Target folder is renamed to a backup name and source folder is renamed into its place, so a failure never
+        leaves a mix of old and new files. If the swap fails, the backup is restored. Files of the previous save that
+        were not written again (such as item versions) are moved from the backup into the new folder
+        Both folders must be in the same file system
+        :param source_path: str
+        :param target_path: str
+        """
+
+        target_name = os.path.basename(target_path)
+        backup_path = tempfile.mkdtemp(
+            prefix='.{}.'.format(target_name), suffix='.bak', dir=os.path.dirname(target_path) or None)
+        os.rmdir(backup_path)
+        os.rename(target_path, backup_path)
+        try:
+            os.rename(source_path, target_path)
+        except Exception:
+            os.rename(backup_path, target_path)
+            raise
+
+        try:
+            self._move_missing_contents(backup_path, target_path)
+        except Exception as exc:
+            LOGGER.warning('Impossible to restore previous files of "{}" from "{}": {}'.format(
+                target_path, backup_path, exc))
+            return
+        folder_utils.delete_folder(backup_path)
+
+    def _move_missing_contents(self, source_path, target_path):
+        """
+        Internal function that moves the files of the source folder that do not exist in the target one
+        :param source_path: str
+        :param target_path: str
+        """
+
+        for name in os.listdir(source_path):
+            source_item = os.path.join(source_path, name)
+            target_item = os.path.join(target_path, name)
+            if not os.path.exists(target_item):
+                os.rename(source_item, target_item)
+            elif os.path.isdir(source_item) and os.path.isdir(target_item):
+                self._move_missing_contents(source_item, target_item)
+
     """
     ##########################################################################################
     DIALOGS
@@ -214,6 +214,33 @@ class Library(QObject, object):
 
         return self._library_window.manager()
 
+    def index(self):
+        """
+        Returns the index used to search the items of this library
+        :return: LibraryIndex or None
+        """
+
+        manager = self.manager()
+        if not manager:
+            return None
+
+        return manager.index()
+
+    def query_items(self, text, sort_by=None):
+        """
+        Returns the library items matching the given search text
+        >>> query_items('type=anim name:walk OR tags:locomotion', sort_by=['name:asc'])
+        :param text: str
+        :param sort_by: list(str) or None
+        :return: list(LibraryItem)
+        """
+
+        index = self.index()
+        if index is None:
+            return list()
+
+        return index.search(text, sort_by=sort_by)
+
     # def name(self):
     #     """
     #     Returns the name of the library
@@ -536,42 +563,43 @@ class Library(QObject, object):
         item.set_path(target)
         item.save_item_data()
 
+        index = self.index()
+        if index is not None:
+            index.update_item(item)
+
         return target
 
-    # def rename_path(self, source, target):
-    #     """
-    #     Renames the suorce path to the given target name
-    #     :param source: str
-    #     :param target: str
-    #     :return: str
-    #     """
-    #
-    #     utils.rename_path_in_file(self.data_path(), source, target)
-    #     self.set_dirty(True)
-    #
-    #     return target
-    #
-    # def remove_path(self, path):
-    #     """
-    #     Removes the given path from the data
-    #     :param path: str
-    #     """
-    #
-    #     self.remove_paths([path])
-    #
-    # def remove_paths(self, paths):
-    #     """
-    #     Removes the given paths from the data
-    #     :param paths: list(str)
-    #     """
-    #
-    #     data = self.read()
-    #     paths = path_utils.normalize_paths(paths)
-    #     for path in paths:
-    #         if path in data:
-    #             del data[path]
-    #
-    #     self.save(data)
+    def rename_path(self, source, target):
+        """
+        Renames the source path to the given target name in the library index
+        :param source: str
+        :param target: str
+        :return: str
+        """
+
+        index = self.index()
+        if index is not None:
+            index.rename_path(source, target)
+
+        return target
+
+    def remove_path(self, path):
+        """
+        Removes the given path from the library index
+        :param path: str
+        """
+
+        self.remove_paths([path])
+
+    def remove_paths(self, paths):
+        """
+        Removes the given paths from the library index
+        :param paths: list(str)
+        """
+
+        index = self.index()
+        if index is not None:
+            index.remove_paths(path_utils.normalize_paths(paths))
 
     # def find_items(self, queries):
     #     """
@@ -611,6 +639,12 @@ class Library(QObject, object):
 
         found_items = list()
 
+        index = self.index()
+        item = index.item(item_path) if index is not None else None
+        if item is not None:
+            found_items.append(item)
+            return found_items
+
         items = self.create_items()
         if not items:
             return found_items
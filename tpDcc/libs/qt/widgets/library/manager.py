@@ -9,11 +9,17 @@ from __future__ import print_function, division, absolute_import
 
 import os
 import logging
+import threading
+import multiprocessing
 from collections import OrderedDict
+try:
+    import queue
+except ImportError:
+    import Queue as queue
 
 from tpDcc.core import scripts
-from tpDcc.libs.python import fileio, folder, settings, osplatform, path as path_utils
-from tpDcc.libs.qt.widgets.library import items
+from tpDcc.libs.python import python, fileio, folder, settings, osplatform, path as path_utils
+from tpDcc.libs.qt.widgets.library import items, query
 
 LOGGER = logging.getLogger('tpDcc-libs-qt')
 
@@ -29,6 +35,8 @@ class LibraryManager(object):
         self._library_window = None
         self._settings = settings
         self._item_classes = OrderedDict()
+        self._index = query.LibraryIndex()
+        self._find_cancel_event = None
 
         self.register_item(items.LibraryFolderItem)
 
@@ -64,6 +72,14 @@ class LibraryManager(object):
 
         self._settings = settings
 
+    def index(self):
+        """
+        Returns the index that stores the items found by this manager
+        :return: LibraryIndex
+        """
+
+        return self._index
+
     def register_item(self, cls):
         """
         Register the given item class to the given extension
@@ -208,18 +224,31 @@ class LibraryManager(object):
 
             yield path
 
-    def find_items(self, path, depth=3, **kwargs):
+    def find_items(self, path, depth=3, threaded=False, max_workers=None, prune=True, **kwargs):
         """
         Find and create items by walking the given path
+        Found items are added into the manager index
         :param path: str
         :param depth: int
+        :param threaded: bool, whether folders are listed concurrently by a pool of worker threads. Useful for
+            libraries located in network file systems, where each folder listing has a high latency
+        :param max_workers: int or None, number of worker threads used when threaded traversal is enabled
+        :param prune: bool, whether indexed items located in the given path that are not found anymore are removed
+            from the index once the walk is completed
         :param kwargs: dict
         :return: Iterable(LibraryItem)
         """
 
-        path = path_utils.normalize_path(path)
+        if threaded:
+            for item in self._find_items_threaded(
+                    path, depth=depth, max_workers=max_workers, prune=prune, **kwargs):
+                yield item
+            return
+
+        root_path = path = path_utils.normalize_path(path)
         max_depth = depth
         start_depth = path.count(os.path.sep)
+        found_items = list()
 
         for root, dirs, files in os.walk(path, followlinks=True):
             files.extend(dirs)
@@ -228,6 +257,8 @@ class LibraryManager(object):
                 path = os.path.join(root, filename)
                 item = self.item_from_path(path, **kwargs)
                 if item:
+                    self._index.add_item(item)
+                    found_items.append(item)
                     yield item
                     if not item.EnableNestedItems:
                         remove = True
@@ -242,19 +273,152 @@ class LibraryManager(object):
             if (current_depth - start_depth) >= max_depth:
                 del dirs[:]
 
+        if prune:
+            self._index.prune(found_items, root=root_path)
+
+    def cancel_find_items(self):
+        """
+        Cancels the threaded item search that is being executed, if any
+        """
+
+        if self._find_cancel_event is not None:
+            self._find_cancel_event.set()
+            self._find_cancel_event = None
+
+    def remove_items(self, items_to_remove):
+        """
+        Removes given items, and the ones nested inside them, from the manager index
+        :param items_to_remove: list(LibraryItem or str)
+        """
+
+        self._index.remove_paths([item if python.is_string(item) else item.path() for item in items_to_remove])
+
+    def search_items(self, text, sort_by=None):
+        """
+        Returns the indexed items matching the given search text
+        :param text: str
+        :param sort_by: list(str) or None
+        :return: list(LibraryItem)
+        """
+
+        return self._index.search(text, sort_by=sort_by)
+
     def find_items_in_folders(self, folders, depth=3, **kwargs):
         """
         Find and create new item instances by walking the given paths
+        Once all the folders are walked, indexed items that were not found are removed from the index
         :param folders: list(str)
         :param depth: int
         :param kwargs: dict
         :return: Iterable(LibraryItem)
         """
 
+        kwargs.pop('prune', None)
+        found_items = list()
         for folder in folders:
-            for item in self.find_items(folder, depth=depth, **kwargs):
+            for item in self.find_items(folder, depth=depth, prune=False, **kwargs):
+                found_items.append(item)
                 yield item
 
+        self._index.prune(found_items)
+
+    def _find_items_threaded(self, path, depth=3, max_workers=None, prune=True, **kwargs):
+        """
+        Internal function that find and create items by listing the folders of the given path concurrently
+        Worker threads only list folders; items are created in the calling thread as soon as each folder listing is
+        available. Starting a new threaded search cancels the previous one.
+        :param path: str
+        :param depth: int
+        :param max_workers: int or None
+        :param prune: bool, whether indexed items located in the given path that are not found anymore are removed
+            from the index once the search is completed. Cancelled searches never prune the index
+        :param kwargs: dict
+        :return: Iterable(LibraryItem)
+        """
+
+        self.cancel_find_items()
+        cancel_event = self._find_cancel_event = threading.Event()
+
+        path = path_utils.normalize_path(path)
+        max_workers = max_workers or min(32, multiprocessing.cpu_count() + 4)
+        tasks = queue.Queue()
+        results = queue.Queue()
+
+        def _worker():
+            while True:
+                task = tasks.get()
+                if task is None:
+                    break
+                folder_path, level = task
+                entries = None if cancel_event.is_set() else self._scan_folder(folder_path)
+                results.put((folder_path, level, entries))
+
+        workers = list()
+        for _ in range(max_workers):
+            worker = threading.Thread(target=_worker, name='LibraryManager.find_items')
+            worker.daemon = True
+            worker.start()
+            workers.append(worker)
+
+        # Real paths of the visited folders, used to avoid walking symlink loops more than once
+        visited = set([os.path.realpath(path)])
+        found_items = list()
+        tasks.put((path, 0))
+        pending = 1
+        try:
+            while pending and not cancel_event.is_set():
+                folder_path, level, entries = results.get()
+                pending -= 1
+                if not entries:
+                    continue
+                walk_nested = depth != 1 and level < depth
+                for entry_name, is_dir, real_path in entries:
+                    if cancel_event.is_set():
+                        break
+                    entry_path = os.path.join(folder_path, entry_name)
+                    item = self.item_from_path(entry_path, **kwargs)
+                    if item:
+                        self._index.add_item(item)
+                        found_items.append(item)
+                        yield item
+                        if not item.EnableNestedItems:
+                            continue
+                    if not is_dir or not walk_nested or real_path in visited:
+                        continue
+                    visited.add(real_path)
+                    tasks.put((entry_path, level + 1))
+                    pending += 1
+            if prune and not cancel_event.is_set():
+                self._index.prune(found_items, root=path)
+        finally:
+            cancel_event.set()
+            if self._find_cancel_event is cancel_event:
+                self._find_cancel_event = None
+            for _ in workers:
+                tasks.put(None)
+
+    def _scan_folder(self, folder_path):
+        """
+        Internal function that lists the given folder. Files are returned before folders, as os.walk based search does
+        :param folder_path: str
+        :return: list(tuple(str, bool, str)), name, whether the entry is a folder and real path of folder entries
+        """
+
+        try:
+            if hasattr(os, 'scandir'):
+                entries = [(entry.name, entry.is_dir()) for entry in os.scandir(folder_path)]
+            else:
+                entries = [(name, os.path.isdir(os.path.join(folder_path, name))) for name in os.listdir(folder_path)]
+        except OSError as exc:
+            LOGGER.debug('Impossible to list folder "{}": {}'.format(folder_path, exc))
+            return list()
+
+        files = [(name, False, None) for name, is_dir in entries if not is_dir]
+        folders = [
+            (name, True, os.path.realpath(os.path.join(folder_path, name))) for name, is_dir in entries if is_dir]
+
+        return files + folders
+
 
 class LibraryDataFolder(fileio.FileManager, object):
     def __init__(self, name, file_path, data_path=None):
@@ -0,0 +1,593 @@
+#! /usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Module that contains query engine used to search library items
+"""
+
+from __future__ import print_function, division, absolute_import
+
+import os
+import re
+import time
+import logging
+from collections import OrderedDict
+
+from tpDcc.libs.python import python, path as path_utils
+
+LOGGER = logging.getLogger('tpDcc-libs-qt')
+
+SEARCH_FIELD = '*'
+TOKEN_SPLIT_REGEX = re.compile(r'[\W_]+', re.UNICODE)
+CONDITIONS = ('is', 'not', 'contains', 'not_contains', 'startswith')
+GRAM_SIZE = 3
+
+
+def tokenize(value):
+    """
+    Splits given value into lower case search tokens
+    >>> tokenize('C:/Library/Walk_Cycle.anim')
+    >>> ['c', 'library', 'walk', 'cycle', 'anim']
+    :param value: str
+    :return: list(str)
+    """
+
+    return [token for token in TOKEN_SPLIT_REGEX.split(normalize_value(value)) if token]
+
+
+def normalize_value(value):
+    """
+    Returns the value used to index and compare the given item field value
+    :param value: variant
+    :return: str
+    """
+
+    if not python.is_string(value):
+        value = str(value)
+
+    return value.lower()
+
+
+def parse_query(text):
+    """
+    Parses given search text into a list of queries, where any of them must match
+    Terms in the same query must all match. Supported terms:
+        - walk: any field contains walk
+        - name:walk: name field contains walk
+        - type=anim: type field is anim
+        - name^=walk: name field starts with walk
+        - -walk or -name:walk: field does not contain walk
+    >>> parse_query('type=anim name:walk OR tags:locomotion')
+    :param text: str
+    :return: list(dict)
+    """
+
+    queries = list()
+    filters = list()
+    for word in text.split():
+        if word == 'OR':
+            if filters:
+                queries.append({'operator': 'and', 'filters': filters})
+            filters = list()
+            continue
+        elif word == 'AND':
+            continue
+
+        negate = word.startswith('-') and len(word) > 1
+        if negate:
+            word = word[1:]
+
+        field, condition, value = SEARCH_FIELD, 'contains', word
+        for separator, separator_condition in (('^=', 'startswith'), ('=', 'is'), (':', 'contains')):
+            if separator not in word:
+                continue
+            word_field, word_value = word.split(separator, 1)
+            if word_field and word_value:
+                field, condition, value = word_field.lower(), separator_condition, word_value
+            break
+
+        if negate:
+            condition = 'not_contains' if condition == 'contains' else 'not'
+
+        filters.append((field, condition, value))
+
+    if filters:
+        queries.append({'operator': 'and', 'filters': filters})
+
+    return queries
+
+
+class LibraryIndex(object):
+    """
+    Inverted index of library items
+    Items are indexed by their item data (name, path, type, folder, category, tags, ...) and their metadata, so
+    queries only visit the items sharing a token with the searched value instead of every item in the library
+    """
+
+    def __init__(self):
+        super(LibraryIndex, self).__init__()
+
+        self._items = OrderedDict()
+        self._data = dict()
+        self._values = dict()
+        self._tokens = dict()
+        self._grams = dict()
+        self._search_time = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def __contains__(self, item):
+        return self._item_id(item) in self._items
+
+    # ============================================================================================================
+    # BASE
+    # ============================================================================================================
+
+    def items(self):
+        """
+        Returns all indexed items
+        :return: list(LibraryItem)
+        """
+
+        return list(self._items.values())
+
+    def item(self, path):
+        """
+        Returns the indexed item with the given path
+        :param path: str
+        :return: LibraryItem or None
+        """
+
+        return self._items.get(self._item_id(path))
+
+    def fields(self):
+        """
+        Returns all the indexed fields
+        :return: list(str)
+        """
+
+        return sorted(self._values.keys())
+
+    def search_time(self):
+        """
+        Returns the time taken to run the last search
+        :return: float
+        """
+
+        return self._search_time
+
+    def clear(self):
+        """
+        Removes all items from the index
+        """
+
+        self._items.clear()
+        self._data.clear()
+        self._values.clear()
+        self._tokens.clear()
+        self._grams.clear()
+
+    def add_item(self, item):
+        """
+        Adds given item into the index. If the item is already indexed, its entries are updated
+        :param item: LibraryItem
+        """
+
+        item_id = self._item_id(item)
+        if item_id in self._items:
+            self._unindex(item_id)
+
+        self._items[item_id] = item
+        self._index(item_id, self._item_fields(item))
+
+    def add_items(self, items):
+        """
+        Adds given items into the index
+        :param items: list(LibraryItem)
+        """
+
+        for item in items:
+            self.add_item(item)
+
+    def update_item(self, item):
+        """
+        Updates the index entries of the given item
+        :param item: LibraryItem
+        """
+
+        self.add_item(item)
+
+    def remove_item(self, item):
+        """
+        Removes given item from the index
+        :param item: LibraryItem or str
+        :return: bool
+        """
+
+        item_id = self._item_id(item)
+        if item_id not in self._items:
+            return False
+
+        self._unindex(item_id)
+        self._items.pop(item_id)
+
+        return True
+
+    def remove_paths(self, paths):
+        """
+        Removes the items located in the given paths, including the ones nested inside them
+        :param paths: list(str)
+        """
+
+        for path in paths:
+            for item_id in self._nested_ids(self._item_id(path)):
+                self.remove_item(item_id)
+
+    def prune(self, items, root=None):
+        """
+        Removes the indexed items that are not in the given list
+        :param items: list(LibraryItem or str), items that must be kept in the index
+        :param root: str or None, if given, only items located in this path are removed
+        """
+
+        keep_ids = set(self._item_id(item) for item in items)
+        item_ids = self._nested_ids(self._item_id(root)) if root else list(self._items.keys())
+        for item_id in item_ids:
+            if item_id not in keep_ids:
+                self.remove_item(item_id)
+
+    def rename_path(self, source, target):
+        """
+        Updates the index entries of the items located in the source path, including the ones nested inside it,
+        so they point to the target path
+        :param source: str
+        :param target: str
+        """
+
+        source = self._item_id(source)
+        target = self._item_id(target)
+        for item_id in self._nested_ids(source):
+            item = self._items.pop(item_id)
+            fields = self._data[item_id]
+            self._unindex(item_id)
+
+            new_path = target + item_id[len(source):]
+            dirname = os.path.dirname(new_path)
+            fields.update(
+                path=new_path, folder=dirname, name=os.path.basename(new_path), category=os.path.basename(dirname))
+            self._items[new_path] = item
+            self._index(new_path, fields)
+
+    # ============================================================================================================
+    # QUERIES
+    # ============================================================================================================
+
+    def search(self, text, sort_by=None):
+        """
+        Returns the items matching the given search text
+        >>> search('type=anim name:walk OR tags:locomotion', sort_by=['name:asc'])
+        :param text: str
+        :param sort_by: list(str) or None
+        :return: list(LibraryItem)
+        """
+
+        queries = parse_query(text)
+        if not queries:
+            return self.sorted(list(self._items.keys()), sort_by)
+
+        start_time = time.time()
+        item_ids = set()
+        for query in queries:
+            item_ids.update(self.match(query))
+        results = self.sorted(item_ids, sort_by)
+        self._search_time = time.time() - start_time
+
+        return results
+
+    def find_items(self, queries, sort_by=None):
+        """
+        Returns the items matching all the given queries
+        >>> find_items([{
+        >>>    'operator': 'or',
+        >>>    'filters': [
+        >>>        ('folder', 'is', '/lib/proj/test'),
+        >>>        ('folder', 'startswith', '/lib/proj/test'),
+        >>>    ]
+        >>>}])
+        :param queries: list(dict)
+        :param sort_by: list(str) or None
+        :return: list(LibraryItem)
+        """
+
+        start_time = time.time()
+        item_ids = None
+        for query in queries:
+            if not query.get('filters'):
+                continue
+            query_ids = self.match(query)
+            item_ids = query_ids if item_ids is None else item_ids & query_ids
+            if not item_ids:
+                break
+        if item_ids is None:
+            item_ids = self._items.keys()
+        results = self.sorted(item_ids, sort_by)
+        self._search_time = time.time() - start_time
+
+        return results
+
+    def match(self, query):
+        """
+        Returns the ids of the items matching the given query
+        :param query: dict
+        :return: set(str)
+        """
+
+        operator = query.get('operator', 'and')
+        item_ids = None
+        for field, condition, value in query.get('filters', list()):
+            filter_ids = self._match_filter(field, condition, value)
+            if item_ids is None:
+                item_ids = filter_ids
+            elif operator == 'or':
+                item_ids |= filter_ids
+            else:
+                item_ids &= filter_ids
+            if operator != 'or' and not item_ids:
+                break
+
+        return item_ids or set()
+
+    def sorted(self, item_ids, sort_by=None):
+        """
+        Returns the items with the given ids sorted by the given fields
+        >>> sorted(item_ids, ['name:asc', 'type:dsc'])
+        :param item_ids: list(str)
+        :param sort_by: list(str) or None
+        :return: list(LibraryItem)
+        """
+
+        item_ids = list(item_ids)
+        if not sort_by:
+            return [self._items[item_id] for item_id in item_ids]
+
+        for field in reversed(sort_by):
+            tokens = field.split(':')
+            reverse = False
+            if len(tokens) > 1:
+                field = tokens[0]
+                reverse = tokens[1] != 'asc'
+
+            def sort_key(item_id):
+                values = self._data[item_id].get(field)
+                return normalize_value(python.force_list(values)[0]) if values not in (None, '', []) else ''
+
+            item_ids.sort(key=sort_key, reverse=reverse)
+
+        return [self._items[item_id] for item_id in item_ids]
+
+    def distinct(self, field, queries=None, sort_by='name'):
+        """
+        Returns all values of the given field with the number of items having them
+        :param field: str
+        :param queries: list(dict) or None, if given, only the items matching the queries are counted
+        :param sort_by: str, 'name' or 'count'
+        :return: list(dict)
+        """
+
+        item_ids = None
+        if queries:
+            item_ids = set(self._item_id(item) for item in self.find_items(queries))
+
+        results = list()
+        for value, value_ids in self._values.get(field, dict()).items():
+            count = len(value_ids) if item_ids is None else len(value_ids & item_ids)
+            results.append({'name': value, 'count': count})
+
+        return sorted(results, key=lambda facet: facet.get(sort_by))
+
+    # ============================================================================================================
+    # INTERNAL
+    # ============================================================================================================
+
+    def _item_id(self, item):
+        """
+        Internal function that returns the key used to index given item
+        :param item: LibraryItem or str
+        :return: str
+        """
+
+        path = item if python.is_string(item) else item.path()
+
+        return path_utils.normalize_path(path)
+
+    def _item_fields(self, item):
+        """
+        Internal function that returns the fields of the given item that are indexed
+        :param item: LibraryItem
+        :return: dict
+        """
+
+        fields = dict()
+        metadata = item.metadata() if hasattr(item, 'metadata') else None
+        if isinstance(metadata, dict):
+            fields.update(metadata)
+        fields.update(item.item_data() or dict())
+
+        return fields
+
+    def _nested_ids(self, item_id):
+        """
+        Internal function that returns the indexed ids equal to or nested inside the given one
+        :param item_id: str
+        :return: list(str)
+        """
+
+        prefix = item_id.rstrip('/') + '/'
+
+        return [key for key in self._items.keys() if key == item_id or key.startswith(prefix)]
+
+    def _index(self, item_id, fields):
+        """
+        Internal function that adds the given item fields into the postings of the index
+        :param item_id: str
+        :param fields: dict
+        """
+
+        self._data[item_id] = fields
+        for field, values in fields.items():
+            if isinstance(values, dict):
+                continue
+            field_values = self._values.setdefault(field, dict())
+            field_tokens = self._tokens.setdefault(field, dict())
+            field_grams = self._grams.setdefault(field, dict())
+            for value in python.force_list(values):
+                if value is None:
+                    continue
+                value = normalize_value(value)
+                field_values.setdefault(value, set()).add(item_id)
+                for token in tokenize(value):
+                    if token not in field_tokens:
+                        for gram in self._token_grams(token):
+                            field_grams.setdefault(gram, set()).add(token)
+                    field_tokens.setdefault(token, set()).add(item_id)
+
+    def _unindex(self, item_id):
+        """
+        Internal function that removes the given item from the postings of the index
+        :param item_id: str
+        """
+
+        fields = self._data.pop(item_id, dict())
+        for field, values in fields.items():
+            if isinstance(values, dict):
+                continue
+            field_values = self._values.get(field, dict())
+            field_tokens = self._tokens.get(field, dict())
+            field_grams = self._grams.get(field, dict())
+            for value in python.force_list(values):
+                if value is None:
+                    continue
+                value = normalize_value(value)
+                self._discard(field_values, value, item_id)
+                for token in tokenize(value):
+                    self._discard(field_tokens, token, item_id)
+                    if token not in field_tokens:
+                        for gram in self._token_grams(token):
+                            self._discard(field_grams, gram, token)
+
+    def _discard(self, postings, key, item_id):
+        """
+        Internal function that removes given item id from the given postings, removing empty entries
+        :param postings: dict(str, set(str))
+        :param key: str
+        :param item_id: str
+        """
+
+        key_ids = postings.get(key)
+        if key_ids is None:
+            return
+        key_ids.discard(item_id)
+        if not key_ids:
+            postings.pop(key)
+
+    def _match_filter(self, field, condition, value):
+        """
+        Internal function that returns the ids of the items matching the given filter
+        :param field: str, field name or '*' to match any field
+        :param condition: str, one of CONDITIONS
+        :param value: variant
+        :return: set(str)
+        """
+
+        if condition not in CONDITIONS:
+            LOGGER.warning('Query condition "{}" is not supported: {}'.format(condition, CONDITIONS))
+            return set()
+
+        if condition in ('not', 'not_contains'):
+            positive = 'is' if condition == 'not' else 'contains'
+            return set(self._items.keys()) - self._match_filter(field, positive, value)
+
+        value = normalize_value(value)
+        fields = self._values.keys() if field == SEARCH_FIELD else [field]
+        item_ids = set()
+        for field_name in fields:
+            field_values = self._values.get(field_name)
+            if not field_values:
+                continue
+            if condition == 'is':
+                item_ids.update(field_values.get(value, ()))
+            elif condition == 'startswith':
+                for field_value, value_ids in field_values.items():
+                    if field_value.startswith(value):
+                        item_ids.update(value_ids)
+            else:
+                item_ids.update(self._match_contains(field_name, value))
+
+        return item_ids
+
+    def _match_contains(self, field, value):
+        """
+        Internal function that returns the ids of the items whose field contains the given value
+        Candidates are gathered from the token postings and then verified against the full field values
+        :param field: str
+        :param value: str
+        :return: set(str)
+        """
+
+        field_tokens = self._tokens.get(field, dict())
+        candidates = None
+        for query_token in tokenize(value):
+            token_ids = set()
+            for token in self._tokens_containing(field, query_token):
+                token_ids.update(field_tokens.get(token, ()))
+            candidates = token_ids if candidates is None else candidates & token_ids
+            if not candidates:
+                return set()
+
+        if candidates is None:
+            candidates = set(self._items.keys())
+
+        item_ids = set()
+        for item_id in candidates:
+            for field_value in python.force_list(self._data[item_id].get(field)):
+                if field_value is not None and value in normalize_value(field_value):
+                    item_ids.add(item_id)
+                    break
+
+        return item_ids
+
+    def _token_grams(self, token):
+        """
+        Internal function that returns all the substrings of the given token up to GRAM_SIZE characters
+        :param token: str
+        :return: set(str)
+        """
+
+        return set(
+            token[i:i + size] for size in range(1, GRAM_SIZE + 1) for i in range(len(token) - size + 1))
+
+    def _tokens_containing(self, field, query_token):
+        """
+        Internal function that returns the indexed tokens of the given field that contain the given token
+        Short tokens are looked up directly in the n-gram postings. Longer ones intersect the postings of their
+        n-grams and the remaining candidates are verified
+        :param field: str
+        :param query_token: str
+        :return: set(str)
+        """
+
+        field_grams = self._grams.get(field, dict())
+        if len(query_token) <= GRAM_SIZE:
+            return set(field_grams.get(query_token, ()))
+
+        tokens = None
+        for i in range(len(query_token) - GRAM_SIZE + 1):
+            gram_tokens = field_grams.get(query_token[i:i + GRAM_SIZE])
+            if not gram_tokens:
+                return set()
+            tokens = set(gram_tokens) if tokens is None else tokens & gram_tokens
+            if not tokens:
+                return set()
+
+        return set(token for token in tokens if query_token in token)
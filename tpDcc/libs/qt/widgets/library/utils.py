@@ -134,15 +134,22 @@ class Node(object):
 
 
 class TransferObject(object):
+    """
+    Class that stores and restores objects data into JSON files
+    Files are written object by object, after a small header section that stores the number of objects and their
+    namespaces. Transfer objects created with lazy flag only read that header, so object_count() and namespaces()
+    can be answered without parsing all the objects attribute data. Full data is read the first time it is needed.
+    """
 
     DEFAULT_DATA = {'metadata': {}, 'objects': {}}
 
     @classmethod
-    def from_path(cls, path, force_creation=False):
+    def from_path(cls, path, force_creation=False, lazy=False):
         """
         Returns a new transfer instance for the given path
         :param path: str
         :param force_creation: bool
+        :param lazy: bool, whether to only read file header until objects data is needed
         :return: TransferObject
         """
 
@@ -160,7 +167,10 @@ class TransferObject(object):
                     os.makedirs(filedir)
             fileio.create_file(filename, filedir)
 
-        t.read()
+        if lazy:
+            t.read_header()
+        else:
+            t.read()
 
         return t
 
@@ -194,9 +204,35 @@ class TransferObject(object):
 
         return data
 
+    @staticmethod
+    def read_json_header(path):
+        """
+        Reads the top level sections of the given JSON transfer path that are stored before the objects section
+        Only the lines before the objects section are read and parsed
+        :param path: str
+        :return: dict or None, None if the header could not be read
+        """
+
+        header_lines = list()
+        with open(path, 'r') as f:
+            for line in f:
+                if line.startswith('"objects":') or line.startswith('  "objects":'):
+                    break
+                header_lines.append(line)
+            else:
+                return None
+
+        header_data = ''.join(header_lines).rstrip().rstrip(',')
+        try:
+            return json.loads(header_data + '}')
+        except ValueError:
+            return None
+
     def __init__(self):
         self._path = None
         self._namespaces = None
+        self._header = None
+        self._loaded = True
         self._data = deepcopy(self.DEFAULT_DATA)
 
     @abc.abstractmethod
@@ -256,6 +292,9 @@ class TransferObject(object):
         :return: dict
         """
 
+        if not self._loaded:
+            self.read()
+
         return self._data
 
     def set_data(self, data):
@@ -264,6 +303,9 @@ class TransferObject(object):
         :param data: dict
         """
 
+        self._loaded = True
+        self._header = None
+        self._namespaces = None
         if not data:
             self._data = self.DEFAULT_DATA
         else:
@@ -302,8 +344,11 @@ class TransferObject(object):
         """
 
         if self._namespaces is None:
-            group = group_objects(self.objects())
-            self._namespaces = group.keys()
+            if not self._loaded and self._header and 'namespaces' in self._header:
+                self._namespaces = self._header['namespaces']
+            else:
+                group = group_objects(self.objects())
+                self._namespaces = list(group.keys())
 
         return self._namespaces
 
@@ -313,8 +358,20 @@ class TransferObject(object):
         :return: int
         """
 
+        if not self._loaded and self._header and 'objectCount' in self._header:
+            return self._header['objectCount']
+
         return len(self.objects() or list())
 
+    def object_count(self):
+        """
+        Returns the number of objects in the transfer object
+        If the transfer object was lazily read, the number stored in the file header is returned
+        :return: int
+        """
+
+        return self.count()
+
     def add(self, objects):
         """
         Adds the given objects to the transfer object
@@ -343,7 +400,10 @@ class TransferObject(object):
         :return: dict
         """
 
-        return self.data().get('metadata', dict())
+        # Metadata is always read, even when transfer object is lazily loaded, so no need to load objects data
+        data = self._data if not self._loaded else self.data()
+
+        return data.get('metadata', dict())
 
     def set_metadata(self, key, value):
         """
@@ -376,6 +436,28 @@ class TransferObject(object):
             data = dict()
         self.set_data(data)
 
+    def read_header(self, path=''):
+        """
+        Reads only the header and metadata sections from the path set on the Transfer Object
+        Objects data will be read the first time it is accessed
+        :param path: str
+        """
+
+        path = path or self.path()
+        try:
+            header_data = self.read_json_header(path)
+        except Exception:
+            header_data = None
+        if header_data is None:
+            self.read(path)
+            return
+
+        self._loaded = False
+        self._namespaces = None
+        self._header = header_data.get('header', dict())
+        self._data = deepcopy(self.DEFAULT_DATA)
+        self._data['metadata'] = header_data.get('metadata', dict())
+
     def dump(self, data=None):
         """
         Dumps JSON info
@@ -394,6 +476,21 @@ class TransferObject(object):
         :return: dict
         """
 
+        self.update_save_metadata()
+
+        metadata = {'metadata': self.metadata()}
+        data = self.dump(metadata)[:-1] + ','
+
+        objects = {'objects': self.objects()}
+        data += self.dump(objects)[1:]
+
+        return data
+
+    def update_save_metadata(self):
+        """
+        Updates the metadata that is stored each time the transfer object is saved
+        """
+
         encoding = locale.getpreferredencoding()
         user = getpass.getuser()
         if user:
@@ -408,13 +505,42 @@ class TransferObject(object):
         self.set_metadata('mayaVersion', str(dcc.get_version())),
         self.set_metadata('mayaSceneFile', dcc.scene_name())
 
-        metadata = {'metadata': self.metadata()}
-        data = self.dump(metadata)[:-1] + ','
+    def header(self):
+        """
+        Returns the header data stored before objects data, used to query objects info without reading them
+        :return: dict
+        """
 
-        objects = {'objects': self.objects()}
-        data += self.dump(objects)[1:]
+        if not self._loaded and self._header is not None:
+            return self._header
 
-        return data
+        objects = self.objects()
+        namespaces = set(':'.join(name.split('|')[-1].split(':')[:-1]) for name in objects)
+
+        return {'objectCount': len(objects), 'namespaces': sorted(namespaces)}
+
+    def iterate_save_chunks(self):
+        """
+        Generator that yields the JSON text to save, object by object, so the full file contents are never built
+        in memory. Header section is written before objects section so it can be read without parsing objects.
+        :return: generator(str)
+        """
+
+        self.update_save_metadata()
+
+        yield '{\n"metadata": '
+        yield json.dumps(self.metadata())
+        yield ',\n"header": '
+        yield json.dumps(self.header())
+        yield ',\n"objects": {'
+        separator = '\n'
+        for name, object_data in self.objects().items():
+            yield separator
+            yield json.dumps(name)
+            yield ': '
+            yield json.dumps(object_data)
+            separator = ',\n'
+        yield '\n}\n}\n'
 
     @decorators.show_wait_cursor
     def save(self, path=None):
@@ -425,14 +551,19 @@ class TransferObject(object):
 
         LOGGER.info('Saving object: {}'.format(path))
 
-        data = self.data_to_save()
-
         dirname = os.path.dirname(path)
         if not os.path.exists(dirname):
             os.makedirs(dirname)
 
-        with open(path, 'w') as f:
-            f.write(str(data))
+        # Classes that customize data to save store their data as it is. Otherwise data is streamed into disk.
+        if type(self).data_to_save != TransferObject.data_to_save:
+            data = self.data_to_save()
+            with open(path, 'w') as f:
+                f.write(str(data))
+        else:
+            with open(path, 'w') as f:
+                for chunk in self.iterate_save_chunks():
+                    f.write(chunk)
 
         LOGGER.debug('Saved object: {}'.format(path))
 
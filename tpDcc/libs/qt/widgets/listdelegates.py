@@ -8,72 +8,186 @@ Module that contains delegates that can be used to customize how data is rendere
 from __future__ import print_function, division, absolute_import
 
 import os
+from collections import OrderedDict
 
 from Qt.QtCore import Qt, QPoint, QPointF, QRect, QRectF, QSize
 from Qt.QtWidgets import QStyle, QStyledItemDelegate
-from Qt.QtGui import QFontMetrics, QColor, QPalette, QTextOption, QPainter, QPen
+from Qt.QtGui import QFont, QFontMetrics, QColor, QPalette, QTextOption, QPainter, QPen
 
 
 class BaseListViewDelegate(QStyledItemDelegate, object):
     """
     Base delegate for list view widgets
+    Data derived from each index (elided text, size text and scaled pixmap) is cached until the model data changes,
+    so scrolling only repaints cached resources
     """
 
     _ICON_MARGIN = 4
+    _CACHE_SIZE = 1024
+
+    def __init__(self, parent=None):
+        super(BaseListViewDelegate, self).__init__(parent)
+
+        self._model = None
+        self._cache = OrderedDict()
+        self._font_key = None
+        self._font_metrics = None
+        self._size_font = None
+        self._size_font_metrics = None
+        self._text_option = QTextOption()
+        self._text_option.setAlignment(Qt.AlignHCenter)
+        self._background_color = QColor(22, 22, 22, 220)
+        self._selected_pen = QPen(Qt.red, 1.0, Qt.SolidLine, Qt.SquareCap, Qt.RoundJoin)
 
     # region Override Functions
     def paint(self, painter, option, index):
 
         painter.setRenderHints(QPainter.Antialiasing | QPainter.SmoothPixmapTransform)
-        model = index.model()
         view = self.parent()
+        icon_size = view.iconSize()
+        text, size_text, size_rect, pixmap = self._index_data(index, view, icon_size)
 
         if view.hasFocus() and option.state & QStyle.State_MouseOver:
             painter.setPen(Qt.NoPen)
             painter.setBrush(Qt.gray)
             painter.drawRoundedRect(option.rect.adjusted(1, 1, -1, -1), self._ICON_MARGIN, self._ICON_MARGIN)
 
-        pixmap = model.data(index, Qt.DecorationRole).pixmap(view.iconSize())
         pm_rect = QRect(option.rect.topLeft() + QPoint(self._ICON_MARGIN + 1, self._ICON_MARGIN + 1),
-                        view.iconSize() - QSize(self._ICON_MARGIN * 2, self._ICON_MARGIN * 2))
+                        icon_size - QSize(self._ICON_MARGIN * 2, self._ICON_MARGIN * 2))
         painter.drawPixmap(pm_rect, pixmap)
         if option.state & QStyle.State_Selected:
-            painter.setPen(QPen(Qt.red, 1.0, Qt.SolidLine, Qt.SquareCap, Qt.RoundJoin))
+            painter.setPen(self._selected_pen)
             painter.setBrush(Qt.NoBrush)
             painter.drawRect(option.rect.adjusted(2, 2, -2, -2))
 
-        font = view.font()
-        fm = QFontMetrics(font)
-        text = os.path.splitext(os.path.basename(model.data(index, Qt.DisplayRole)))[0]
-        text = fm.elidedText(text, Qt.ElideRight, view.iconSize().width() - 4)
-        text_opt = QTextOption()
-        text_opt.setAlignment(Qt.AlignHCenter)
         txt_rect = QRectF(
             QPointF(pm_rect.bottomLeft() + QPoint(0, 1)), QPointF(option.rect.bottomRight() - QPoint(4, 3)))
 
         painter.save()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(22, 22, 22, 220))
+        painter.setBrush(self._background_color)
         painter.drawRoundedRect(txt_rect.adjusted(-2, -2, 2, 2), 2, 2)
         painter.restore()
-        painter.setPen(self.parent().palette().color(QPalette.WindowText))
-        painter.drawText(txt_rect, text, text_opt)
+        painter.setPen(view.palette().color(QPalette.WindowText))
+        painter.drawText(txt_rect, text, self._text_option)
 
-        font.setPointSize(8)
-        fm = QFontMetrics(font)
-        item = model.itemFromIndex(index)
-        size_text = '%d x %d' % (item.size.width(), item.size.height())
-        size_rect = fm.boundingRect(option.rect, Qt.AlignLeft | Qt.AlignTop, size_text)
-        size_rect.translate(4, 4)
+        size_rect = size_rect.translated(option.rect.topLeft() + QPoint(4, 4))
 
         painter.save()
         painter.setPen(Qt.NoPen)
-        painter.setBrush(QColor(22, 22, 22, 220))
+        painter.setBrush(self._background_color)
         painter.drawRoundedRect(size_rect.adjusted(-2, -2, 2, 2), 2, 2)
         painter.restore()
-        painter.setFont(font)
+        painter.setFont(self._size_font)
         painter.drawText(size_rect, size_text)
 
     def sizeHint(self, option, index):
         view = self.parent()
         return view.iconSize() + QSize(2, 14)
+    # endregion
+
+    # region Public Functions
+    def clear_cache(self):
+        """
+        Removes all cached index data
+        """
+
+        self._cache.clear()
+    # endregion
+
+    # region Private Functions
+    def _update_fonts(self, font):
+        """
+        Internal function that updates the fonts and font metrics used to paint if the view font changed
+        :param font: QFont
+        :return: bool, True if the fonts changed; False otherwise
+        """
+
+        font_key = font.key()
+        if font_key == self._font_key:
+            return False
+
+        self._font_key = font_key
+        self._font_metrics = QFontMetrics(font)
+        self._size_font = QFont(font)
+        self._size_font.setPointSize(8)
+        self._size_font_metrics = QFontMetrics(self._size_font)
+
+        return True
+
+    def _watch_model(self, model):
+        """
+        Internal function that connects to the given model signals to invalidate cached data
+        :param model: QAbstractItemModel
+        """
+
+        if model is self._model:
+            return
+
+        if self._model is not None:
+            try:
+                self._model.dataChanged.disconnect(self._on_data_changed)
+                for model_signal in (
+                        self._model.modelReset, self._model.layoutChanged, self._model.rowsInserted,
+                        self._model.rowsRemoved, self._model.rowsMoved):
+                    model_signal.disconnect(self.clear_cache)
+            except (RuntimeError, TypeError):
+                pass
+
+        self._model = model
+        self._cache.clear()
+        model.dataChanged.connect(self._on_data_changed)
+        for model_signal in (
+                model.modelReset, model.layoutChanged, model.rowsInserted, model.rowsRemoved, model.rowsMoved):
+            model_signal.connect(self.clear_cache)
+
+    def _index_data(self, index, view, icon_size):
+        """
+        Internal function that returns the data used to paint the given index, computing it if it is not cached
+        :param index: QModelIndex
+        :param view: QListView
+        :param icon_size: QSize
+        :return: tuple(str, str, QRect, QPixmap), elided text, size text, size text rect and scaled pixmap
+        """
+
+        model = index.model()
+        self._watch_model(model)
+        if self._update_fonts(view.font()):
+            self._cache.clear()
+
+        cache_key = (index.row(), index.column(), index.internalId(), icon_size.width(), icon_size.height())
+        index_data = self._cache.pop(cache_key, None)
+        if index_data is not None:
+            self._cache[cache_key] = index_data
+            return index_data
+
+        pixmap = model.data(index, Qt.DecorationRole).pixmap(icon_size)
+        text = os.path.splitext(os.path.basename(model.data(index, Qt.DisplayRole)))[0]
+        text = self._font_metrics.elidedText(text, Qt.ElideRight, icon_size.width() - 4)
+        item = model.itemFromIndex(index)
+        size_text = '%d x %d' % (item.size.width(), item.size.height())
+        size_rect = self._size_font_metrics.boundingRect(
+            QRect(QPoint(0, 0), icon_size + QSize(2, 14)), Qt.AlignLeft | Qt.AlignTop, size_text)
+
+        if len(self._cache) >= self._CACHE_SIZE:
+            self._cache.popitem(last=False)
+        index_data = self._cache[cache_key] = (text, size_text, size_rect, pixmap)
+
+        return index_data
+    # endregion
+
+    # region Callbacks
+    def _on_data_changed(self, top_left, bottom_right, *args):
+        """
+        Internal callback function that is called when model data changes
+        Removes the cached data of the changed indices
+        :param top_left: QModelIndex
+        :param bottom_right: QModelIndex
+        """
+
+        first_row, last_row = top_left.row(), bottom_right.row()
+        first_column, last_column = top_left.column(), bottom_right.column()
+        for cache_key in list(self._cache.keys()):
+            if first_row <= cache_key[0] <= last_row and first_column <= cache_key[1] <= last_column:
+                self._cache.pop(cache_key)
+    # endregion
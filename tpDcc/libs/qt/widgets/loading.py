@@ -7,8 +7,8 @@ Module that contains implementation for loading widgets
 
 from __future__ import print_function, division, absolute_import
 
-from Qt.QtCore import Qt, Property, QSize, QPropertyAnimation
-from Qt.QtGui import QPainter
+from Qt.QtCore import Qt, Property, QSize, QPropertyAnimation, QAbstractAnimation
+from Qt.QtGui import QPainter, QPixmap, QColor
 
 from tpDcc.managers import resources
 from tpDcc.libs.resources.core import theme
@@ -17,6 +17,16 @@ from tpDcc.libs.qt.core import base
 
 @theme.mixin
 class CircleLoading(base.BaseWidget, object):
+    """
+    Spinning loading widget
+    Rotation frames are pre-rendered once per size, color and device pixel ratio and shared between all instances,
+    so painting only needs to blit the current frame
+    """
+
+    FRAME_COUNT = 36
+
+    _FRAMES_CACHE = dict()
+
     def __init__(self, size=None, color=None, speed=1, parent=None):
         super(CircleLoading, self).__init__(parent=parent)
 
@@ -24,8 +34,9 @@ class CircleLoading(base.BaseWidget, object):
         self.setFixedSize(QSize(size, size))
 
         self._rotation = 0
-        self._loading_pixmap =resources.pixmap(
-            'loading', extension='svg', color=color or self.accent_color()).scaledToWidth(size, Qt.SmoothTransformation)
+        self._frame = 0
+        self._frames = None
+        self._color = color or self.accent_color()
         self._loading_anim = QPropertyAnimation()
         self._loading_anim.setTargetObject(self)
         self._loading_anim.setDuration(1000 * (1 / speed))
@@ -41,7 +52,10 @@ class CircleLoading(base.BaseWidget, object):
 
     def _set_rotation(self, value):
         self._rotation = value
-        self.update()
+        frame = int(value * self.FRAME_COUNT / 360) % self.FRAME_COUNT
+        if frame != self._frame:
+            self._frame = frame
+            self.update()
 
     def _get_rotation(self):
         return self._rotation
@@ -53,17 +67,25 @@ class CircleLoading(base.BaseWidget, object):
     # ============================================================================================================
 
     def paintEvent(self, event):
+        frames = self._get_frames()
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.SmoothPixmapTransform)
-        painter.translate(self._loading_pixmap.width() / 2, self._loading_pixmap.height() / 2)
-        painter.rotate(self._rotation)
-        painter.drawPixmap(
-            -self._loading_pixmap.width() / 2, -self._loading_pixmap.height() / 2, self._loading_pixmap.width(),
-            self._loading_pixmap.height(), self._loading_pixmap)
+        painter.drawPixmap(0, 0, frames[self._frame])
         painter.end()
 
         return super(CircleLoading, self).paintEvent(event)
 
+    def showEvent(self, event):
+        if self._loading_anim.state() == QAbstractAnimation.Paused:
+            self._loading_anim.resume()
+        elif self._loading_anim.state() == QAbstractAnimation.Stopped:
+            self._loading_anim.start()
+        super(CircleLoading, self).showEvent(event)
+
+    def hideEvent(self, event):
+        if self._loading_anim.state() == QAbstractAnimation.Running:
+            self._loading_anim.pause()
+        super(CircleLoading, self).hideEvent(event)
+
     # ============================================================================================================
     # BASE
     # ============================================================================================================
@@ -75,7 +97,16 @@ class CircleLoading(base.BaseWidget, object):
         """
 
         self.setFixedSize(QSize(size, size))
-        self._loading_pixmap = self._loading_pixmap.scaledToWidth(size, Qt.SmoothTransformation)
+        self._frames = None
+        self.update()
+
+    @classmethod
+    def clear_frames_cache(cls):
+        """
+        Removes all pre-rendered rotation frames
+        """
+
+        cls._FRAMES_CACHE.clear()
 
     @classmethod
     def tiny(cls, color=None, parent=None):
@@ -156,3 +187,56 @@ class CircleLoading(base.BaseWidget, object):
         loading_widget.set_size(loading_size)
 
         return loading_widget
+
+    # ============================================================================================================
+    # INTERNAL
+    # ============================================================================================================
+
+    def _get_frames(self):
+        """
+        Internal function that returns the rotation frames for the current size, color and device pixel ratio
+        :return: list(QPixmap)
+        """
+
+        size = self.width()
+        dpr = self.devicePixelRatioF() if hasattr(self, 'devicePixelRatioF') else 1.0
+        frames_key = (size, QColor(self._color).name(), dpr)
+        if self._frames is not None and self._frames[0] == frames_key:
+            return self._frames[1]
+
+        frames = self._FRAMES_CACHE.get(frames_key)
+        if frames is None:
+            frames = self._FRAMES_CACHE[frames_key] = self._render_frames(size, dpr)
+        self._frames = (frames_key, frames)
+
+        return frames
+
+    def _render_frames(self, size, dpr):
+        """
+        Internal function that renders all rotation frames of the loading pixmap
+        :param size: int
+        :param dpr: float
+        :return: list(QPixmap)
+        """
+
+        pixel_size = int(round(size * dpr))
+        loading_pixmap = resources.pixmap(
+            'loading', extension='svg', color=self._color).scaledToWidth(pixel_size, Qt.SmoothTransformation)
+
+        frames = list()
+        for i in range(self.FRAME_COUNT):
+            frame = QPixmap(pixel_size, pixel_size)
+            frame.fill(Qt.transparent)
+            painter = QPainter(frame)
+            painter.setRenderHint(QPainter.SmoothPixmapTransform)
+            painter.translate(pixel_size / 2, pixel_size / 2)
+            painter.rotate(i * 360.0 / self.FRAME_COUNT)
+            painter.drawPixmap(
+                -loading_pixmap.width() / 2, -loading_pixmap.height() / 2, loading_pixmap.width(),
+                loading_pixmap.height(), loading_pixmap)
+            painter.end()
+            if hasattr(frame, 'setDevicePixelRatio'):
+                frame.setDevicePixelRatio(dpr)
+            frames.append(frame)
+
+        return frames
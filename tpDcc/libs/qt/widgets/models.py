@@ -17,6 +17,8 @@ from tpDcc.libs.qt.core import qtutils
 class ItemSelection(QItemSelection):
     """
     Extends QItemSelection functionality for view items
+    Selection ranges are kept as ranges: indexes are built lazily and row/count queries work directly over the
+    ranges, so large selections (such as select all) do not need to create an index per selected cell
     """
 
     def __init__(self, *args):
@@ -33,14 +35,122 @@ class ItemSelection(QItemSelection):
         :return: list<QModelIndex>, list of model indexes corresponding to the selected items
         """
 
-        indexes = list()
-        for i in range(self.count()):
-            parent = self[i].parent()
-            for c in range(self[i].left(), self[i].right() + 1):
-                for r in range(self[i].top(), self[i].bottom() + 1):
-                    indexes.append(self[i].model().index(r, c, parent))
+        return list(self.iter_indexes())
 
-        return indexes
+    def iter_indexes(self):
+        """
+        Returns a generator that builds the model indexes corresponding to the selected items one by one
+        :return: generator(QModelIndex)
+        """
+
+        for selection_range in self.ranges():
+            parent = selection_range.parent()
+            index = selection_range.model().index
+            top, bottom = selection_range.top(), selection_range.bottom()
+            for c in range(selection_range.left(), selection_range.right() + 1):
+                for r in range(top, bottom + 1):
+                    yield index(r, c, parent)
+
+    def ranges(self):
+        """
+        Returns selection ranges as a python builtin list
+        :return: list<QItemSelectionRange>
+        """
+
+        return [self[i] for i in range(self.count())]
+
+    def index_count(self):
+        """
+        Returns the number of selected indexes without building them
+        :return: int
+        """
+
+        return sum(selection_range.width() * selection_range.height() for selection_range in self.ranges())
+
+    def row_intervals(self, parent=None):
+        """
+        Returns the sorted and merged intervals of selected rows with the given parent
+        :param parent: QModelIndex or None, parent of the rows. If not given, top level rows are taken into account
+        :return: list<tuple(int, int)>, list of (top, bottom) inclusive row intervals
+        """
+
+        parent = parent if parent is not None else QModelIndex()
+
+        return self._merge_intervals(
+            (selection_range.top(), selection_range.bottom()) for selection_range in self.ranges()
+            if selection_range.parent() == parent)
+
+    def row_intervals_by_parent(self):
+        """
+        Returns the sorted and merged intervals of selected rows grouped by their parent
+        :return: list<tuple(QModelIndex, list<tuple(int, int)>)>, list of (parent, intervals) pairs
+        """
+
+        groups = list()
+        for selection_range in self.ranges():
+            parent = selection_range.parent()
+            for group_parent, intervals in groups:
+                if group_parent == parent:
+                    intervals.append((selection_range.top(), selection_range.bottom()))
+                    break
+            else:
+                groups.append((parent, [(selection_range.top(), selection_range.bottom())]))
+
+        return [(parent, self._merge_intervals(intervals)) for parent, intervals in groups]
+
+    def rows(self, parent=None):
+        """
+        Returns the sorted selected row numbers with the given parent
+        :param parent: QModelIndex or None, parent of the rows. If not given, top level rows are returned
+        :return: list<int>
+        """
+
+        rows = list()
+        for top, bottom in self.row_intervals(parent=parent):
+            rows.extend(range(top, bottom + 1))
+
+        return rows
+
+    def row_count(self, parent=None):
+        """
+        Returns the number of selected rows with the given parent without building them
+        :param parent: QModelIndex or None, parent of the rows. If not given, top level rows are counted
+        :return: int
+        """
+
+        return sum(bottom - top + 1 for top, bottom in self.row_intervals(parent=parent))
+
+    def contains_row(self, row, parent=None):
+        """
+        Returns whether any cell of the given row is selected. The check is done against selection ranges, so its cost
+        does not depend on the number of selected indexes
+        :param row: int
+        :param parent: QModelIndex or None
+        :return: bool
+        """
+
+        parent = parent if parent is not None else QModelIndex()
+        for selection_range in self.ranges():
+            if selection_range.top() <= row <= selection_range.bottom() and selection_range.parent() == parent:
+                return True
+
+        return False
+
+    def _merge_intervals(self, intervals):
+        """
+        Internal function that sorts and merges the given row intervals
+        :param intervals: iterable<tuple(int, int)>
+        :return: list<tuple(int, int)>
+        """
+
+        merged = list()
+        for top, bottom in sorted(intervals):
+            if merged and top <= merged[-1][1] + 1:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], bottom))
+            else:
+                merged.append((top, bottom))
+
+        return merged
 
 
 class ListModel(QAbstractListModel, object):
@@ -8,9 +8,11 @@ Module that contains widget implementation for taking snapshots
 from __future__ import print_function, division, absolute_import
 
 import os
+import sys
 import logging
+import tempfile
 
-from Qt.QtCore import Qt, Signal, QPoint, QRect, QSize
+from Qt.QtCore import Qt, Signal, QObject, QPoint, QRect, QSize, QRunnable, QThreadPool
 from Qt.QtWidgets import QSizePolicy, QWidget, QFrame
 from Qt.QtGui import QResizeEvent
 
@@ -25,13 +27,20 @@ LOGGER = logging.getLogger('tpDcc-libs-qt')
 
 class SnapshotWindow(window.Window(as_class=True), object):
     saved = Signal(str)
+    thumbnailSaved = Signal(str)
 
-    def __init__(self, path=None, image_type='png', width=512, height=512, on_save=None, parent=None):
+    def __init__(
+            self, path=None, image_type='png', width=512, height=512, on_save=None, thumbnail_path=None,
+            thumbnail_size=None, parent=None):
 
         self._default_width = width
         self._default_height = height
         self._save_path = path
         self._image_type = image_type
+        self._thumbnail_path = thumbnail_path
+        self._thumbnail_size = thumbnail_size
+        self._save_workers = list()
+        self._close_on_save = False
         self._keep_aspect = True
         self._locked = False
         self._last_saved_location = None
@@ -163,6 +172,17 @@ class SnapshotWindow(window.Window(as_class=True), object):
 
         self._save_path = file_path
 
+    def set_thumbnail(self, thumbnail_size, thumbnail_path=None):
+        """
+        Sets the size of the thumbnail that is saved alongside the snapshot
+        :param thumbnail_size: QSize or int or None, thumbnail size. If None, no thumbnail will be saved
+        :param thumbnail_path: str or None, path where thumbnail will be saved. If not given, the thumbnail is stored
+            next to the snapshot file with a _thumbnail suffix
+        """
+
+        self._thumbnail_size = thumbnail_size
+        self._thumbnail_path = thumbnail_path
+
     def set_snapshot_size(self, width, height):
         """
         Sets the size of the snapshot widget
@@ -203,28 +223,31 @@ class SnapshotWindow(window.Window(as_class=True), object):
         if not os.path.exists(os.path.dirname(dir_path)):
             os.makedirs(dir_path)
 
+        # Closing the window deletes it, so the window is only hidden while the snapshot is saved in a worker
+        # thread and it is closed once the worker finishes
+        self._close_on_save = True
+        self.hide()
         self.save(self._save_path, self._image_type)
+        if not self._save_workers:
+            self.close()
 
-        self.close()
-
-    def save(self, file_path, image_type='png'):
+    def save(self, file_path, image_type='png', threaded=True):
         """
         Saves screen to a file
+        Image is encoded in a worker thread, written into a temporary file and moved into its final location once
+        written, so a failure while writing never leaves a truncated file. saved signal is emitted on completion.
         :param file_path: str, path to save image into
         :param image_type: str, image type (png or jpg)
+        :param threaded: bool, whether to encode the image in a worker thread or in the current one
         """
 
-        saved = None
         if not file_path:
             LOGGER.error('Path not specificed for snapshot.')
-            self.saved.emit(saved)
+            self.saved.emit(None)
             return
         file_dir, file_name, file_ext = path_utils.split_path(file_path)
         if not os.path.isdir(file_dir):
             folder_utils.create_folder(file_dir)
-        else:
-            if os.path.isfile(file_path):
-                fileio.delete_file(file_path)
 
         image_type = image_type if image_type.startswith('.') else '.{}'.format(image_type)
         if image_type != file_ext:
@@ -237,9 +260,26 @@ class SnapshotWindow(window.Window(as_class=True), object):
             image_type = image_type[1:]
         image_type = image_type.upper()
 
-        saved = self._snapshot_pixmap.save(file_path, image_type)
+        thumbnail_path = None
+        thumbnail_size = self._thumbnail_size
+        if thumbnail_size:
+            if isinstance(thumbnail_size, int):
+                thumbnail_size = QSize(thumbnail_size, thumbnail_size)
+            thumbnail_path = self._thumbnail_path or os.path.join(
+                file_dir, '{}_thumbnail{}'.format(file_name, file_ext))
+
+        # QPixmap can only be used in the GUI thread, so we convert it to an image before sending it to the worker
+        save_worker = SnapshotSaveWorker(
+            self._snapshot_pixmap.toImage(), file_path, image_type, thumbnail_path=thumbnail_path,
+            thumbnail_size=thumbnail_size)
+        save_worker.signals.finished.connect(self._on_snapshot_saved)
         self._last_saved_location = file_path
-        self.saved.emit(file_path if saved else None)
+        if not threaded:
+            save_worker.run()
+            return
+
+        self._save_workers.append(save_worker)
+        QThreadPool.globalInstance().start(save_worker)
 
     def _setup_dragger(self):
         """
@@ -272,6 +312,24 @@ class SnapshotWindow(window.Window(as_class=True), object):
             self._width_line.blockSignals(False)
             self._height_line.blockSignals(False)
 
+    def _on_snapshot_saved(self, save_worker, file_path, thumbnail_path):
+        """
+        Internal callback function that is called when a snapshot save worker finishes
+        :param save_worker: SnapshotSaveWorker
+        :param file_path: str or None, path of the saved snapshot or None if the snapshot was not saved
+        :param thumbnail_path: str or None, path of the saved thumbnail or None if no thumbnail was saved
+        """
+
+        if save_worker in self._save_workers:
+            self._save_workers.remove(save_worker)
+
+        self.saved.emit(file_path)
+        if thumbnail_path:
+            self.thumbnailSaved.emit(thumbnail_path)
+
+        if self._close_on_save and not self._save_workers:
+            self.close()
+
     def _on_toggle_aspect(self):
         """
         Internal callback function that is called when toggle aspect ratio button is clicked by the user
@@ -340,3 +398,72 @@ class SnapshotWindow(window.Window(as_class=True), object):
 
 class SnapshotFrame(QFrame, object):
     pass
+
+
+class SnapshotSaveWorker(QRunnable, object):
+    """
+    Class that encodes and saves a snapshot image in a thread
+    """
+
+    class SnapshotSaveWorkerSignals(QObject, object):
+        finished = Signal(object, object, object)
+
+    def __init__(self, image, file_path, image_type='PNG', thumbnail_path=None, thumbnail_size=None):
+        super(SnapshotSaveWorker, self).__init__()
+
+        self._image = image
+        self._file_path = file_path
+        self._image_type = image_type
+        self._thumbnail_path = thumbnail_path
+        self._thumbnail_size = thumbnail_size
+        self.signals = SnapshotSaveWorker.SnapshotSaveWorkerSignals()
+
+        self.setAutoDelete(False)
+
+    def run(self):
+        """
+        Overrides base QRunnable run function
+        This is the starting point for the thread
+        """
+
+        file_path = None
+        thumbnail_path = None
+        try:
+            if self._write_image(self._image, self._file_path):
+                file_path = self._file_path
+            if file_path and self._thumbnail_path and self._thumbnail_size:
+                thumbnail_image = self._image.scaled(
+                    self._thumbnail_size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+                if self._write_image(thumbnail_image, self._thumbnail_path):
+                    thumbnail_path = self._thumbnail_path
+        except Exception as exc:
+            LOGGER.error('Error while saving snapshot "{}": {}'.format(self._file_path, exc))
+
+        self.signals.finished.emit(self, file_path, thumbnail_path)
+
+    def _write_image(self, image, file_path):
+        """
+        Internal function that writes given image into a temporary file and moves it into the given path
+        :param image: QImage
+        :param file_path: str
+        :return: bool
+        """
+
+        file_dir = os.path.dirname(file_path)
+        file_handle, temp_path = tempfile.mkstemp(suffix=os.path.splitext(file_path)[-1], dir=file_dir)
+        os.close(file_handle)
+        try:
+            if not image.save(temp_path, self._image_type):
+                LOGGER.error('Impossible to encode snapshot image: "{}"'.format(file_path))
+                return False
+            if hasattr(os, 'replace'):
+                os.replace(temp_path, file_path)
+            else:
+                if sys.platform == 'win32' and os.path.isfile(file_path):
+                    fileio.delete_file(file_path)
+                os.rename(temp_path, file_path)
+        finally:
+            if os.path.isfile(temp_path):
+                os.remove(temp_path)
+
+        return True
@@ -9,7 +9,7 @@ from __future__ import print_function, division, absolute_import
 
 import string
 
-from Qt.QtCore import Qt, Signal, QRect, QSize, QModelIndex
+from Qt.QtCore import Qt, Signal, QRect, QSize, QModelIndex, QTimer
 from Qt.QtWidgets import QApplication, QSizePolicy, QTreeWidget, QTreeWidgetItem, QAbstractItemView, QStyleOption
 from Qt.QtWidgets import QWhatsThis
 from Qt.QtGui import QColor, QPalette, QPen, QBrush, QPainter
@@ -25,6 +25,7 @@ class TreeWidget(QTreeWidget, object):
 
     ITEM_WIDGET = QTreeWidgetItem
     ITEM_WIDGET_SIZE = None
+    FILTER_DELAY = 150
 
     def __init__(self, parent=None):
         super(TreeWidget, self).__init__(parent)
@@ -39,6 +40,11 @@ class TreeWidget(QTreeWidget, object):
         self._last_item = None
         self._drop_indicator_rect = QRect()
         self._name_filter = None
+        self._filter_index = None
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY)
+        self._filter_timer.timeout.connect(self._on_filter_timeout)
 
         self.setIndentation(25)
         self.setExpandsOnDoubleClick(False)
@@ -59,6 +65,10 @@ class TreeWidget(QTreeWidget, object):
         self.itemExpanded.connect(self._on_item_expanded)
         self.itemCollapsed.connect(self._on_item_collapsed)
 
+        model = self.model()
+        for model_signal in (model.rowsInserted, model.rowsRemoved, model.rowsMoved, model.modelReset):
+            model_signal.connect(self._on_tree_structure_changed)
+
     # ============================================================================================================
     # PROPERTIES
     # ============================================================================================================
@@ -192,22 +202,49 @@ class TreeWidget(QTreeWidget, object):
 
     def filter_names(self, filter_text):
         """
-        Hides all tree items with the given text
+        Hides all tree items, at any depth, whose text does not contain the given text
+        Ancestors and descendants of matching items are kept visible. If the filter text contains "/", it is matched
+        against the path of the items ("parent/parent/item") instead of their text
         :param filter_text: str, text used to filter tree items
         """
 
-        self._name_filter = filter_text.strip(' ')
+        self._filter_timer.stop()
+        self._name_filter = str(filter_text).strip(' ')
 
-        self.unhide_items()
+        entries = self._get_filter_index()
+        if not entries:
+            return
 
-        for i in range(self.topLevelItemCount()):
-            item = self.topLevelItem(i)
-            text = str(item.text(self._title_text_index))
-            filter_text = str(filter_text).strip(' ')
+        filter_text = self._name_filter
+        match_path = '/' in filter_text
+        visible = [not filter_text] * len(entries)
+        if filter_text:
+            for i, (item, parent_index, text, item_path) in enumerate(entries):
+                match = (item_path if match_path else text).find(filter_text) != -1
+                visible[i] = match or (parent_index != -1 and visible[parent_index])
+            for i in range(len(entries) - 1, -1, -1):
+                parent_index = entries[i][1]
+                if visible[i] and parent_index != -1:
+                    visible[parent_index] = True
+
+        # Only items whose visibility flips are updated
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            for (item, _, _, _), item_visible in zip(entries, visible):
+                if item.isHidden() == item_visible:
+                    item.setHidden(not item_visible)
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+
+    def filter_names_deferred(self, filter_text):
+        """
+        Filters tree items with the given text once the text stops changing for FILTER_DELAY milliseconds
+        :param filter_text: str, text used to filter tree items
+        """
 
-            # If the filter text is not found on the item text, we hide the item
-            if text.find(filter_text) == -1:
-                self.setItemHidden(item, True)
+        self._name_filter = str(filter_text).strip(' ')
+        self._filter_timer.start()
 
     def get_tree_item_name(self, tree_item):
         """
@@ -602,6 +639,41 @@ class TreeWidget(QTreeWidget, object):
 
         return items
 
+    def _get_filter_index(self):
+        """
+        Internal function that returns the items indexed for filtering, building the index if necessary
+        Entries are stored in pre-order, so parents are always located before their children
+        :return: list(tuple(QTreeWidgetItem, int, str, str)), item, index of its parent entry (-1 for top level
+            items), item text and item path
+        """
+
+        if self._filter_index is not None:
+            return self._filter_index
+
+        entries = list()
+        stack = [(self.topLevelItem(i), -1, '') for i in range(self.topLevelItemCount() - 1, -1, -1)]
+        while stack:
+            item, parent_index, parent_path = stack.pop()
+            text = str(item.text(self._title_text_index))
+            item_path = '{}/{}'.format(parent_path, text) if parent_path else text
+            entry_index = len(entries)
+            entries.append((item, parent_index, text, item_path))
+            for i in range(item.childCount() - 1, -1, -1):
+                stack.append((item.child(i), entry_index, item_path))
+        self._filter_index = entries
+
+        return entries
+
+    def _invalidate_filter_index(self):
+        """
+        Internal function that discards filter index. If a name filter is active, it is applied again once the control
+        returns to the event loop
+        """
+
+        self._filter_index = None
+        if self._name_filter:
+            self._filter_timer.start()
+
     def _add_sub_items(self, tree_item):
         """
         Internal function that is updates the hiearchy of the given QTreeWidgetItem
@@ -632,6 +704,20 @@ class TreeWidget(QTreeWidget, object):
     # CALLBACKS
     # ============================================================================================================
 
+    def _on_filter_timeout(self):
+        """
+        Internal callback function that is called when deferred name filter must be applied
+        """
+
+        self.filter_names(self._name_filter or '')
+
+    def _on_tree_structure_changed(self, *args):
+        """
+        Internal callback function that is called when items are added, removed or moved in the tree
+        """
+
+        self._invalidate_filter_index()
+
     def _on_item_expanded(self, item):
         """
         Internal function that is called anytime the user expands an item of the tree
@@ -669,6 +755,8 @@ class TreeWidget(QTreeWidget, object):
         :param previous_item: QTreeWidgetItem
         """
 
+        self._invalidate_filter_index()
+
         if self._edit_state:
             self._edit_finish(previous_item)
 
@@ -858,7 +946,7 @@ class FilterTreeWidget(base.DirectoryWidget, object):
         """
 
         if self._update_tree:
-            self._tree_widget.filter_names(text)
+            self._tree_widget.filter_names_deferred(text)
 
     def _on_sub_path_filter_changed(self):
         """
@@ -878,7 +966,7 @@ class FilterTreeWidget(base.DirectoryWidget, object):
             self.set_directory(self._directory)
             if self._update_tree:
                 self._tree_widget.set_directory(self._directory)
-            text = self._filter_names.text
+            text = self._filter_names.text()
             self._on_filter_names(text)
             return
 
@@ -889,7 +977,7 @@ class FilterTreeWidget(base.DirectoryWidget, object):
         if path.is_dir(sub_dir):
             if self._update_tree:
                 self._tree_widget.set_directory(self._directory)
-            text = self._filter_names.text
+            text = self._filter_names.text()
             self._on_filter_names(text)
 
         if self._emit_changes:
@@ -48,6 +48,22 @@ class ListView(BaseListView, object):
 
         if self.model():
             self.model().appendItem(item)
+
+    def selected_rows(self):
+        """
+        Returns the selected row numbers, under the view root index, without building the selected indexes
+        :return: list<int>
+        """
+
+        return models.ItemSelection(self.selectionModel().selection()).rows(parent=self.rootIndex())
+
+    def selected_count(self):
+        """
+        Returns the number of selected indexes without building them
+        :return: int
+        """
+
+        return models.ItemSelection(self.selectionModel().selection()).index_count()
     # endregion
 
     # region Override Functions
@@ -60,8 +76,10 @@ class ListView(BaseListView, object):
             See ItemSelection for more information.
         """
 
-        self.current_selection_changed.emit(models.ItemSelection(selected), models.ItemSelection(deselected))
-        super(ListView, self).selectionChanged(models.ItemSelection(selected), models.ItemSelection(deselected))
+        selected = models.ItemSelection(selected)
+        deselected = models.ItemSelection(deselected)
+        self.current_selection_changed.emit(selected, deselected)
+        super(ListView, self).selectionChanged(selected, deselected)
 
     def selectedIndexes(self):
         """
@@ -215,15 +233,76 @@ class BaseTreeView(QTreeView, object):
     def __init__(self, parent=None):
         super(BaseTreeView, self).__init__(parent=parent)
 
-    def expand_tree(self, root_node):
+    def expand_tree(self, root_node, depth=None, lazy=False):
         """
         Expands all the collapsed elements in a tree starting at the rootNode
-        :param root_node: Start node from which we start expanding the tree
+        Indexes to expand are collected first and expanded in a single batch: a delayed items layout is scheduled
+        before expanding them, so the view only stores the expanded indexes and performs a single relayout at the end
+        :param root_node: Start node (or QModelIndex) from which we start expanding the tree
+        :param depth: int or None, maximum number of levels below the start node to expand. None expands all levels
+        :param lazy: bool, If True, only nodes already fetched by the model are expanded and fetchMore is never
+            called. Otherwise, nodes that can fetch more children are fetched before expanding them
+        """
+
+        model = self.model()
+        if not model:
+            return
+
+        root_index = root_node if isinstance(root_node, QModelIndex) else self._node_index(root_node)
+
+        indexes = self._collect_expandable_indexes(root_index, depth=depth, lazy=lazy)
+        if not indexes:
+            return
+
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.scheduleDelayedItemsLayout()
+            for index in indexes:
+                self.setExpanded(index, True)
+            self.executeDelayedItemsLayout()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+
+    def _node_index(self, node):
+        """
+        Internal function that returns the model index of the given tree node
+        :param node: Node
+        :return: QModelIndex
         """
 
-        parent = root_node.parent()
+        parent = node.parent()
         parent_id = self.model().createIndex(parent.row(), 0, parent) if parent else QModelIndex()
-        index = self.model().index(root_node.row(), 0, parent_id)
-        self.setExpanded(index, True)
-        for child in root_node.children:
-            self.expand_tree(child)
+
+        return self.model().index(node.row(), 0, parent_id)
+
+    def _collect_expandable_indexes(self, root_index, depth=None, lazy=False):
+        """
+        Internal function that returns the indexes, with children, located below the given index
+        Hierarchy is traversed iteratively, so deep trees do not reach Python recursion limit. In lazy mode, indexes
+        that still can fetch more children are skipped
+        :param root_index: QModelIndex
+        :param depth: int or None
+        :param lazy: bool
+        :return: list(QModelIndex)
+        """
+
+        model = self.model()
+        indexes = list()
+        stack = [(root_index, 0)]
+        while stack:
+            index, level = stack.pop()
+            if model.canFetchMore(index):
+                if lazy:
+                    continue
+                model.fetchMore(index)
+            if index.isValid():
+                indexes.append(index)
+            if depth is not None and level >= depth:
+                continue
+            for row in range(model.rowCount(index) - 1, -1, -1):
+                child = model.index(row, 0, index)
+                if model.hasChildren(child):
+                    stack.append((child, level + 1))
+
+        return indexes
@@ -22,7 +22,7 @@ from tpDcc import dcc
 from tpDcc.managers import resources
 from tpDcc.libs.python import path, folder
 from tpDcc.libs.resources.core import theme
-from tpDcc.libs.qt.core import qtutils, animation, statusbar, dragger, resizers
+from tpDcc.libs.qt.core import qtutils, animation, statusbar, dragger, resizers, profiling
 from tpDcc.libs.qt.core import settings as qt_settings
 from tpDcc.libs.qt.widgets import layouts
 
@@ -468,9 +468,10 @@ class BaseWindow(QMainWindow, object):
         if not settings:
             return
 
-        settings.setw('geometry', self.saveGeometry())
-        settings.setw('saveState', self.saveState())
-        settings.setw('windowState', self.saveState())
+        with settings.batch():
+            settings.setw('geometry', self.saveGeometry())
+            settings.setw('saveState', self.saveState())
+            settings.setw('windowState', self.saveState())
 
         return settings
 
@@ -594,9 +595,10 @@ class BaseWindow(QMainWindow, object):
         current_theme = self.theme()
         if not current_theme:
             return
-        current_theme.set_dpi(self.dpi())
-        stylesheet = current_theme.stylesheet()
-        self.setStyleSheet(stylesheet)
+        with profiling.span('{}.reload_stylesheet'.format(self.__class__.__name__), category='theme'):
+            current_theme.set_dpi(self.dpi())
+            stylesheet = current_theme.stylesheet()
+            self.setStyleSheet(stylesheet)
         self.styleReloaded.emit(current_theme)
 
     # ============================================================================================================
@@ -756,9 +758,8 @@ class MainWindow(BaseWindow, object):
 
         self.windowReady.connect(lambda: setattr(self, '_window_loaded', True))
 
-        app = QApplication.instance()
-        if app:
-            app.focusChanged.connect(self._on_change_focus)
+        self._focus_tracked = False
+        self._set_focus_tracking_enabled(bool(self._toolset))
 
     # ============================================================================================================
     # PROPERTIES
@@ -815,12 +816,14 @@ class MainWindow(BaseWindow, object):
             self._current_docked = self.docked()
             self.dockChanged.emit(self._current_docked)
 
+        self._set_focus_tracking_enabled(bool(self._toolset))
         self._on_change_focus(None, self)
 
         super(MainWindow, self).showEvent(event)
 
     def closeEvent(self, event):
         self._window_closed = True
+        self._set_focus_tracking_enabled(False)
         self.unregister_callbacks()
         self.clear_window_instance(self.WindowId)
         super(MainWindow, self).closeEvent(event)
@@ -1256,6 +1259,29 @@ class MainWindow(BaseWindow, object):
     #
     #     self.load_theme()
 
+    def _set_focus_tracking_enabled(self, flag):
+        """
+        Internal function that connects or disconnects the window from application focus changes
+        Only windows with a toolset need to track focus, so other windows are never notified
+        :param flag: bool
+        """
+
+        if flag == self._focus_tracked:
+            return
+
+        app = QApplication.instance()
+        if not app:
+            return
+
+        if flag:
+            app.focusChanged.connect(self._on_change_focus)
+        else:
+            try:
+                app.focusChanged.disconnect(self._on_change_focus)
+            except (RuntimeError, TypeError):
+                pass
+        self._focus_tracked = flag
+
     # ============================================================================================================
     # CALLBACKS
     # ============================================================================================================
@@ -1271,8 +1297,7 @@ class MainWindow(BaseWindow, object):
         if not self._toolset or not self._toolset.client:
             return
 
-        children = self.findChildren(QWidget)
-        if old and dcc._CLIENTS and (old == self or old in children):
+        if old and dcc._CLIENTS and qtutils.is_descendant_of(old, self):
             if self._toolset:
                 toolset_client = self._toolset.client
                 toolset_found = None
@@ -1285,7 +1310,7 @@ class MainWindow(BaseWindow, object):
                 if toolset_found is not None and len(list(dcc._CLIENTS.keys())) > 1:
                     dcc._CLIENTS.pop(client_id)
 
-        if new and (new == self or new in children):
+        if new and qtutils.is_descendant_of(new, self):
             if self._toolset:
                 toolset_client = self._toolset.client
                 toolset_found = False